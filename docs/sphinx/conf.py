@@ -58,6 +58,7 @@
     "../../python_modules/libraries/dagster-gcp-pandas",
     "../../python_modules/libraries/dagster-gcp-pyspark",
     "../../python_modules/libraries/dagster-pyspark",
+    "../../python_modules/libraries/dagster-pyarrow",
     "../../python_modules/libraries/dagster-databricks",
     "../../python_modules/libraries/dagster-duckdb",
     "../../python_modules/libraries/dagster-duckdb-pandas",
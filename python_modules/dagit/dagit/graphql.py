@@ -1,7 +1,23 @@
+import asyncio
+import contextvars
+import functools
+import os
 from abc import ABC, abstractmethod
 from asyncio import Task, get_event_loop
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster._serdes import pack_value
@@ -9,8 +25,9 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster_graphql.implementation.utils import ErrorCapture
 from graphene import Schema
-from graphql import GraphQLError, GraphQLFormattedError
-from graphql.execution import ExecutionResult
+from graphql import FieldNode, GraphQLError, GraphQLFormattedError, GraphQLObjectType
+from graphql.execution import ExecutionContext, ExecutionResult
+from graphql.pyutils import AwaitableOrValue, Path, Undefined
 from starlette import status
 from starlette.applications import Starlette
 from starlette.concurrency import run_in_threadpool
@@ -40,6 +57,117 @@ class GraphQLWS(str, Enum):
     STOP = "stop"
 
 
+def is_async_execution_enabled() -> bool:
+    """Whether GraphQL requests are executed on the event loop, with their root fields resolved on
+    a bounded thread pool, instead of each request being executed synchronously on its own thread.
+    """
+    return os.getenv("DAGIT_ASYNC_GRAPHQL_EXECUTION", "").lower() in ("1", "true")
+
+
+def get_max_resolver_workers() -> int:
+    """Threads that resolve root fields in async execution mode. With fewer threads, fast requests
+    queue behind slow ones, such as asset node queries on large graphs.
+    """
+    return int(os.getenv("DAGIT_GRAPHQL_MAX_RESOLVER_WORKERS", "20"))
+
+
+def get_request_timeout() -> Optional[float]:
+    """Seconds after which a GraphQL request is abandoned in async execution mode."""
+    timeout = float(os.getenv("DAGIT_GRAPHQL_REQUEST_TIMEOUT", "0"))
+    return timeout if timeout > 0 else None
+
+
+class RootFieldThreadPoolExecutionContext(ExecutionContext):
+    """Executes each root field of a request on a thread pool, so that resolvers that block on
+    storage don't block the event loop.
+
+    The root fields of a query are awaited concurrently, bounded by the size of the pool, and the
+    root fields of a mutation one after another. Everything below a root field is resolved
+    synchronously on the thread of that root field, since moving each nested resolver to a thread
+    costs more than it saves on list-heavy queries.
+    """
+
+    executor: ThreadPoolExecutor
+
+    @classmethod
+    def for_executor(
+        cls, executor: ThreadPoolExecutor
+    ) -> Type["RootFieldThreadPoolExecutionContext"]:
+        return cast(
+            Type[RootFieldThreadPoolExecutionContext],
+            type(cls.__name__, (cls,), {"executor": executor}),
+        )
+
+    def execute_fields(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Optional[Path],
+        fields: Dict[str, List[FieldNode]],
+    ) -> AwaitableOrValue[Dict[str, Any]]:
+        if path is not None:
+            return super().execute_fields(parent_type, source_value, path, fields)
+
+        async def get_results() -> Dict[str, Any]:
+            results = await asyncio.gather(
+                *(
+                    self._execute_root_field(parent_type, source_value, response_name, field_nodes)
+                    for response_name, field_nodes in fields.items()
+                )
+            )
+            return {
+                response_name: result
+                for response_name, result in zip(fields, results)
+                if result is not Undefined
+            }
+
+        return get_results()
+
+    def execute_fields_serially(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Optional[Path],
+        fields: Dict[str, List[FieldNode]],
+    ) -> AwaitableOrValue[Dict[str, Any]]:
+        async def get_results() -> Dict[str, Any]:
+            results = {}
+            for response_name, field_nodes in fields.items():
+                result = await self._execute_root_field(
+                    parent_type, source_value, response_name, field_nodes
+                )
+                if result is not Undefined:
+                    results[response_name] = result
+            return results
+
+        return get_results()
+
+    async def _execute_root_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        response_name: str,
+        field_nodes: List[FieldNode],
+    ) -> Any:
+        path = Path(None, response_name, parent_type.name)
+        if field_nodes[0].name.value.startswith("__"):
+            # meta fields such as __typename don't touch storage, so they are resolved in place
+            return self.execute_field(parent_type, source_value, field_nodes, path)
+
+        # resolvers rely on context vars, such as the ErrorCapture observer of the request
+        context = contextvars.copy_context()
+        result = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(
+                context.run, self.execute_field, parent_type, source_value, field_nodes, path
+            ),
+        )
+        if self.is_awaitable(result):
+            # a nested resolver was async, so the rest of the field is resolved on the loop
+            result = await result
+        return result
+
+
 class GraphQLServer(ABC):
     def __init__(self, app_path_prefix: str = ""):
         self._app_path_prefix = app_path_prefix
@@ -47,6 +175,15 @@ def __init__(self, app_path_prefix: str = ""):
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
 
+        self._async_execution = is_async_execution_enabled()
+        if self._async_execution:
+            executor = ThreadPoolExecutor(
+                max_workers=get_max_resolver_workers(), thread_name_prefix="dagit_graphql_resolver"
+            )
+            self._async_execution_context_class = RootFieldThreadPoolExecutionContext.for_executor(
+                executor
+            )
+
     @abstractmethod
     def build_graphql_schema(self) -> Schema:
         ...
@@ -225,6 +362,11 @@ async def execute_graphql_request(
         variables: Optional[Dict[str, Any]],
         operation_name: Optional[str],
     ) -> ExecutionResult:
+        if self._async_execution:
+            return await self._execute_graphql_request_async(
+                request, query, variables, operation_name
+            )
+
         # use run_in_threadpool since underlying schema is sync
         return await run_in_threadpool(
             self._graphql_schema.execute,
@@ -235,6 +377,38 @@ async def execute_graphql_request(
             middleware=self._graphql_middleware,
         )
 
+    async def _execute_graphql_request_async(
+        self,
+        request: Request,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> ExecutionResult:
+        timeout = get_request_timeout()
+        try:
+            return await asyncio.wait_for(
+                self._graphql_schema.execute_async(
+                    query,
+                    variables=variables,
+                    operation_name=operation_name,
+                    context=self.make_request_context(request),
+                    middleware=self._graphql_middleware,
+                    execution_context_class=self._async_execution_context_class,
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError as error:
+            # resolvers that are already running finish on their threads, but no new ones start
+            return ExecutionResult(
+                data=None,
+                errors=[
+                    GraphQLError(
+                        f"GraphQL request did not complete within {timeout} seconds",
+                        original_error=error,
+                    )
+                ],
+            )
+
     async def execute_graphql_subscription(
         self,
         websocket: WebSocket,
@@ -0,0 +1,100 @@
+"""Measures GraphQL request latency of a running Dagit under concurrent users.
+
+Each user sends the queries below in a loop, and the latency percentiles of each query are printed
+once every user is done. To compare the execution modes, run Dagit against the same instance with
+and without DAGIT_ASYNC_GRAPHQL_EXECUTION=1 and run:
+
+    python -m dagit_tests.stress.graphql_load_test --url http://localhost:3000/graphql --users 20
+"""
+import argparse
+import json
+import time
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Sequence
+
+QUERIES: Mapping[str, str] = {
+    "runs": """
+        query RunsQuery {
+            runsOrError(limit: 50) {
+                ... on Runs {
+                    results { runId status pipelineName startTime endTime tags { key value } }
+                }
+            }
+        }
+    """,
+    "runs_with_tag_filter": """
+        query FilteredRunsQuery {
+            runsOrError(limit: 50, filter: {tags: [{key: "dagster/backfill", value: "none"}]}) {
+                ... on Runs {
+                    results { runId status pipelineName startTime endTime }
+                }
+            }
+        }
+    """,
+    "asset_nodes": """
+        query AssetNodesQuery {
+            assetNodes {
+                id
+                assetKey { path }
+                computeKind
+                assetMaterializations(limit: 1) { timestamp }
+            }
+        }
+    """,
+    "typename": "{ __typename }",
+}
+
+
+def _send_query(url: str, query: str) -> float:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps({"query": query}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    with urllib.request.urlopen(request) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def _run_user(url: str, num_requests: int) -> Dict[str, List[float]]:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(num_requests):
+        for name, query in QUERIES.items():
+            latencies[name].append(_send_query(url, query))
+    return latencies
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:3000/graphql")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=20, help="Requests per user and query")
+    args = parser.parse_args()
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=args.users) as executor:
+        futures = [
+            executor.submit(_run_user, args.url, args.requests) for _ in range(args.users)
+        ]
+        for future in futures:
+            for name, values in future.result().items():
+                latencies[name].extend(values)
+
+    print(f"{'query':<24}{'p50 (ms)':>12}{'p95 (ms)':>12}{'p99 (ms)':>12}")  # noqa: T201
+    for name, values in latencies.items():
+        print(  # noqa: T201
+            f"{name:<24}"
+            + "".join(f"{_percentile(values, p) * 1000:>12.1f}" for p in (0.5, 0.95, 0.99))
+        )
+
+
+if __name__ == "__main__":
+    main()
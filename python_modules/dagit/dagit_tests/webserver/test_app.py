@@ -3,12 +3,13 @@
 import objgraph
 from dagit.graphql import GraphQLWS
 from dagit.version import __version__ as dagit_version
-from dagit.webserver import ROOT_ADDRESS_STATIC_RESOURCES
+from dagit.webserver import ROOT_ADDRESS_STATIC_RESOURCES, DagitWebserver
 from dagster import (
     __version__ as dagster_version,
     job,
     op,
 )
+from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
 from dagster._core.events import DagsterEventType
 from dagster._serdes import unpack_value
 from dagster._seven import json
@@ -193,6 +194,42 @@ def test_graphql_error(test_client: TestClient):
     assert isinstance(original_err, SerializableErrorInfo)
 
 
+def test_graphql_async_execution(instance, monkeypatch):
+    monkeypatch.setenv("DAGIT_ASYNC_GRAPHQL_EXECUTION", "1")
+    process_context = get_workspace_process_context_from_kwargs(
+        instance=instance,
+        version=dagster_version,
+        read_only=False,
+        kwargs={"empty_workspace": True},
+    )
+    test_client = TestClient(DagitWebserver(process_context).create_asgi_app(debug=True))
+
+    run_id = _add_run(instance)
+    response = test_client.post(
+        "/graphql",
+        json={"query": RUN_QUERY, "variables": {"runId": run_id}},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"pipelineRunOrError": {"__typename": "Run", "id": run_id}}}
+
+    # root fields are resolved concurrently, and keep the order of the query
+    response = test_client.post("/graphql", params={"query": "{ version __typename }"})
+    assert response.status_code == 200, response.text
+    assert list(response.json()["data"].items()) == [
+        ("version", dagster_version),
+        ("__typename", "DagitQuery"),
+    ]
+
+    # exceptions raised on resolver threads are reported along with their error info
+    response = test_client.post(
+        "/graphql",
+        params={"query": "{test{alwaysException}}"},
+    )
+    assert response.status_code == 500, response.text
+    error = response.json()["errors"][0]
+    assert isinstance(unpack_value(error["extensions"]["errorInfo"]), SerializableErrorInfo)
+
+
 def test_graphql_ws_error(test_client: TestClient):
     # wtf pylint
 
@@ -1,15 +1,17 @@
 import asyncio
 import os
 import sys
-from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Sequence, Tuple, Union
 
 # re-exports
 import dagster._check as check
 from dagster._core.definitions.events import AssetKey
 from dagster._core.events import EngineEventData
+from dagster._core.events.log import EventLogEntry
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.captured_log_manager import CapturedLogManager
+from dagster._core.storage.captured_log_manager import CapturedLogData, CapturedLogManager
 from dagster._core.storage.compute_log_manager import ComputeIOType, ComputeLogFileData
+from dagster._core.storage.event_log.base import EventLogConnection, EventLogCursor
 from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -20,6 +22,7 @@
 if TYPE_CHECKING:
     from dagster_graphql.schema.roots.mutation import GrapheneTerminateRunPolicy
 
+from ..resolver_cache import get_resolver_caches
 from ..utils import (
     assert_permission,
     assert_permission_for_location,
@@ -30,6 +33,13 @@
     create_and_launch_partition_backfill as create_and_launch_partition_backfill,
     resume_partition_backfill as resume_partition_backfill,
 )
+from .subscription_multiplexer import (
+    SubscriberBuffer,
+    get_captured_log_multiplexer,
+    get_max_pending_updates,
+    get_run_event_multiplexer,
+    merge_captured_log_data,
+)
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.logs.compute_logs import (
@@ -216,17 +226,8 @@ async def gen_events_for_run(
         dont_send_past_records = True
         after_cursor = None
 
-    chunk_size = get_chunk_size()
     # load the existing events in chunks
-    has_more = True
-    while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
-            run_id=run_id,
-            cursor=after_cursor,
-            limit=chunk_size,
-        )
+    async for connection in _gen_run_event_connections(instance, run_id, after_cursor):
         if not dont_send_past_records:
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
@@ -237,28 +238,86 @@ async def gen_events_for_run(
                 hasMorePastEvents=connection.has_more,
                 cursor=connection.cursor,
             )
-        has_more = connection.has_more
         after_cursor = connection.cursor
 
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[Tuple[Any, Any]] = asyncio.Queue()
-
-    def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
-
-    # watch for live events
-    instance.watch_event_logs(run_id, after_cursor, _enqueue)
+    # watch for live events, sharing the watch on the run with the other subscribers to it
+    multiplexer = get_run_event_multiplexer(instance)
+    subscriber: SubscriberBuffer[Tuple[EventLogEntry, str]] = SubscriberBuffer(
+        max_pending=get_max_pending_updates()
+    )
+    multiplexer.subscribe(instance, run_id, after_cursor, subscriber)
     try:
+        # events that were stored before the subscription started are read from storage. This
+        # also happens whenever the subscriber falls too far behind the live events.
+        needs_catch_up = True
         while True:
-            event, cursor = await queue.get()
+            if needs_catch_up:
+                async for connection in _gen_run_event_connections(instance, run_id, after_cursor):
+                    if connection.records:
+                        yield GraphenePipelineRunLogsSubscriptionSuccess(
+                            run=GrapheneRun(record),
+                            messages=[
+                                from_event_record(record.event_log_entry, run.pipeline_name)
+                                for record in connection.records
+                            ],
+                            hasMorePastEvents=connection.has_more,
+                            cursor=connection.cursor,
+                        )
+                    after_cursor = connection.cursor
+
+            events, needs_catch_up = await subscriber.get_batch()
+            if needs_catch_up:
+                continue
+
+            # skip the events that have already been sent
+            after_storage_id = _get_cursor_storage_id(after_cursor)
+            events = [
+                (event, cursor)
+                for event, cursor in events
+                if after_storage_id is None
+                or EventLogCursor.parse(cursor).storage_id() > after_storage_id
+            ]
+            if not events:
+                continue
+
+            after_cursor = events[-1][1]
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
-                messages=[from_event_record(event, run.pipeline_name)],
+                messages=[from_event_record(event, run.pipeline_name) for event, _ in events],
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=after_cursor,
             )
     finally:
-        instance.end_watch_event_logs(run_id, _enqueue)
+        multiplexer.unsubscribe(instance, run_id, subscriber)
+
+
+def _get_cursor_storage_id(cursor: Optional[str]) -> Optional[int]:
+    """Returns the storage id of an event log cursor, or None if there is no cursor or if it is a
+    legacy offset cursor, which reading a run's events returns unchanged when it finds no new
+    events.
+    """
+    if not cursor:
+        return None
+    event_log_cursor = EventLogCursor.parse(cursor)
+    return event_log_cursor.storage_id() if event_log_cursor.is_id_cursor() else None
+
+
+async def _gen_run_event_connections(
+    instance: DagsterInstance, run_id: str, cursor: Optional[str]
+) -> AsyncIterator[EventLogConnection]:
+    chunk_size = get_chunk_size()
+    has_more = True
+    while has_more:
+        # run the fetch in a thread since its sync
+        connection = await run_in_threadpool(
+            instance.get_records_for_run,
+            run_id=run_id,
+            cursor=cursor,
+            limit=chunk_size,
+        )
+        yield connection
+        has_more = connection.has_more
+        cursor = connection.cursor
 
 
 async def gen_compute_logs(
@@ -306,23 +365,23 @@ async def gen_captured_log_data(
     if not isinstance(compute_log_manager, CapturedLogManager):
         return
 
-    subscription = compute_log_manager.subscribe(log_key, cursor)
-
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[ComputeLogFileData] = asyncio.Queue()
-
-    def _enqueue(new_event):
-        loop.call_soon_threadsafe(queue.put_nowait, new_event)
-
-    subscription(_enqueue)
+    # share the subscription to the log key with the other subscribers to it
+    multiplexer = get_captured_log_multiplexer(compute_log_manager)
+    # chunks of log data are contiguous, so the chunks that are buffered while the client is busy
+    # are merged into a single message instead of being dropped
+    subscriber: SubscriberBuffer[CapturedLogData] = SubscriberBuffer(max_pending=None)
+    # subscribing reads the log data that the subscriber has missed, so it runs in a thread
+    watch = await run_in_threadpool(
+        multiplexer.subscribe, compute_log_manager, log_key, cursor, subscriber
+    )
     is_complete = False
     try:
         while not is_complete:
-            update = await queue.get()
-            yield from_captured_log_data(update)  # type: ignore
-            is_complete = subscription.is_complete
+            updates, _ = await subscriber.get_batch()
+            yield from_captured_log_data(merge_captured_log_data(updates))  # type: ignore
+            is_complete = watch.is_complete
     finally:
-        subscription.dispose()
+        multiplexer.unsubscribe(watch, subscriber)
 
 
 @capture_error
@@ -333,4 +392,6 @@ def wipe_assets(
 
     instance = graphene_info.context.instance
     instance.wipe_assets(asset_keys)
+    # wiping removes events without storing new ones, so stale statuses must be resolved again
+    get_resolver_caches(instance).stale_status_resolvers.clear()
     return GrapheneAssetWipeSuccess(assetKeys=asset_keys)
@@ -0,0 +1,360 @@
+"""Shares the storage watches behind Dagit's run event and captured log subscriptions.
+
+Every websocket client that subscribes to the events of a run, or to the captured logs of a log
+key, used to start its own watch on the underlying storage. Here, the clients in a process that
+subscribe to the same run or log key share a single watch, whose updates are fanned out to a
+per-client buffer. Each client drains its buffer in batches, so that updates that arrive close
+together, or while the client is still sending an earlier message, are sent as a single message.
+"""
+import asyncio
+import json
+import os
+import threading
+import weakref
+from typing import (
+    Dict,
+    Generic,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.captured_log_manager import (
+    MAX_BYTES_CHUNK_READ,
+    CapturedLogData,
+    CapturedLogManager,
+    CapturedLogSubscription,
+)
+
+T = TypeVar("T")
+
+
+def get_coalesce_interval() -> float:
+    """Seconds that a client waits after an update arrives, so that the updates that follow it
+    closely can be sent in the same message.
+    """
+    return float(os.getenv("DAGIT_SUBSCRIPTION_COALESCE_INTERVAL", "0.1"))
+
+
+def get_max_pending_updates() -> int:
+    """Updates that are buffered for a client before it is considered to have fallen behind."""
+    return int(os.getenv("DAGIT_SUBSCRIPTION_MAX_PENDING_UPDATES", "10000"))
+
+
+class SubscriberBuffer(Generic[T]):
+    """Buffers the updates of a shared watch for a single client.
+
+    Updates are put from the thread that watches the storage and are taken in batches on the event
+    loop of the client. If max_pending is set, at most that many updates are buffered: past that,
+    the buffered updates are dropped and the next batch is marked as having fallen behind, so that
+    the client can catch up by reading from storage instead of the process holding an unbounded
+    backlog for it.
+    """
+
+    def __init__(self, max_pending: Optional[int]):
+        self._loop = asyncio.get_event_loop()
+        self._lock = threading.Lock()
+        self._has_updates = asyncio.Event()
+        self._pending: List[T] = []
+        self._fell_behind = False
+        self._max_pending = max_pending
+
+    def put(self, update: T) -> None:
+        with self._lock:
+            if self._fell_behind:
+                return
+            was_empty = not self._pending
+            if self._max_pending is not None and len(self._pending) >= self._max_pending:
+                self._pending = []
+                self._fell_behind = True
+            else:
+                self._pending.append(update)
+
+        if was_empty:
+            self._loop.call_soon_threadsafe(self._has_updates.set)
+
+    async def get_batch(self, coalesce_interval: Optional[float] = None) -> Tuple[List[T], bool]:
+        """Waits for updates, returning the buffered updates and whether any were dropped."""
+        coalesce_interval = (
+            coalesce_interval if coalesce_interval is not None else get_coalesce_interval()
+        )
+        while True:
+            await self._has_updates.wait()
+            if coalesce_interval > 0:
+                await asyncio.sleep(coalesce_interval)
+
+            with self._lock:
+                updates, fell_behind = self._pending, self._fell_behind
+                self._pending = []
+                self._fell_behind = False
+                self._has_updates.clear()
+
+            # the event can be set after the updates that set it have already been taken
+            if updates or fell_behind:
+                return updates, fell_behind
+
+
+class _RunEventWatch:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.subscribers: List[SubscriberBuffer[Tuple[EventLogEntry, str]]] = []
+
+    def __call__(self, event: EventLogEntry, cursor: str) -> None:
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            subscriber.put((event, cursor))
+
+
+class RunEventWatchMultiplexer:
+    """Watches the event log of each run at most once, fanning the new events out to every
+    subscriber of the run.
+
+    The watch is started from the cursor of the first subscriber and ended along with the last
+    subscription. Subscribers that join a watch later may have missed or may receive events around
+    their own cursor, and are expected to read from storage after subscribing and to filter out
+    the events they have already seen.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._watches: Dict[str, _RunEventWatch] = {}
+
+    def subscribe(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        cursor: Optional[str],
+        subscriber: SubscriberBuffer[Tuple[EventLogEntry, str]],
+    ) -> None:
+        with self._lock:
+            watch = self._watches.get(run_id)
+            if watch:
+                with watch.lock:
+                    watch.subscribers.append(subscriber)
+                return
+
+            watch = _RunEventWatch()
+            watch.subscribers.append(subscriber)
+            self._watches[run_id] = watch
+            instance.watch_event_logs(run_id, cursor, watch)
+
+    def unsubscribe(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        subscriber: SubscriberBuffer[Tuple[EventLogEntry, str]],
+    ) -> None:
+        with self._lock:
+            watch = self._watches.get(run_id)
+            if not watch:
+                return
+            with watch.lock:
+                if subscriber in watch.subscribers:
+                    watch.subscribers.remove(subscriber)
+                if watch.subscribers:
+                    return
+            del self._watches[run_id]
+            instance.end_watch_event_logs(run_id, watch)
+
+    def num_watches(self) -> int:
+        with self._lock:
+            return len(self._watches)
+
+
+class _CapturedLogWatch:
+    def __init__(
+        self, manager: CapturedLogManager, log_key: Sequence[str], cursor: Optional[str]
+    ):
+        self.manager = manager
+        self.log_key = log_key
+        self.lock = threading.Lock()
+        # the cursor that each subscriber has been sent data up to
+        self.cursor_by_subscriber: Dict[SubscriberBuffer[CapturedLogData], Optional[str]] = {}
+        # subscribers that are reading from their own cursor, which the watch skips
+        self.catching_up: Set[SubscriberBuffer[CapturedLogData]] = set()
+        self.cursor = cursor
+        # incremented whenever the watch fans out data, so that a subscriber that was catching up
+        # can tell whether it needs to read again
+        self.num_updates = 0
+        self.subscription: Optional[CapturedLogSubscription] = None
+
+    @property
+    def is_complete(self) -> bool:
+        return bool(self.subscription and self.subscription.is_complete)
+
+    def start(self) -> None:
+        self.subscription = self.manager.subscribe(self.log_key, self.cursor)
+        self.subscription(self._on_log_data)
+
+    def dispose(self) -> None:
+        if self.subscription:
+            self.subscription.dispose()
+
+    def add_subscriber(
+        self, subscriber: SubscriberBuffer[CapturedLogData], cursor: Optional[str]
+    ) -> None:
+        with self.lock:
+            self.cursor_by_subscriber[subscriber] = cursor
+            # data that the watch has already fanned out is read again for the new subscriber
+            needs_catch_up = bool(self.subscription) and cursor != self.cursor
+            if needs_catch_up:
+                self.catching_up.add(subscriber)
+        if needs_catch_up:
+            self._catch_up(subscriber)
+
+    def remove_subscriber(self, subscriber: SubscriberBuffer[CapturedLogData]) -> bool:
+        """Removes the subscriber, returning True if the watch has no subscribers left."""
+        with self.lock:
+            self.cursor_by_subscriber.pop(subscriber, None)
+            self.catching_up.discard(subscriber)
+            return not self.cursor_by_subscriber
+
+    def _on_log_data(self, log_data: CapturedLogData) -> None:
+        lagging = []
+        with self.lock:
+            for subscriber, cursor in self.cursor_by_subscriber.items():
+                if subscriber in self.catching_up:
+                    continue
+                if cursor == self.cursor:
+                    subscriber.put(log_data)
+                    self.cursor_by_subscriber[subscriber] = log_data.cursor
+                else:
+                    self.catching_up.add(subscriber)
+                    lagging.append(subscriber)
+            self.cursor = log_data.cursor
+            self.num_updates += 1
+
+        for subscriber in lagging:
+            self._catch_up(subscriber)
+
+    def _catch_up(self, subscriber: SubscriberBuffer[CapturedLogData]) -> None:
+        # reads happen outside of the lock, so that they don't hold up the watch or the other
+        # subscribers
+        while True:
+            with self.lock:
+                if subscriber not in self.cursor_by_subscriber:
+                    return
+                cursor = self.cursor_by_subscriber[subscriber]
+                num_updates = self.num_updates
+
+            should_fetch = True
+            while should_fetch:
+                log_data = self.manager.get_log_data(
+                    self.log_key, cursor, max_bytes=MAX_BYTES_CHUNK_READ
+                )
+                if not cursor or log_data.cursor != cursor:
+                    subscriber.put(log_data)
+                    cursor = log_data.cursor
+                should_fetch = any(
+                    chunk and len(chunk) >= MAX_BYTES_CHUNK_READ
+                    for chunk in (log_data.stdout, log_data.stderr)
+                )
+
+            with self.lock:
+                if subscriber not in self.cursor_by_subscriber:
+                    return
+                self.cursor_by_subscriber[subscriber] = cursor
+                # the watch skipped this subscriber while it was reading, so it reads again if
+                # the watch fanned out data in the meantime
+                if self.num_updates == num_updates:
+                    self.catching_up.discard(subscriber)
+                    return
+
+
+class CapturedLogWatchMultiplexer:
+    """Subscribes to the captured logs of each log key at most once, fanning the new log data out
+    to every subscriber of the log key.
+
+    Subscribers that are at the same cursor as the shared subscription are sent the data that it
+    reads. Subscribers that are at a different cursor, such as ones that join after the shared
+    subscription has already read some data, read from their own cursor until they catch up.
+
+    Subscribing reads log data, so it should not be called from an event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._watches: Dict[str, _CapturedLogWatch] = {}
+
+    def subscribe(
+        self,
+        manager: CapturedLogManager,
+        log_key: Sequence[str],
+        cursor: Optional[str],
+        subscriber: SubscriberBuffer[CapturedLogData],
+    ) -> _CapturedLogWatch:
+        watch_key = json.dumps(log_key)
+        with self._lock:
+            existing_watch = self._watches.get(watch_key)
+            # a completed subscription is no longer watched, so new subscribers start a new one
+            if existing_watch and not existing_watch.is_complete:
+                watch = existing_watch
+                is_new_watch = False
+            else:
+                watch = _CapturedLogWatch(manager, log_key, cursor)
+                self._watches[watch_key] = watch
+                is_new_watch = True
+
+        # log data is read outside of the lock, so that subscribing to other log keys doesn't
+        # wait on it
+        watch.add_subscriber(subscriber, cursor)
+        if is_new_watch:
+            watch.start()
+        return watch
+
+    def unsubscribe(
+        self, watch: _CapturedLogWatch, subscriber: SubscriberBuffer[CapturedLogData]
+    ) -> None:
+        watch_key = json.dumps(watch.log_key)
+        with self._lock:
+            if not watch.remove_subscriber(subscriber):
+                return
+            if self._watches.get(watch_key) is watch:
+                del self._watches[watch_key]
+        watch.dispose()
+
+    def num_watches(self) -> int:
+        with self._lock:
+            return len(self._watches)
+
+
+_run_event_multiplexers: MutableMapping[
+    DagsterInstance, RunEventWatchMultiplexer
+] = weakref.WeakKeyDictionary()
+_captured_log_multiplexers: MutableMapping[
+    CapturedLogManager, CapturedLogWatchMultiplexer
+] = weakref.WeakKeyDictionary()
+_multiplexers_lock = threading.Lock()
+
+
+def get_run_event_multiplexer(instance: DagsterInstance) -> RunEventWatchMultiplexer:
+    with _multiplexers_lock:
+        if instance not in _run_event_multiplexers:
+            _run_event_multiplexers[instance] = RunEventWatchMultiplexer()
+        return _run_event_multiplexers[instance]
+
+
+def get_captured_log_multiplexer(manager: CapturedLogManager) -> CapturedLogWatchMultiplexer:
+    with _multiplexers_lock:
+        if manager not in _captured_log_multiplexers:
+            _captured_log_multiplexers[manager] = CapturedLogWatchMultiplexer()
+        return _captured_log_multiplexers[manager]
+
+
+def merge_captured_log_data(updates: Sequence[CapturedLogData]) -> CapturedLogData:
+    """Combines consecutive chunks of captured log data into a single chunk."""
+    stdout = [update.stdout for update in updates if update.stdout]
+    stderr = [update.stderr for update in updates if update.stderr]
+    return CapturedLogData(
+        log_key=updates[-1].log_key,
+        stdout=b"".join(stdout) if stdout else None,
+        stderr=b"".join(stderr) if stderr else None,
+        cursor=updates[-1].cursor,
+    )
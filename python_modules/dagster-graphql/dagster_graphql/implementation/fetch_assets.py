@@ -25,7 +25,6 @@
     _check as check,
 )
 from dagster._core.definitions.data_time import CachingDataTimeResolver
-from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionsSubset,
 )
@@ -48,17 +47,17 @@
 from dagster._core.host_representation.external_data import ExternalAssetNode
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.partition_status_cache import (
+    AssetStatusCacheValue,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
+    get_and_update_asset_status_cache_values,
     get_materialized_multipartitions,
     get_validated_partition_keys,
     is_cacheable_partition_type,
 )
 
-from dagster_graphql.implementation.loader import (
-    CrossRepoAssetDependedByLoader,
-    StaleStatusLoader,
-)
+from dagster_graphql.implementation.loader import CrossRepoAssetDependedByLoader
+from dagster_graphql.implementation.resolver_cache import get_stale_status_resolver
 
 from .utils import capture_error
 
@@ -184,10 +183,7 @@ def get_asset_nodes_by_asset_key(
 
     depended_by_loader = CrossRepoAssetDependedByLoader(context=graphene_info.context)
 
-    stale_status_loader = StaleStatusLoader(
-        instance=graphene_info.context.instance,
-        asset_graph=lambda: ExternalAssetGraph.from_workspace(graphene_info.context),
-    )
+    stale_status_loader = get_stale_status_resolver(graphene_info.context)
 
     dynamic_partitions_loader = CachingDynamicPartitionsLoader(graphene_info.context.instance)
 
@@ -353,23 +349,7 @@ def get_partition_subsets(
         updated_cache_value = get_and_update_asset_status_cache_value(
             instance, asset_key, partitions_def, dynamic_partitions_loader
         )
-        materialized_subset = (
-            updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-        failed_subset = (
-            updated_cache_value.deserialize_failed_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-        in_progress_subset = (
-            updated_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
-            if updated_cache_value
-            else partitions_def.empty_subset()
-        )
-
-        return materialized_subset, failed_subset, in_progress_subset
+        return _get_partition_subsets_from_cache_value(updated_cache_value, partitions_def)
 
     else:
         # If the partition status can't be cached, fetch partition status from storage
@@ -403,6 +383,58 @@ def get_partition_subsets(
         return materialized_subset, failed_subset, in_progress_subset
 
 
+def get_partition_subsets_by_asset_key(
+    instance: DagsterInstance,
+    partitions_defs_by_key: Mapping[AssetKey, PartitionsDefinition],
+    dynamic_partitions_loader: DynamicPartitionsStore,
+) -> Mapping[AssetKey, Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]]:
+    """Returns the materialized, failed, and in progress partition subsets of each of the given
+    partitioned assets. The subsets of assets whose partition status can be cached are fetched
+    together, reevaluating only the assets with new events.
+    """
+    can_cache_asset_status_data = instance.can_cache_asset_status_data()
+    cacheable_partitions_defs_by_key = {
+        asset_key: partitions_def
+        for asset_key, partitions_def in partitions_defs_by_key.items()
+        if can_cache_asset_status_data and is_cacheable_partition_type(partitions_def)
+    }
+    cache_values_by_key = get_and_update_asset_status_cache_values(
+        instance, cacheable_partitions_defs_by_key, dynamic_partitions_loader
+    )
+
+    partition_subsets_by_key = {}
+    for asset_key, partitions_def in partitions_defs_by_key.items():
+        if asset_key in cacheable_partitions_defs_by_key:
+            partition_subsets_by_key[asset_key] = _get_partition_subsets_from_cache_value(
+                cache_values_by_key.get(asset_key), partitions_def
+            )
+        else:
+            partition_subsets_by_key[asset_key] = cast(
+                Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset],
+                get_partition_subsets(
+                    instance, asset_key, dynamic_partitions_loader, partitions_def
+                ),
+            )
+    return partition_subsets_by_key
+
+
+def _get_partition_subsets_from_cache_value(
+    cache_value: Optional[AssetStatusCacheValue], partitions_def: PartitionsDefinition
+) -> Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+    if not cache_value:
+        return (
+            partitions_def.empty_subset(),
+            partitions_def.empty_subset(),
+            partitions_def.empty_subset(),
+        )
+
+    return (
+        cache_value.deserialize_materialized_partition_subsets(partitions_def),
+        cache_value.deserialize_failed_partition_subsets(partitions_def),
+        cache_value.deserialize_in_progress_partition_subsets(partitions_def),
+    )
+
+
 def build_partition_statuses(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: Optional[PartitionsSubset],
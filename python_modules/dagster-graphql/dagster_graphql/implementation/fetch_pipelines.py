@@ -7,6 +7,7 @@
 from dagster_graphql.schema.util import ResolveInfo
 
 from .external import get_external_pipeline_or_raise, get_full_external_pipeline_or_raise
+from .resolver_cache import get_historical_pipeline
 from .utils import PipelineSelector, UserFacingGraphQLError, capture_error
 
 if TYPE_CHECKING:
@@ -42,13 +43,10 @@ def _get_pipeline_snapshot_from_instance(
     from ..schema.errors import GraphenePipelineSnapshotNotFoundError
     from ..schema.pipelines.snapshot import GraphenePipelineSnapshot
 
-    if not instance.has_pipeline_snapshot(snapshot_id):
-        raise UserFacingGraphQLError(GraphenePipelineSnapshotNotFoundError(snapshot_id))
-
-    historical_pipeline = instance.get_historical_pipeline(snapshot_id)
+    historical_pipeline = get_historical_pipeline(instance, snapshot_id)
 
     if not historical_pipeline:
-        # Either a temporary error or it has been deleted in the interim
+        # Either it does not exist, or a temporary error or it has been deleted in the interim
         raise UserFacingGraphQLError(GraphenePipelineSnapshotNotFoundError(snapshot_id))
 
     return GraphenePipelineSnapshot(historical_pipeline)
@@ -1,3 +1,4 @@
+import threading
 from collections import defaultdict
 from enum import Enum
 from functools import lru_cache
@@ -9,6 +10,7 @@
 )
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
 from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.partition import CachingDynamicPartitionsLoader, PartitionsSubset
 from dagster._core.events.log import EventLogEntry
 from dagster._core.host_representation import ExternalRepository
 from dagster._core.host_representation.external_data import (
@@ -21,6 +23,8 @@
 from dagster._core.storage.tags import REPOSITORY_LABEL_TAG, SCHEDULE_NAME_TAG, SENSOR_NAME_TAG
 from dagster._core.workspace.context import WorkspaceRequestContext
 
+from .resolver_cache import get_cross_repo_asset_deps
+
 
 class RepositoryDataType(Enum):
     JOB_RUNS = "job_runs"
@@ -45,11 +49,14 @@ class RepositoryScopedBatchLoader:
     be fetched for every job in the repository.  We can batch fetch the last 10 runs for every job,
     reducing the number of roundtrips to the DB, and then access them using the in-memory loader
     cache.
+
+    Resolvers may run on different threads, so data is fetched and read under a lock.
     """
 
     def __init__(self, instance: DagsterInstance, external_repository: ExternalRepository):
         self._instance = instance
         self._repository = external_repository
+        self._lock = threading.Lock()
         self._data: Dict[RepositoryDataType, Dict[str, List[Any]]] = {}
         self._limits: Dict[RepositoryDataType, int] = {}
 
@@ -57,9 +64,10 @@ def _get(self, data_type: RepositoryDataType, key: str, limit: int) -> Sequence[
         check.inst_param(data_type, "data_type", RepositoryDataType)
         check.str_param(key, "key")
         check.int_param(limit, "limit")
-        if self._data.get(data_type) is None or limit > self._limits.get(data_type, 0):
-            self._fetch(data_type, limit)
-        return self._data[data_type].get(key, [])[:limit]
+        with self._lock:
+            if self._data.get(data_type) is None or limit > self._limits.get(data_type, 0):
+                self._fetch(data_type, limit)
+            return self._data[data_type].get(key, [])[:limit]
 
     def _fetch(self, data_type: RepositoryDataType, limit: int) -> None:
         check.inst_param(data_type, "data_type", RepositoryDataType)
@@ -277,6 +285,7 @@ class BatchRunLoader:
     def __init__(self, instance: DagsterInstance, run_ids: Iterable[str]):
         self._instance = instance
         self._run_ids: Set[str] = set(run_ids)
+        self._lock = threading.Lock()
         self._records: Dict[str, RunRecord] = {}
 
     def get_run_record_by_run_id(self, run_id: str) -> Optional[RunRecord]:
@@ -284,9 +293,10 @@ def get_run_record_by_run_id(self, run_id: str) -> Optional[RunRecord]:
             check.failed(
                 f"Run id {run_id} not recognized for this loader.  Expected one of: {self._run_ids}"
             )
-        if self._records.get(run_id) is None:
-            self._fetch()
-        return self._records.get(run_id)
+        with self._lock:
+            if self._records.get(run_id) is None:
+                self._fetch()
+            return self._records.get(run_id)
 
     def _fetch(self) -> None:
         records = self._instance.get_run_records(RunsFilter(run_ids=list(self._run_ids)))
@@ -302,6 +312,7 @@ class BatchMaterializationLoader:
     def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
         self._instance = instance
         self._asset_keys: List[AssetKey] = list(asset_keys)
+        self._lock = threading.Lock()
         self._fetched = False
         self._materializations: Mapping[AssetKey, Optional[EventLogEntry]] = {}
 
@@ -314,16 +325,67 @@ def get_latest_materialization_for_asset_key(
                 f" {self._asset_keys}"
             )
 
-        if not self._fetched:
-            self._fetch()
-        return self._materializations.get(asset_key)
+        with self._lock:
+            if not self._fetched:
+                self._fetch()
+            return self._materializations.get(asset_key)
 
     def _fetch(self) -> None:
-        self._fetched = True
         self._materializations = {
             record.asset_entry.asset_key: record.asset_entry.last_materialization
             for record in self._instance.get_asset_records(self._asset_keys)
         }
+        self._fetched = True
+
+
+class BatchAssetPartitionStatusLoader:
+    """A batch loader that fetches the materialized, failed, and in progress partition subsets of
+    partitioned assets. This loader is expected to be instantiated with the asset nodes whose
+    partition statuses may be requested, and fetches the statuses of all of them on the first
+    request. Concurrent requests wait for that fetch rather than fetching again.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        external_asset_nodes: Iterable[ExternalAssetNode],
+        dynamic_partitions_loader: CachingDynamicPartitionsLoader,
+    ):
+        self._instance = instance
+        self._external_asset_nodes: List[ExternalAssetNode] = list(external_asset_nodes)
+        self._dynamic_partitions_loader = dynamic_partitions_loader
+        self._lock = threading.Lock()
+        self._fetched = False
+        self._partition_subsets: Mapping[
+            AssetKey, Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]
+        ] = {}
+
+    def get_partition_subsets(
+        self, asset_key: AssetKey
+    ) -> Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+        with self._lock:
+            if not self._fetched:
+                self._fetch()
+
+        if asset_key not in self._partition_subsets:
+            check.failed(
+                f"Asset key {asset_key} not recognized as a partitioned asset for this loader."
+            )
+        return self._partition_subsets[asset_key]
+
+    def _fetch(self) -> None:
+        from .fetch_assets import get_partition_subsets_by_asset_key
+
+        self._partition_subsets = get_partition_subsets_by_asset_key(
+            self._instance,
+            {
+                node.asset_key: node.partitions_def_data.get_partitions_definition()
+                for node in self._external_asset_nodes
+                if node.partitions_def_data
+            },
+            self._dynamic_partitions_loader,
+        )
+        self._fetched = True
 
 
 class CrossRepoAssetDependedByLoader:
@@ -340,11 +402,14 @@ class CrossRepoAssetDependedByLoader:
     is external from A's repo but an edge exists from A to B).
 
     The @lru_cache decorator enables the _build_cross_repo_deps method to cache its return value
-    to avoid recalculating the asset dependencies on repeated calls to the method.
+    to avoid recalculating the asset dependencies on repeated calls to the method. The asset
+    dependencies are also shared with later requests until a code location is reloaded. Since
+    resolvers may run on different threads, the dependencies are built under a lock.
     """
 
     def __init__(self, context: WorkspaceRequestContext):
         self._context = context
+        self._lock = threading.Lock()
 
     @lru_cache(maxsize=1)
     def _build_cross_repo_deps(
@@ -352,6 +417,14 @@ def _build_cross_repo_deps(
     ) -> Tuple[
         Dict[AssetKey, ExternalAssetNode],
         Dict[Tuple[str, str], Dict[AssetKey, List[ExternalAssetDependedBy]]],
+    ]:
+        return get_cross_repo_asset_deps(self._context, self._compute_cross_repo_deps)
+
+    def _compute_cross_repo_deps(
+        self,
+    ) -> Tuple[
+        Dict[AssetKey, ExternalAssetNode],
+        Dict[Tuple[str, str], Dict[AssetKey, List[ExternalAssetDependedBy]]],
     ]:
         """This method constructs a sink asset as an ExternalAssetNode for every asset immediately
         downstream of a source asset that is defined in another repository as a derived asset.
@@ -422,14 +495,23 @@ def _build_cross_repo_deps(
                     )
         return sink_assets, external_asset_deps
 
+    def _get_cross_repo_deps(
+        self,
+    ) -> Tuple[
+        Dict[AssetKey, ExternalAssetNode],
+        Dict[Tuple[str, str], Dict[AssetKey, List[ExternalAssetDependedBy]]],
+    ]:
+        with self._lock:
+            return self._build_cross_repo_deps()
+
     def get_sink_asset(self, asset_key: AssetKey) -> ExternalAssetNode:
-        sink_assets, _ = self._build_cross_repo_deps()
+        sink_assets, _ = self._get_cross_repo_deps()
         return sink_assets[asset_key]
 
     def get_cross_repo_dependent_assets(
         self, repository_location_name: str, repository_name: str, asset_key: AssetKey
     ) -> Sequence[ExternalAssetDependedBy]:
-        _, external_asset_deps = self._build_cross_repo_deps()
+        _, external_asset_deps = self._get_cross_repo_deps()
         return external_asset_deps.get((repository_location_name, repository_name), {}).get(
             asset_key, []
         )
@@ -0,0 +1,253 @@
+"""Caches for values that GraphQL resolvers derive from data that rarely changes.
+
+Several resolvers recompute the same values on every request, such as the asset graph of a
+repository or the snapshot of a historical job, even though those values only change when a code
+location is reloaded or when new events are stored. The caches in this module share those values
+across requests.
+
+Every entry is stored along with the version of the data it was derived from. A lookup with a
+different version recomputes the value and replaces the entry, so that a cache never returns a
+value derived from data that has since changed:
+
+* values derived from a code location are versioned by the time at which the location was loaded,
+  which changes whenever the location is reloaded
+* values derived from asset events are additionally versioned by the greatest storage id in the
+  event log, which changes whenever a new event is stored
+
+Caches are scoped to a DagsterInstance and hold at most a configurable number of entries each,
+evicting the least recently used ones. Hits, misses, and evictions are counted per cache.
+"""
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generic,
+    Hashable,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from dagster import DagsterInstance
+from dagster._core.definitions.data_version import CachingStaleStatusResolver
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
+from dagster._core.host_representation import ExternalRepository
+from dagster._core.workspace.context import BaseWorkspaceRequestContext
+
+if TYPE_CHECKING:
+    from dagster._core.host_representation import HistoricalPipeline
+
+T = TypeVar("T")
+
+
+class ResolverCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class ResolverCache(Generic[T]):
+    """A thread-safe, size-limited cache of versioned values.
+
+    Values are computed outside of the lock, so concurrent lookups of the same missing key may
+    each compute the value. None values are never cached.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, T]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, version: Hashable, compute_fn: Callable[[], T]) -> T:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        value = compute_fn()
+        if value is None or self._max_size <= 0:
+            return value
+
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> ResolverCacheStats:
+        with self._lock:
+            return ResolverCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+
+def _get_max_size(env_var: str, default: int) -> int:
+    return int(os.getenv(env_var, str(default)))
+
+
+class ResolverCaches:
+    def __init__(self) -> None:
+        self.asset_graphs: ResolverCache[ExternalAssetGraph] = ResolverCache(
+            _get_max_size("DAGIT_ASSET_GRAPH_CACHE_SIZE", 32)
+        )
+        self.cross_repo_asset_deps: ResolverCache[Tuple] = ResolverCache(
+            _get_max_size("DAGIT_CROSS_REPO_ASSET_DEPS_CACHE_SIZE", 4)
+        )
+        self.stale_status_resolvers: ResolverCache[CachingStaleStatusResolver] = ResolverCache(
+            _get_max_size("DAGIT_STALE_STATUS_CACHE_SIZE", 32)
+        )
+        self.historical_pipelines: ResolverCache["HistoricalPipeline"] = ResolverCache(
+            _get_max_size("DAGIT_HISTORICAL_PIPELINE_CACHE_SIZE", 64)
+        )
+
+    def get_stats(self) -> Mapping[str, ResolverCacheStats]:
+        return {
+            "asset_graphs": self.asset_graphs.stats,
+            "cross_repo_asset_deps": self.cross_repo_asset_deps.stats,
+            "stale_status_resolvers": self.stale_status_resolvers.stats,
+            "historical_pipelines": self.historical_pipelines.stats,
+        }
+
+
+_resolver_caches: MutableMapping[DagsterInstance, ResolverCaches] = weakref.WeakKeyDictionary()
+_resolver_caches_lock = threading.Lock()
+
+
+def get_resolver_caches(instance: DagsterInstance) -> ResolverCaches:
+    with _resolver_caches_lock:
+        if instance not in _resolver_caches:
+            _resolver_caches[instance] = ResolverCaches()
+        return _resolver_caches[instance]
+
+
+def get_resolver_cache_stats(instance: DagsterInstance) -> Mapping[str, ResolverCacheStats]:
+    """Returns the hits, misses, and evictions of each resolver cache of the given instance."""
+    return get_resolver_caches(instance).get_stats()
+
+
+def get_location_version(context: BaseWorkspaceRequestContext, location_name: str) -> Hashable:
+    entry = context.get_location_entry(location_name)
+    return (location_name, entry.update_timestamp if entry else None)
+
+
+def get_workspace_version(context: BaseWorkspaceRequestContext) -> Hashable:
+    return tuple(
+        sorted(
+            (location_name, entry.update_timestamp)
+            for location_name, entry in context.get_workspace_snapshot().items()
+        )
+    )
+
+
+def get_event_log_version(instance: DagsterInstance) -> Optional[int]:
+    """Returns the greatest storage id in the event log, or None if the event log storage can't
+    tell it.
+    """
+    try:
+        return instance.event_log_storage.get_maximum_record_id()
+    except NotImplementedError:
+        return None
+
+
+def get_repository_asset_graph(
+    context: BaseWorkspaceRequestContext, repository: ExternalRepository
+) -> ExternalAssetGraph:
+    location_name = repository.handle.location_name
+    return get_resolver_caches(context.instance).asset_graphs.get(
+        ("repository", location_name, repository.name),
+        get_location_version(context, location_name),
+        lambda: ExternalAssetGraph.from_external_repository(repository),
+    )
+
+
+def get_workspace_asset_graph(context: BaseWorkspaceRequestContext) -> ExternalAssetGraph:
+    return get_resolver_caches(context.instance).asset_graphs.get(
+        ("workspace",),
+        get_workspace_version(context),
+        lambda: ExternalAssetGraph.from_workspace(context),
+    )
+
+
+def get_stale_status_resolver(
+    context: BaseWorkspaceRequestContext, repository: Optional[ExternalRepository] = None
+) -> CachingStaleStatusResolver:
+    """Returns a stale status resolver for the asset graph of the given repository, or of the whole
+    workspace if no repository is given.
+
+    The resolver is shared by requests until a location is reloaded or a new event is stored, so
+    that the stale statuses it has resolved are not resolved again.
+    """
+    instance = context.instance
+    if repository:
+        location_name = repository.handle.location_name
+        key: Hashable = ("repository", location_name, repository.name)
+        version: Hashable = get_location_version(context, location_name)
+        load_asset_graph = lambda: get_repository_asset_graph(context, repository)
+    else:
+        key = ("workspace",)
+        version = get_workspace_version(context)
+        load_asset_graph = lambda: get_workspace_asset_graph(context)
+
+    event_log_version = get_event_log_version(instance)
+    if event_log_version is None:
+        return CachingStaleStatusResolver(instance=instance, asset_graph=load_asset_graph)
+
+    # the resolver outlives the request, so it loads its asset graph up front rather than holding
+    # on to the request context, and holds the instance weakly, since the caches of the instance
+    # would otherwise keep it alive
+    return get_resolver_caches(instance).stale_status_resolvers.get(
+        key,
+        (version, event_log_version),
+        lambda: CachingStaleStatusResolver(
+            instance=weakref.proxy(instance), asset_graph=load_asset_graph()
+        ),
+    )
+
+
+def get_historical_pipeline(
+    instance: DagsterInstance, snapshot_id: str
+) -> Optional["HistoricalPipeline"]:
+    # snapshots are immutable, so historical pipelines never need to be recomputed
+    return get_resolver_caches(instance).historical_pipelines.get(
+        snapshot_id,
+        None,
+        lambda: (
+            instance.get_historical_pipeline(snapshot_id)
+            if instance.has_pipeline_snapshot(snapshot_id)
+            else None
+        ),
+    )
+
+
+def get_cross_repo_asset_deps(
+    context: BaseWorkspaceRequestContext, compute_fn: Callable[[], Tuple]
+) -> Tuple:
+    return get_resolver_caches(context.instance).cross_repo_asset_deps.get(
+        ("workspace",), get_workspace_version(context), compute_fn
+    )
+
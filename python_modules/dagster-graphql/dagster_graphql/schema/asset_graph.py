@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union, cast
 
 import graphene
 from dagster import (
@@ -10,8 +10,7 @@
     NULL_DATA_VERSION,
     StaleStatus,
 )
-from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
-from dagster._core.definitions.partition import CachingDynamicPartitionsLoader
+from dagster._core.definitions.partition import CachingDynamicPartitionsLoader, PartitionsSubset
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventRecordsFilter
 from dagster._core.events import DagsterEventType
@@ -53,10 +52,12 @@
     get_partition_subsets,
 )
 from ..implementation.loader import (
+    BatchAssetPartitionStatusLoader,
     BatchMaterializationLoader,
     CrossRepoAssetDependedByLoader,
     StaleStatusLoader,
 )
+from ..implementation.resolver_cache import get_repository_asset_graph
 from . import external
 from .asset_key import GrapheneAssetKey
 from .dagster_types import (
@@ -251,6 +252,7 @@ def __init__(
         depended_by_loader: Optional[CrossRepoAssetDependedByLoader] = None,
         stale_status_loader: Optional[StaleStatusLoader] = None,
         dynamic_partitions_loader: Optional[CachingDynamicPartitionsLoader] = None,
+        partition_status_loader: Optional[BatchAssetPartitionStatusLoader] = None,
     ):
         from ..implementation.fetch_assets import get_unique_asset_id
 
@@ -279,6 +281,9 @@ def __init__(
         self._dynamic_partitions_loader = check.opt_inst_param(
             dynamic_partitions_loader, "dynamic_partitions_loader", CachingDynamicPartitionsLoader
         )
+        self._partition_status_loader = check.opt_inst_param(
+            partition_status_loader, "partition_status_loader", BatchAssetPartitionStatusLoader
+        )
         self._external_pipeline = None  # lazily loaded
         self._node_definition_snap = None  # lazily loaded
 
@@ -448,7 +453,7 @@ def resolve_assetMaterializationUsedData(
             return []
 
         instance = graphene_info.context.instance
-        asset_graph = ExternalAssetGraph.from_external_repository(self._external_repository)
+        asset_graph = get_repository_asset_graph(graphene_info.context, self._external_repository)
         asset_key = self._external_asset_node.asset_key
 
         # in the future, we can share this same CachingInstanceQueryer across all
@@ -679,7 +684,9 @@ def resolve_freshnessInfo(
         self, graphene_info: ResolveInfo
     ) -> Optional[GrapheneAssetFreshnessInfo]:
         if self._external_asset_node.freshness_policy:
-            asset_graph = ExternalAssetGraph.from_external_repository(self._external_repository)
+            asset_graph = get_repository_asset_graph(
+                graphene_info.context, self._external_repository
+            )
             return get_freshness_info(
                 asset_key=self._external_asset_node.asset_key,
                 # in the future, we can share this same CachingInstanceQueryer across all
@@ -776,19 +783,18 @@ def resolve_latestRunForPartition(
         run_record = graphene_info.context.instance.get_run_record_by_id(event_records[0].run_id)
         return GrapheneRun(run_record) if run_record else None
 
-    def resolve_assetPartitionStatuses(
+    def _get_partition_subsets(
         self, graphene_info: ResolveInfo
-    ) -> Union["GrapheneTimePartitions", "GrapheneDefaultPartitions", "GrapheneMultiPartitions"]:
+    ) -> Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]:
         asset_key = self._external_asset_node.asset_key
 
         if not self._dynamic_partitions_loader:
             check.failed("dynamic_partitions_loader must be provided to get partition keys")
 
-        (
-            materialized_partition_subset,
-            failed_partition_subset,
-            in_progress_subset,
-        ) = get_partition_subsets(
+        if self._partition_status_loader and self._external_asset_node.partitions_def_data:
+            return self._partition_status_loader.get_partition_subsets(asset_key)
+
+        return get_partition_subsets(
             graphene_info.context.instance,
             asset_key,
             self._dynamic_partitions_loader,
@@ -797,8 +803,17 @@ def resolve_assetPartitionStatuses(
             else None,
         )
 
+    def resolve_assetPartitionStatuses(
+        self, graphene_info: ResolveInfo
+    ) -> Union["GrapheneTimePartitions", "GrapheneDefaultPartitions", "GrapheneMultiPartitions"]:
+        (
+            materialized_partition_subset,
+            failed_partition_subset,
+            in_progress_subset,
+        ) = self._get_partition_subsets(graphene_info)
+
         return build_partition_statuses(
-            self._dynamic_partitions_loader,
+            check.not_none(self._dynamic_partitions_loader),
             materialized_partition_subset,
             failed_partition_subset,
             in_progress_subset,
@@ -809,23 +824,11 @@ def resolve_partitionStats(
     ) -> Optional[GraphenePartitionStats]:
         partitions_def_data = self._external_asset_node.partitions_def_data
         if partitions_def_data:
-            asset_key = self._external_asset_node.asset_key
-
-            if not self._dynamic_partitions_loader:
-                check.failed("dynamic_partitions_loader must be provided to get partition keys")
-
             (
                 materialized_partition_subset,
                 failed_partition_subset,
                 in_progress_subset,
-            ) = get_partition_subsets(
-                graphene_info.context.instance,
-                asset_key,
-                self._dynamic_partitions_loader,
-                self._external_asset_node.partitions_def_data.get_partitions_definition()
-                if self._external_asset_node.partitions_def_data
-                else None,
-            )
+            ) = self._get_partition_subsets(graphene_info)
 
             if (
                 materialized_partition_subset is None
@@ -3,7 +3,6 @@
 import dagster._check as check
 import graphene
 from dagster._core.definitions.events import AssetKey
-from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.partition import CachingDynamicPartitionsLoader
 from dagster._core.definitions.selector import (
     InstigatorSelector,
@@ -67,10 +66,11 @@
 from ...implementation.fetch_sensors import get_sensor_or_error, get_sensors_or_error
 from ...implementation.fetch_solids import get_graph_or_error
 from ...implementation.loader import (
+    BatchAssetPartitionStatusLoader,
     BatchMaterializationLoader,
     CrossRepoAssetDependedByLoader,
-    StaleStatusLoader,
 )
+from ...implementation.resolver_cache import get_stale_status_resolver
 from ...implementation.run_config_schema import resolve_run_config_schema_or_error
 from ...implementation.utils import graph_selector_from_graphql, pipeline_selector_from_graphql
 from ..asset_graph import (
@@ -785,15 +785,12 @@ def resolve_assetNodes(
 
         depended_by_loader = CrossRepoAssetDependedByLoader(context=graphene_info.context)
 
-        def load_asset_graph() -> ExternalAssetGraph:
-            if repo is not None:
-                return ExternalAssetGraph.from_external_repository(repo)
-            else:
-                return ExternalAssetGraph.from_workspace(graphene_info.context)
+        stale_status_loader = get_stale_status_resolver(graphene_info.context, repo)
 
-        stale_status_loader = StaleStatusLoader(
+        partition_status_loader = BatchAssetPartitionStatusLoader(
             instance=graphene_info.context.instance,
-            asset_graph=load_asset_graph,
+            external_asset_nodes=[node.external_asset_node for node in results],
+            dynamic_partitions_loader=dynamic_partitions_loader,
         )
 
         return [
@@ -805,6 +802,7 @@ def load_asset_graph() -> ExternalAssetGraph:
                 depended_by_loader=depended_by_loader,
                 stale_status_loader=stale_status_loader,
                 dynamic_partitions_loader=dynamic_partitions_loader,
+                partition_status_loader=partition_status_loader,
             )
             for node in results
         ]
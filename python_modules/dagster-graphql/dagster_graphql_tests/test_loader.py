@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from dagster import AssetKey
+from dagster_graphql.implementation.loader import (
+    BatchAssetPartitionStatusLoader,
+    BatchMaterializationLoader,
+    BatchRunLoader,
+)
+
+
+def _slow(return_value):
+    def _fn(*_args, **_kwargs):
+        # widen the window in which a concurrent lookup could fetch again
+        time.sleep(0.05)
+        return return_value
+
+    return _fn
+
+
+def _get_concurrently(fn, args):
+    with ThreadPoolExecutor(max_workers=len(args)) as executor:
+        return list(executor.map(fn, args))
+
+
+def test_batch_materialization_loader_fetches_once_across_threads():
+    asset_keys = [AssetKey(f"asset_{i}") for i in range(8)]
+    instance = mock.MagicMock()
+    instance.get_asset_records.side_effect = _slow(
+        [
+            mock.MagicMock(
+                asset_entry=mock.MagicMock(asset_key=asset_key, last_materialization=asset_key)
+            )
+            for asset_key in asset_keys
+        ]
+    )
+
+    loader = BatchMaterializationLoader(instance, asset_keys)
+    materializations = _get_concurrently(
+        loader.get_latest_materialization_for_asset_key, asset_keys
+    )
+
+    assert materializations == asset_keys
+    assert instance.get_asset_records.call_count == 1
+
+
+def test_batch_run_loader_fetches_once_across_threads():
+    run_ids = [f"run_{i}" for i in range(8)]
+    instance = mock.MagicMock()
+    instance.get_run_records.side_effect = _slow(
+        [mock.MagicMock(dagster_run=mock.MagicMock(run_id=run_id)) for run_id in run_ids]
+    )
+
+    loader = BatchRunLoader(instance, run_ids)
+    records = _get_concurrently(loader.get_run_record_by_run_id, run_ids)
+
+    assert [record.dagster_run.run_id for record in records] == run_ids
+    assert instance.get_run_records.call_count == 1
+
+
+def test_batch_asset_partition_status_loader_fetches_once_across_threads():
+    asset_keys = [AssetKey(f"asset_{i}") for i in range(8)]
+    external_asset_nodes = [mock.MagicMock(asset_key=asset_key) for asset_key in asset_keys]
+    loader = BatchAssetPartitionStatusLoader(
+        mock.MagicMock(), external_asset_nodes, mock.MagicMock()
+    )
+
+    with mock.patch(
+        "dagster_graphql.implementation.fetch_assets.get_partition_subsets_by_asset_key",
+        side_effect=_slow({asset_key: (asset_key, None, None) for asset_key in asset_keys}),
+    ) as get_partition_subsets_by_asset_key:
+        subsets = _get_concurrently(loader.get_partition_subsets, asset_keys)
+
+    assert [materialized for materialized, _, _ in subsets] == asset_keys
+    assert get_partition_subsets_by_asset_key.call_count == 1
+
+
+def test_batch_asset_partition_status_loader_refetches_after_error():
+    asset_key = AssetKey("asset")
+    loader = BatchAssetPartitionStatusLoader(
+        mock.MagicMock(), [mock.MagicMock(asset_key=asset_key)], mock.MagicMock()
+    )
+
+    with mock.patch(
+        "dagster_graphql.implementation.fetch_assets.get_partition_subsets_by_asset_key",
+        side_effect=[Exception("oops"), {asset_key: ("materialized", None, None)}],
+    ):
+        with pytest.raises(Exception, match="oops"):
+            loader.get_partition_subsets(asset_key)
+
+        # the failed fetch did not mark the loader as fetched
+        assert loader.get_partition_subsets(asset_key) == ("materialized", None, None)
@@ -0,0 +1,98 @@
+import gc
+import weakref
+from unittest import mock
+
+from dagster import DagsterInstance, job, op
+from dagster_graphql.implementation.resolver_cache import (
+    ResolverCache,
+    get_historical_pipeline,
+    get_resolver_cache_stats,
+    get_stale_status_resolver,
+)
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+def test_resolver_cache_hits_and_misses():
+    cache = ResolverCache(max_size=2)
+    compute_fn = mock.MagicMock(return_value="value")
+
+    assert cache.get("foo", 1, compute_fn) == "value"
+    assert cache.get("foo", 1, compute_fn) == "value"
+    assert compute_fn.call_count == 1
+
+    # a different version recomputes the value and replaces the entry
+    compute_fn.return_value = "new_value"
+    assert cache.get("foo", 2, compute_fn) == "new_value"
+    assert compute_fn.call_count == 2
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 2, 0, 1)
+
+
+def test_resolver_cache_evicts_least_recently_used():
+    cache = ResolverCache(max_size=2)
+    cache.get("foo", None, lambda: "foo")
+    cache.get("bar", None, lambda: "bar")
+    cache.get("foo", None, lambda: "unused")
+    cache.get("baz", None, lambda: "baz")
+
+    assert cache.stats.evictions == 1
+    assert cache.get("foo", None, lambda: "unused") == "foo"
+    assert cache.get("bar", None, lambda: "recomputed") == "recomputed"
+
+
+def test_resolver_cache_does_not_cache_none():
+    cache = ResolverCache(max_size=2)
+    assert cache.get("foo", None, lambda: None) is None
+    assert cache.get("foo", None, lambda: "value") == "value"
+    assert cache.stats.misses == 2
+
+
+def test_resolver_cache_disabled():
+    cache = ResolverCache(max_size=0)
+    assert cache.get("foo", None, lambda: "value") == "value"
+    assert cache.get("foo", None, lambda: "new_value") == "new_value"
+    assert cache.stats.size == 0
+
+
+def test_get_historical_pipeline():
+    with DagsterInstance.ephemeral() as instance:
+        snapshot_id = instance.run_storage.add_pipeline_snapshot(noop_job.get_pipeline_snapshot())
+
+        with mock.patch.object(
+            instance, "get_historical_pipeline", wraps=instance.get_historical_pipeline
+        ) as get_historical_pipeline_mock:
+            historical_pipeline = get_historical_pipeline(instance, snapshot_id)
+            assert historical_pipeline.computed_pipeline_snapshot_id == snapshot_id
+            assert get_historical_pipeline(instance, snapshot_id) is historical_pipeline
+            assert get_historical_pipeline_mock.call_count == 1
+
+        assert get_historical_pipeline(instance, "missing") is None
+        assert get_resolver_cache_stats(instance)["historical_pipelines"].hits == 1
+
+
+def test_cached_stale_status_resolver_does_not_keep_instance_alive():
+    instance = DagsterInstance.ephemeral()
+    context = mock.MagicMock(instance=instance)
+    context.get_workspace_snapshot.return_value = {}
+
+    with mock.patch(
+        "dagster_graphql.implementation.resolver_cache.get_workspace_asset_graph",
+        lambda _context: None,
+    ), mock.patch.object(instance.event_log_storage, "get_maximum_record_id", return_value=1):
+        assert get_stale_status_resolver(context) is get_stale_status_resolver(context)
+    assert get_resolver_cache_stats(instance)["stale_status_resolvers"].size == 1
+
+    instance_ref = weakref.ref(instance)
+    del context, instance
+    gc.collect()
+    assert instance_ref() is None
@@ -0,0 +1,228 @@
+import asyncio
+import time
+from unittest import mock
+
+from dagster import DagsterInstance
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.captured_log_manager import CapturedLogData
+from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster._core.test_utils import create_run_for_test
+from dagster._utils import ensure_dir
+from dagster_graphql.implementation.execution import gen_events_for_run
+from dagster_graphql.implementation.execution.subscription_multiplexer import (
+    CapturedLogWatchMultiplexer,
+    RunEventWatchMultiplexer,
+    SubscriberBuffer,
+    merge_captured_log_data,
+)
+
+
+def _store_engine_event(instance, run_id, message):
+    instance.handle_new_event(
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message=message,
+            run_id=run_id,
+            timestamp=time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value, "foo", event_specific_data=EngineEventData()
+            ),
+        )
+    )
+
+
+def test_subscriber_buffer_coalesces_updates():
+    async def _test():
+        subscriber = SubscriberBuffer(max_pending=None)
+        for i in range(5):
+            subscriber.put(i)
+        assert await subscriber.get_batch(coalesce_interval=0) == ([0, 1, 2, 3, 4], False)
+
+        subscriber.put(5)
+        assert await subscriber.get_batch(coalesce_interval=0) == ([5], False)
+
+    asyncio.run(_test())
+
+
+def test_subscriber_buffer_falls_behind():
+    async def _test():
+        subscriber = SubscriberBuffer(max_pending=2)
+        for i in range(3):
+            subscriber.put(i)
+        # updates are dropped once the subscriber has fallen behind, until the next batch
+        subscriber.put(3)
+        assert await subscriber.get_batch(coalesce_interval=0) == ([], True)
+
+        subscriber.put(4)
+        assert await subscriber.get_batch(coalesce_interval=0) == ([4], False)
+
+    asyncio.run(_test())
+
+
+def test_run_event_watch_multiplexer():
+    with DagsterInstance.ephemeral() as instance:
+        run = create_run_for_test(instance)
+        multiplexer = RunEventWatchMultiplexer()
+
+        async def _test():
+            subscribers = [SubscriberBuffer(max_pending=None) for _ in range(3)]
+            with mock.patch.object(
+                instance, "watch_event_logs", wraps=instance.watch_event_logs
+            ) as watch_event_logs, mock.patch.object(
+                instance, "end_watch_event_logs", wraps=instance.end_watch_event_logs
+            ) as end_watch_event_logs:
+                for subscriber in subscribers:
+                    multiplexer.subscribe(instance, run.run_id, None, subscriber)
+                assert watch_event_logs.call_count == 1
+                assert multiplexer.num_watches() == 1
+
+                for i in range(3):
+                    _store_engine_event(instance, run.run_id, f"event {i}")
+
+                for subscriber in subscribers:
+                    messages = []
+                    while len(messages) < 3:
+                        events, fell_behind = await asyncio.wait_for(
+                            subscriber.get_batch(coalesce_interval=0), timeout=30
+                        )
+                        assert not fell_behind
+                        messages.extend(event.user_message for event, _ in events)
+                    assert messages == ["event 0", "event 1", "event 2"]
+
+                for subscriber in subscribers:
+                    multiplexer.unsubscribe(instance, run.run_id, subscriber)
+                assert end_watch_event_logs.call_count == 1
+                assert multiplexer.num_watches() == 0
+
+        asyncio.run(_test())
+
+
+def test_captured_log_watch_multiplexer(tmpdir):
+    manager = LocalComputeLogManager(str(tmpdir))
+    log_key = ["run_id", "compute_logs", "step"]
+    stdout_path = manager.get_captured_local_path(log_key, "out")
+    ensure_dir(str(tmpdir.join(*log_key[:-1])))
+    with open(stdout_path, "w") as f:
+        f.write("hello\n")
+
+    multiplexer = CapturedLogWatchMultiplexer()
+
+    async def _get_stdout(subscriber):
+        updates, _ = await asyncio.wait_for(subscriber.get_batch(coalesce_interval=0), timeout=30)
+        return merge_captured_log_data(updates).stdout
+
+    async def _test():
+        first = SubscriberBuffer(max_pending=None)
+        # the test fetches new log data itself instead of watching the files for changes
+        with mock.patch.object(manager, "on_subscribe"), mock.patch.object(
+            manager, "on_unsubscribe"
+        ), mock.patch.object(manager, "subscribe", wraps=manager.subscribe) as subscribe:
+            first_watch = multiplexer.subscribe(manager, log_key, None, first)
+            assert await _get_stdout(first) == b"hello\n"
+
+            with open(stdout_path, "a") as f:
+                f.write("world\n")
+            first_watch.subscription.fetch()
+            assert await _get_stdout(first) == b"world\n"
+
+            # a subscriber that joins later is sent the data that it missed
+            second = SubscriberBuffer(max_pending=None)
+            second_watch = multiplexer.subscribe(manager, log_key, None, second)
+            assert second_watch is first_watch
+            assert subscribe.call_count == 1
+            assert await _get_stdout(second) == b"hello\nworld\n"
+
+            with open(stdout_path, "a") as f:
+                f.write("again\n")
+            first_watch.subscription.fetch()
+            assert await _get_stdout(first) == b"again\n"
+            assert await _get_stdout(second) == b"again\n"
+
+            multiplexer.unsubscribe(first_watch, first)
+            assert multiplexer.num_watches() == 1
+            multiplexer.unsubscribe(second_watch, second)
+            assert multiplexer.num_watches() == 0
+
+    try:
+        asyncio.run(_test())
+    finally:
+        manager.dispose()
+
+
+def test_run_events_after_legacy_offset_cursor():
+    with DagsterInstance.ephemeral() as instance:
+        run = create_run_for_test(instance)
+        _store_engine_event(instance, run.run_id, "event 0")
+        graphene_info = mock.MagicMock()
+        graphene_info.context.instance = instance
+
+        async def _test():
+            # a legacy offset cursor past the stored events is returned unchanged
+            cursor = EventLogCursor.from_offset(1).to_string()
+            events = gen_events_for_run(graphene_info, run.run_id, cursor)
+            result = await asyncio.wait_for(events.__anext__(), timeout=30)
+            assert result.messages == []
+            assert result.cursor == cursor
+
+            next_result = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0.5)
+            _store_engine_event(instance, run.run_id, "event 1")
+            result = await asyncio.wait_for(next_result, timeout=30)
+            assert [message.message for message in result.messages] == ["event 1"]
+            await events.aclose()
+
+        asyncio.run(_test())
+
+
+def test_captured_log_catch_up_does_not_hold_locks(tmpdir):
+    manager = LocalComputeLogManager(str(tmpdir))
+    log_key = ["run_id", "compute_logs", "step"]
+    stdout_path = manager.get_captured_local_path(log_key, "out")
+    ensure_dir(str(tmpdir.join(*log_key[:-1])))
+    with open(stdout_path, "w") as f:
+        f.write("hello\n")
+
+    multiplexer = CapturedLogWatchMultiplexer()
+
+    async def _test():
+        with mock.patch.object(manager, "on_subscribe"), mock.patch.object(
+            manager, "on_unsubscribe"
+        ):
+            first = SubscriberBuffer(max_pending=None)
+            watch = multiplexer.subscribe(manager, log_key, None, first)
+
+            get_log_data = manager.get_log_data
+
+            def _get_log_data(*args, **kwargs):
+                assert not watch.lock.locked()
+                assert not multiplexer._lock.locked()  # noqa: SLF001
+                return get_log_data(*args, **kwargs)
+
+            second = SubscriberBuffer(max_pending=None)
+            with mock.patch.object(manager, "get_log_data", _get_log_data):
+                multiplexer.subscribe(manager, log_key, None, second)
+            updates, _ = await asyncio.wait_for(
+                second.get_batch(coalesce_interval=0), timeout=30
+            )
+            assert merge_captured_log_data(updates).stdout == b"hello\n"
+
+            multiplexer.unsubscribe(watch, first)
+            multiplexer.unsubscribe(watch, second)
+
+    try:
+        asyncio.run(_test())
+    finally:
+        manager.dispose()
+
+
+def test_merge_captured_log_data():
+    merged = merge_captured_log_data(
+        [
+            CapturedLogData(log_key=["foo"], stdout=b"a", stderr=None, cursor="1:0"),
+            CapturedLogData(log_key=["foo"], stdout=b"b", stderr=b"c", cursor="2:1"),
+        ]
+    )
+    assert merged == CapturedLogData(log_key=["foo"], stdout=b"ab", stderr=b"c", cursor="2:1")
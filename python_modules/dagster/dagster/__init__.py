@@ -1,5 +1,4 @@
 import sys
-from types import ModuleType
 
 from . import _module_alias_map
 
@@ -111,9 +110,6 @@
 )
 from dagster._core.definitions.asset_in import AssetIn as AssetIn
 from dagster._core.definitions.asset_out import AssetOut as AssetOut
-from dagster._core.definitions.asset_reconciliation_sensor import (
-    build_asset_reconciliation_sensor as build_asset_reconciliation_sensor,
-)
 from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
 from dagster._core.definitions.asset_sensor_definition import (
     AssetSensorDefinition as AssetSensorDefinition,
@@ -430,19 +426,12 @@
     ExecuteInProcessResult as ExecuteInProcessResult,
 )
 from dagster._core.execution.execute_job_result import ExecuteJobResult as ExecuteJobResult
-from dagster._core.execution.plan.external_step import (
-    external_instance_from_step_run_ref as external_instance_from_step_run_ref,
-    run_step_from_ref as run_step_from_ref,
-    step_context_to_step_run_ref as step_context_to_step_run_ref,
-    step_run_ref_to_step_context as step_run_ref_to_step_context,
-)
 from dagster._core.execution.validate_run_config import validate_run_config as validate_run_config
 from dagster._core.execution.with_resources import with_resources as with_resources
 from dagster._core.executor.base import Executor as Executor
 from dagster._core.executor.init import InitExecutorContext as InitExecutorContext
 from dagster._core.instance import DagsterInstance as DagsterInstance
 from dagster._core.instance_for_test import instance_for_test as instance_for_test
-from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
 from dagster._core.log_manager import DagsterLogManager as DagsterLogManager
 from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
 from dagster._core.storage.file_manager import (
@@ -450,10 +439,6 @@
     LocalFileHandle as LocalFileHandle,
     local_file_manager as local_file_manager,
 )
-from dagster._core.storage.fs_io_manager import (
-    custom_path_fs_io_manager as custom_path_fs_io_manager,
-    fs_io_manager as fs_io_manager,
-)
 from dagster._core.storage.input_manager import (
     InputManager as InputManager,
     input_manager as input_manager,
@@ -480,7 +465,6 @@
     root_input_manager as root_input_manager,
 )
 from dagster._core.storage.tags import MEMOIZED_RUN_TAG as MEMOIZED_RUN_TAG
-from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
 from dagster._core.types.config_schema import (
     DagsterTypeLoader as DagsterTypeLoader,
     dagster_type_loader as dagster_type_loader,
@@ -507,14 +491,14 @@
     serialize_value as serialize_value,
 )
 from dagster._utils import file_relative_path as file_relative_path
-from dagster._utils.alert import (
-    make_email_on_run_failure_sensor as make_email_on_run_failure_sensor,
-)
 from dagster._utils.backcompat import ExperimentalWarning as ExperimentalWarning
 from dagster._utils.dagster_type import check_dagster_type as check_dagster_type
 from dagster._utils.log import get_dagster_logger as get_dagster_logger
 from dagster.version import __version__ as __version__
 
+# the public names imported above, which `__all__` extends with the lazily imported names below
+_EAGER_NAMES = [name for name in globals() if not name.startswith("_")]
+
 # isort: split
 
 # ########################
@@ -535,16 +519,54 @@
 
 from dagster._utils.backcompat import deprecation_warning, rename_warning
 
-# NOTE: Unfortunately we have to declare deprecated aliases twice-- the
-# TYPE_CHECKING declaration satisfies linters and type checkers, but the entry
-# in `_DEPRECATED` is required  for us to generate the deprecation warning.
+# NOTE: Unfortunately we have to declare lazily imported and deprecated names twice-- the
+# TYPE_CHECKING declaration satisfies linters and type checkers, but the entry in `_LAZY` or
+# `_DEPRECATED` is required for us to import the name on first access or to generate the
+# deprecation warning.
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.asset_reconciliation_sensor import (
+        build_asset_reconciliation_sensor as build_asset_reconciliation_sensor,
+    )
+    from dagster._core.execution.plan.external_step import (
+        external_instance_from_step_run_ref as external_instance_from_step_run_ref,
+        run_step_from_ref as run_step_from_ref,
+        step_context_to_step_run_ref as step_context_to_step_run_ref,
+        step_run_ref_to_step_context as step_run_ref_to_step_context,
+    )
+    from dagster._core.launcher.default_run_launcher import (
+        DefaultRunLauncher as DefaultRunLauncher,
+    )
+    from dagster._core.storage.fs_io_manager import (
+        custom_path_fs_io_manager as custom_path_fs_io_manager,
+        fs_io_manager as fs_io_manager,
+    )
+    from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
+    from dagster._utils.alert import (
+        make_email_on_run_failure_sensor as make_email_on_run_failure_sensor,
+    )
+
     ##### EXAMPLE
     # from dagster.some.module import (
     #     Foo as Foo,
     # )
-    pass
+
+
+# Public names whose defining modules are only imported when the name is first accessed, because
+# the modules (or the libraries they depend on) are expensive to import and are not needed by most
+# processes that import dagster, e.g. `dagster api execute_step`.
+_LAZY: Final[Mapping[str, str]] = {
+    "build_asset_reconciliation_sensor": "dagster._core.definitions.asset_reconciliation_sensor",
+    "external_instance_from_step_run_ref": "dagster._core.execution.plan.external_step",
+    "run_step_from_ref": "dagster._core.execution.plan.external_step",
+    "step_context_to_step_run_ref": "dagster._core.execution.plan.external_step",
+    "step_run_ref_to_step_context": "dagster._core.execution.plan.external_step",
+    "DefaultRunLauncher": "dagster._core.launcher.default_run_launcher",
+    "custom_path_fs_io_manager": "dagster._core.storage.fs_io_manager",
+    "fs_io_manager": "dagster._core.storage.fs_io_manager",
+    "UPathIOManager": "dagster._core.storage.upath_io_manager",
+    "make_email_on_run_failure_sensor": "dagster._utils.alert",
+}
 
 
 _DEPRECATED: Final[Mapping[str, TypingTuple[str, str, str]]] = {
@@ -563,7 +585,12 @@
 
 
 def __getattr__(name: str) -> TypingAny:
-    if name in _DEPRECATED:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        # cache the value, so that later accesses don't go through this function
+        globals()[name] = value
+        return value
+    elif name in _DEPRECATED:
         module, breaking_version, additional_warn_text = _DEPRECATED[name]
         value = getattr(importlib.import_module(module), name)
         stacklevel = 3 if sys.version_info >= (3, 7) else 4
@@ -578,5 +605,15 @@ def __getattr__(name: str) -> TypingAny:
         raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-def __dir__(_self: ModuleType) -> Sequence[str]:
-    return [*globals(), *_DEPRECATED.keys(), *_DEPRECATED_RENAMED.keys()]
+# `from dagster import *` only imports the names that are listed here, since it does not go through
+# `__getattr__`
+__all__ = [*_EAGER_NAMES, *_LAZY.keys()]
+
+
+def __dir__() -> Sequence[str]:
+    return [
+        *globals(),
+        *(name for name in _LAZY.keys() if name not in globals()),
+        *_DEPRECATED.keys(),
+        *_DEPRECATED_RENAMED.keys(),
+    ]
@@ -11,6 +11,7 @@
 from dagster._serdes import whitelist_for_serdes
 from dagster._seven import get_import_error_message, import_module_from_path
 from dagster._utils import alter_sys_path, hash_collection
+from dagster._utils.startup_profiler import get_startup_profiler
 
 
 class CodePointer(ABC):
@@ -80,7 +81,8 @@ def load_python_file(python_file: str, working_directory: Optional[str]) -> Modu
         with alter_sys_path(
             to_add=([working_directory] if working_directory else []), to_remove=[script_path]
         ):
-            return import_module_from_path(module_name, python_file)
+            with get_startup_profiler().profile("import", python_file):
+                return import_module_from_path(module_name, python_file)
     except ImportError as ie:
         python_file = os.path.abspath(os.path.expanduser(python_file))
 
@@ -132,7 +134,8 @@ def load_python_module(
         to_add=([working_directory] if working_directory else []), to_remove=remove_paths
     ):
         try:
-            return importlib.import_module(module_name)
+            with get_startup_profiler().profile("import", module_name):
+                return importlib.import_module(module_name)
         except ImportError as ie:
             msg = get_import_error_message(ie)
             if working_directory:
@@ -241,15 +241,45 @@ def get_child_partition_keys_of_parent(
                 "Parent partition key provided, but parent asset is not partitioned."
             )
 
-        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-        child_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
+        child_partitions_subset = self.get_child_partitions_subset(
+            dynamic_partitions_store,
+            parent_asset_key,
             parent_partitions_def.empty_subset().with_partition_keys([parent_partition_key]),
-            downstream_partitions_def=child_partitions_def,
-            dynamic_partitions_store=dynamic_partitions_store,
+            child_asset_key,
         )
 
         return list(child_partitions_subset.get_partition_keys())
 
+    def get_child_partitions_subset(
+        self,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+        parent_asset_key: AssetKey,
+        parent_partitions_subset: PartitionsSubset,
+        child_asset_key: AssetKey,
+    ) -> PartitionsSubset:
+        """Maps a set of partitions of an asset to the partitions of one of its children that depend
+        on them, in a single call to the partition mapping between the two assets.
+
+        Args:
+            parent_asset_key (AssetKey): The asset key of the upstream asset, which the provided
+                partitions belong to.
+            parent_partitions_subset (PartitionsSubset): The partitions to map.
+            child_asset_key (AssetKey): The asset key of the downstream asset. The provided
+                partitions will be mapped to partitions within this asset.
+        """
+        child_partitions_def = self.get_partitions_def(child_asset_key)
+        if child_partitions_def is None:
+            raise DagsterInvalidInvocationError(
+                f"Asset key {child_asset_key} is not partitioned. Cannot get partition keys."
+            )
+
+        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        return partition_mapping.get_downstream_partitions_for_partitions(
+            parent_partitions_subset,
+            downstream_partitions_def=child_partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
+
     def get_parents_partitions(
         self,
         dynamic_partitions_store: DynamicPartitionsStore,
@@ -305,17 +335,48 @@ def get_parent_partition_keys_for_child(
                 f"Asset key {parent_asset_key} is not partitioned. Cannot get partition keys."
             )
 
-        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-        parent_partition_key_subset = partition_mapping.get_upstream_partitions_for_partitions(
+        parent_partition_key_subset = self.get_parent_partitions_subset(
+            dynamic_partitions_store,
+            child_asset_key,
             cast(PartitionsDefinition, child_partitions_def)
             .empty_subset()
             .with_partition_keys([partition_key])
             if partition_key
             else None,
+            parent_asset_key,
+        )
+        return list(parent_partition_key_subset.get_partition_keys())
+
+    def get_parent_partitions_subset(
+        self,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+        child_asset_key: AssetKey,
+        child_partitions_subset: Optional[PartitionsSubset],
+        parent_asset_key: AssetKey,
+    ) -> PartitionsSubset:
+        """Maps a set of partitions of an asset to the partitions of one of its parents that they
+        depend on, in a single call to the partition mapping between the two assets.
+
+        Args:
+            child_asset_key (AssetKey): The asset key of the downstream asset, which the provided
+                partitions belong to.
+            child_partitions_subset (Optional[PartitionsSubset]): The partitions to map, or None if
+                the downstream asset is not partitioned.
+            parent_asset_key (AssetKey): The asset key of the upstream asset. The provided
+                partitions will be mapped to partitions within this asset.
+        """
+        parent_partitions_def = self.get_partitions_def(parent_asset_key)
+        if parent_partitions_def is None:
+            raise DagsterInvalidInvocationError(
+                f"Asset key {parent_asset_key} is not partitioned. Cannot get partition keys."
+            )
+
+        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        return partition_mapping.get_upstream_partitions_for_partitions(
+            child_partitions_subset,
             upstream_partitions_def=parent_partitions_def,
             dynamic_partitions_store=dynamic_partitions_store,
         )
-        return list(parent_partition_key_subset.get_partition_keys())
 
     def is_source(self, asset_key: AssetKey) -> bool:
         return asset_key in self.source_asset_keys or asset_key not in self.all_asset_keys
@@ -375,6 +436,15 @@ def toposort_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
             {key for key in level} for level in toposort.toposort(self._asset_dep_graph["upstream"])
         ]
 
+    @cached_method
+    def toposort_level_by_asset_key(self) -> Mapping[AssetKey, int]:
+        """Returns the index of the level of toposort_asset_keys that each asset key is in."""
+        return {
+            asset_key: i
+            for i, asset_keys in enumerate(self.toposort_asset_keys())
+            for asset_key in asset_keys
+        }
+
     @cached_method
     def get_downstream_freshness_policies(
         self, *, asset_key: AssetKey
@@ -400,76 +470,127 @@ def bfs_filter_subsets(
         dynamic_partitions_store: DynamicPartitionsStore,
         condition_fn: Callable[[AssetKey, Optional[PartitionsSubset]], bool],
         initial_subset: "AssetGraphSubset",
+        within_subset: Optional["AssetGraphSubset"] = None,
     ) -> "AssetGraphSubset":
         """Returns asset partitions within the graph that satisfy supplied criteria.
 
         - Are >= initial_asset_partitions
         - Asset matches the condition_fn
         - Any of their ancestors >= initial_asset_partitions match the condition_fn.
+        - If within_subset is provided, are within it, as are the ancestors they were reached
+          through.
 
-        Visits parents before children.
+        Partitions move through the graph as a PartitionsSubset per asset rather than one at a
+        time. Assets are visited in topological order, so each asset is visited once, after all of
+        its parents, with the union of the partitions reached through any of them.
         """
         from .asset_graph_subset import AssetGraphSubset
 
-        all_assets = set(initial_subset.asset_keys)
-        check.invariant(
-            len(initial_subset.asset_keys) == 1, "Multiple initial assets not yet supported"
-        )
-        initial_asset_key = next(iter(initial_subset.asset_keys))
-        queue = deque([initial_asset_key])
-
         queued_subsets_by_asset_key: Dict[AssetKey, Optional[PartitionsSubset]] = {
-            initial_asset_key: initial_subset.get_partitions_subset(initial_asset_key)
-            if self.get_partitions_def(initial_asset_key)
-            else None,
+            asset_key: initial_subset.get_partitions_subset(asset_key)
+            if self.get_partitions_def(asset_key)
+            else None
+            for asset_key in initial_subset.asset_keys
         }
-        result = AssetGraphSubset(self)
+        partitions_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+        non_partitioned_asset_keys: Set[AssetKey] = set()
+
+        # a child is always at a later level than its parents, so it is only popped from the queue
+        # once all of its parents have been visited
+        toposort_level_by_asset_key = self.toposort_level_by_asset_key()
+        queue = [
+            (toposort_level_by_asset_key[asset_key], asset_key)
+            for asset_key in queued_subsets_by_asset_key
+        ]
+        heapify(queue)
 
-        while len(queue) > 0:
-            asset_key = queue.popleft()
-            partitions_subset = queued_subsets_by_asset_key.get(asset_key)
-
-            if condition_fn(asset_key, partitions_subset):
-                result |= AssetGraphSubset(
-                    self,
-                    non_partitioned_asset_keys={asset_key} if partitions_subset is None else set(),
-                    partitions_subsets_by_asset_key={asset_key: partitions_subset}
-                    if partitions_subset is not None
-                    else {},
+        while queue:
+            _, asset_key = heappop(queue)
+            partitions_subset = queued_subsets_by_asset_key.pop(asset_key)
+            if partitions_subset is None:
+                if (
+                    within_subset is not None
+                    and asset_key not in within_subset.non_partitioned_asset_keys
+                ):
+                    continue
+            else:
+                partitions_subset = self._close_partitions_subset_over_self_dependency(
+                    dynamic_partitions_store,
+                    asset_key,
+                    partitions_subset,
+                    within_subset.get_partitions_subset(asset_key)
+                    if within_subset is not None
+                    else None,
                 )
+                if within_subset is not None and len(partitions_subset) == 0:
+                    continue
 
-                for child in self.get_children(asset_key):
-                    partition_mapping = self.get_partition_mapping(child, asset_key)
-                    child_partitions_def = self.get_partitions_def(child)
-
-                    if child_partitions_def:
-                        if partitions_subset is None:
-                            child_partitions_subset = (
-                                child_partitions_def.subset_with_all_partitions()
-                            )
-                            queued_subsets_by_asset_key[child] = child_partitions_subset
-                        else:
-                            child_partitions_subset = (
-                                partition_mapping.get_downstream_partitions_for_partitions(
-                                    partitions_subset,
-                                    downstream_partitions_def=child_partitions_def,
-                                    dynamic_partitions_store=dynamic_partitions_store,
-                                )
-                            )
-                            prior_child_partitions_subset = queued_subsets_by_asset_key.get(child)
-                            queued_subsets_by_asset_key[child] = (
-                                child_partitions_subset
-                                if not prior_child_partitions_subset
-                                else child_partitions_subset | prior_child_partitions_subset
-                            )
-                    else:
-                        child_partitions_subset = None
-
-                    if child not in all_assets:
-                        queue.append(child)
-                        all_assets.add(child)
+            if not condition_fn(asset_key, partitions_subset):
+                continue
 
-        return result
+            if partitions_subset is None:
+                non_partitioned_asset_keys.add(asset_key)
+            else:
+                partitions_subsets_by_asset_key[asset_key] = partitions_subset
+
+            for child in self.get_children(asset_key):
+                if child == asset_key:
+                    continue
+
+                child_partitions_def = self.get_partitions_def(child)
+                if child_partitions_def is None:
+                    child_partitions_subset = None
+                elif partitions_subset is None:
+                    child_partitions_subset = child_partitions_def.subset_with_all_partitions(
+                        dynamic_partitions_store=dynamic_partitions_store
+                    )
+                else:
+                    child_partitions_subset = self.get_child_partitions_subset(
+                        dynamic_partitions_store, asset_key, partitions_subset, child
+                    )
+
+                if child not in queued_subsets_by_asset_key:
+                    heappush(queue, (toposort_level_by_asset_key[child], child))
+                prior_child_partitions_subset = queued_subsets_by_asset_key.get(child)
+                queued_subsets_by_asset_key[child] = (
+                    child_partitions_subset | prior_child_partitions_subset
+                    if child_partitions_subset is not None and prior_child_partitions_subset
+                    else child_partitions_subset
+                )
+
+        return AssetGraphSubset(self, partitions_subsets_by_asset_key, non_partitioned_asset_keys)
+
+    def _close_partitions_subset_over_self_dependency(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        asset_key: AssetKey,
+        partitions_subset: PartitionsSubset,
+        within_partitions_subset: Optional[PartitionsSubset],
+    ) -> PartitionsSubset:
+        """Restricts the subset to within_partitions_subset, if provided, and then, if the asset
+        depends on itself, adds the partitions that depend on the subset's partitions, and the
+        partitions that depend on those, and so on.
+        """
+        if within_partitions_subset is not None:
+            partitions_subset = partitions_subset & within_partitions_subset
+
+        if not self.has_self_dependency(asset_key):
+            return partitions_subset
+
+        # only map the partitions added in the previous round, so that each partition is mapped once
+        frontier = partitions_subset
+        while len(frontier) > 0:
+            frontier = (
+                self.get_child_partitions_subset(
+                    dynamic_partitions_store, asset_key, frontier, asset_key
+                )
+                - partitions_subset
+            )
+            if within_partitions_subset is not None:
+                frontier = frontier & within_partitions_subset
+            partitions_subset = partitions_subset | frontier
+
+        return partitions_subset
 
     def bfs_filter_asset_partitions(
         self,
@@ -587,12 +708,7 @@ def __lt__(self, other: object) -> bool:
 
     def __init__(self, asset_graph: AssetGraph, items: Iterable[AssetKeyPartitionKey]):
         self._asset_graph = asset_graph
-        toposorted_asset_keys = asset_graph.toposort_asset_keys()
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(toposorted_asset_keys)
-            for asset_key in asset_keys
-        }
+        self._toposort_level_by_asset_key = asset_graph.toposort_level_by_asset_key()
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
@@ -272,10 +272,9 @@ def find_parent_materialized_asset_partitions(
         if latest_record is None:
             continue
 
-        for child in asset_graph.get_children_partitions(
-            instance_queryer,
-            asset_key,
-            latest_record.partition_key,
+        for child in instance_queryer.get_children_partitions(
+            asset_graph=asset_graph,
+            asset_partition=AssetKeyPartitionKey(asset_key, latest_record.partition_key),
         ):
             if (
                 child.asset_key in target_asset_keys
@@ -305,12 +304,8 @@ def find_parent_materialized_asset_partitions(
                     # we are mapping from the partitions of the parent asset to the partitions of
                     # the child asset
                     partition_mapping = asset_graph.get_partition_mapping(child, asset_key)
-                    child_partitions_subset = (
-                        partition_mapping.get_downstream_partitions_for_partitions(
-                            partitions_subset,
-                            downstream_partitions_def=child_partitions_def,
-                            dynamic_partitions_store=instance_queryer,
-                        )
+                    child_partitions_subset = asset_graph.get_child_partitions_subset(
+                        instance_queryer, asset_key, partitions_subset, child
                     )
                     for child_partition in child_partitions_subset.get_partition_keys():
                         # we need to see if the child was materialized in the same run, but this is
@@ -514,10 +509,8 @@ def parents_will_be_reconciled(
                 )
                 or (instance_queryer.is_reconciled(asset_partition=parent, asset_graph=asset_graph))
             )
-            for parent in asset_graph.get_parents_partitions(
-                instance_queryer,
-                candidate.asset_key,
-                candidate.partition_key,
+            for parent in instance_queryer.get_parents_partitions(
+                asset_graph=asset_graph, asset_partition=candidate
             )
         )
 
@@ -638,6 +631,16 @@ def determine_asset_partitions_to_reconcile_for_freshness(
     # get the set of asset keys we're allowed to execute
     target_asset_keys = target_asset_selection.resolve(asset_graph)
 
+    # calculate the current data times of every asset with a downstream freshness policy at once
+    current_data_time_by_key = data_time_resolver.get_current_data_time_by_key(
+        asset_keys=[
+            key
+            for key in asset_graph.non_source_asset_keys
+            if asset_graph.get_downstream_freshness_policies(asset_key=key)
+        ],
+        current_time=evaluation_time,
+    )
+
     # now we have a full set of constraints, we can find solutions for them as we move down
     to_materialize: Set[AssetKeyPartitionKey] = set()
     eventually_materialize: Set[AssetKeyPartitionKey] = set()
@@ -650,7 +653,7 @@ def determine_asset_partitions_to_reconcile_for_freshness(
                 continue
 
             # figure out the current contents of this asset with respect to its constraints
-            current_data_time = data_time_resolver.get_current_data_time(key, evaluation_time)
+            current_data_time = current_data_time_by_key[key]
 
             # figure out the expected data time of this asset if it were to be executed on this tick
             expected_data_time = min(
@@ -1,5 +1,5 @@
 import datetime
-from typing import AbstractSet, Dict, Mapping, Optional, Sequence, Tuple, cast
+from typing import AbstractSet, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple, cast
 
 import pendulum
 
@@ -212,10 +212,10 @@ def _calculate_data_time_by_key_unpartitioned(
             else:
                 return {}
 
-        data_time_by_key = {}
+        data_time_by_key: Dict[AssetKey, Optional[datetime.datetime]] = {}
         for parent_key, parent_record in upstream_records_by_key.items():
             # recurse to find the data times of this parent
-            for upstream_key, data_time in self._calculate_data_time_by_key(
+            parent_data_time_by_key = self._calculate_data_time_by_key(
                 asset_key=parent_key,
                 record_id=parent_record.storage_id,
                 record_timestamp=parent_record.event_log_entry.timestamp,
@@ -230,14 +230,21 @@ def _calculate_data_time_by_key_unpartitioned(
                     or {}
                 ),
                 current_time=current_time,
-            ).items():
+            )
+            if not data_time_by_key:
+                # nothing to merge with, and copying a dict avoids rehashing its keys, which adds
+                # up on wide graphs where every asset has many upstream roots
+                data_time_by_key.update(parent_data_time_by_key)
+                continue
+
+            for upstream_key, data_time in parent_data_time_by_key.items():
                 # if root data is missing, this overrides other values
                 if data_time is None:
                     data_time_by_key[upstream_key] = None
                 else:
-                    data_time_by_key[upstream_key] = min(
-                        data_time_by_key.get(upstream_key, data_time), data_time
-                    )
+                    existing_data_time = data_time_by_key.get(upstream_key, data_time)
+                    if data_time <= existing_data_time:
+                        data_time_by_key[upstream_key] = data_time
 
         return data_time_by_key
 
@@ -479,6 +486,57 @@ def get_current_data_time(
 
         return min(cast(AbstractSet[datetime.datetime], data_times))
 
+    def get_current_data_time_by_key(
+        self, asset_keys: Iterable[AssetKey], current_time: datetime.datetime
+    ) -> Mapping[AssetKey, Optional[datetime.datetime]]:
+        """Returns the current data time of each of the given assets.
+
+        The latest materialization records of the given assets and of every non-source asset
+        upstream of them are fetched in a single batch, and data times are then calculated in
+        topological order. This way, the data times of the parents of an asset have already been
+        calculated by the time they are needed for the asset itself, instead of being calculated
+        recursively.
+        """
+        asset_keys = list(asset_keys)
+        upstream_keys = self._get_non_source_upstream_keys(asset_keys)
+        self._instance_queryer.prefetch_asset_records(
+            [key for key in upstream_keys if not self._instance_queryer.has_asset_record(key)]
+        )
+
+        data_time_by_key: Dict[AssetKey, Optional[datetime.datetime]] = {}
+        for level in self._asset_graph.toposort_asset_keys():
+            for asset_key in level:
+                if asset_key in upstream_keys:
+                    data_time_by_key[asset_key] = self.get_current_data_time(
+                        asset_key, current_time=current_time
+                    )
+        return {
+            asset_key: data_time_by_key[asset_key]
+            if asset_key in data_time_by_key
+            else self.get_current_data_time(asset_key, current_time=current_time)
+            for asset_key in asset_keys
+        }
+
+    def _get_non_source_upstream_keys(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> AbstractSet[AssetKey]:
+        """Returns the given keys along with all non-source asset keys upstream of them."""
+        upstream_keys: Set[AssetKey] = set()
+        to_visit = [
+            asset_key for asset_key in asset_keys if not self._asset_graph.is_source(asset_key)
+        ]
+        while to_visit:
+            asset_key = to_visit.pop()
+            if asset_key in upstream_keys:
+                continue
+            upstream_keys.add(asset_key)
+            to_visit.extend(
+                parent_key
+                for parent_key in self._asset_graph.get_parents(asset_key)
+                if parent_key not in upstream_keys and not self._asset_graph.is_source(parent_key)
+            )
+        return upstream_keys
+
     def get_current_minutes_late(
         self,
         asset_key: AssetKey,
@@ -494,3 +552,27 @@ def get_current_minutes_late(
             data_time=self.get_current_data_time(asset_key, current_time=evaluation_time),
             evaluation_time=evaluation_time,
         )
+
+    def get_current_minutes_late_by_key(
+        self,
+        asset_keys: Iterable[AssetKey],
+        evaluation_time: datetime.datetime,
+    ) -> Mapping[AssetKey, Optional[float]]:
+        """Returns the current minutes late of each of the given assets, calculating their data
+        times together with get_current_data_time_by_key.
+        """
+        asset_keys = list(asset_keys)
+        freshness_policies_by_key = self._asset_graph.freshness_policies_by_key
+        for asset_key in asset_keys:
+            if freshness_policies_by_key.get(asset_key) is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot calculate minutes late for asset without a FreshnessPolicy"
+                )
+
+        data_time_by_key = self.get_current_data_time_by_key(asset_keys, evaluation_time)
+        return {
+            asset_key: check.not_none(freshness_policies_by_key[asset_key]).minutes_late(
+                data_time=data_time_by_key[asset_key], evaluation_time=evaluation_time
+            )
+            for asset_key in asset_keys
+        }
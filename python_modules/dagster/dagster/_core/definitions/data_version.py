@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from collections import OrderedDict
 from enum import Enum
 from hashlib import sha256
@@ -29,6 +30,7 @@
         AssetMaterialization,
         AssetObservation,
     )
+    from dagster._core.event_api import EventLogRecord
     from dagster._core.events.log import EventLogEntry
     from dagster._core.instance import DagsterInstance
 
@@ -257,12 +259,14 @@ class StaleCause(NamedTuple):
 class CachingStaleStatusResolver:
     """Used to resolve data version information. Avoids redundant database
     calls that would otherwise occur. Intended for use within the scope of a
-    single "request" (e.g. GQL request, RunRequest resolution).
+    single "request" (e.g. GQL request, RunRequest resolution), or shared
+    between requests for as long as no new events are stored.
     """
 
     _instance: "DagsterInstance"
     _asset_graph: Optional["AssetGraph"]
     _asset_graph_load_fn: Optional[Callable[[], "AssetGraph"]]
+    _latest_materialization_records_by_key: Dict["AssetKey", Optional["EventLogRecord"]]
 
     def __init__(
         self,
@@ -278,6 +282,10 @@ def __init__(
         else:
             self._asset_graph = None
             self._asset_graph_load_fn = asset_graph
+        self._latest_materialization_records_by_key = {}
+        # guards the lazily loaded asset graph and materialization records when the resolver is
+        # shared between threads; reentrant, since fetching records loads the asset graph
+        self._lock = threading.RLock()
 
     def get_status(self, key: AssetKey) -> StaleStatus:
         return self._get_status(key=key)
@@ -406,16 +414,18 @@ def _gather_leaves(self, cause: StaleCause, level: int = 0) -> Iterator[Tuple[in
 
     @property
     def asset_graph(self) -> "AssetGraph":
-        if self._asset_graph is None:
-            self._asset_graph = check.not_none(self._asset_graph_load_fn)()
-        return self._asset_graph
+        with self._lock:
+            if self._asset_graph is None:
+                self._asset_graph = check.not_none(self._asset_graph_load_fn)()
+            return self._asset_graph
 
     @cached_method
     def _get_current_data_version(self, *, key: AssetKey) -> DataVersion:
         is_source = self.asset_graph.is_source(key)
-        event = self._instance.get_latest_data_version_record(
-            key,
-            is_source,
+        event = (
+            self._instance.get_latest_data_version_record(key, is_source)
+            if is_source
+            else self._get_latest_materialization_record(key)
         )
         if event is None and is_source:
             return DEFAULT_DATA_VERSION
@@ -427,7 +437,37 @@ def _get_current_data_version(self, *, key: AssetKey) -> DataVersion:
 
     @cached_method
     def _get_latest_materialization_event(self, *, key: AssetKey) -> Optional[EventLogEntry]:
-        return self._instance.get_latest_materialization_event(key)
+        record = self._get_latest_materialization_record(key)
+        return record.event_log_entry if record else None
+
+    def _get_latest_materialization_record(self, key: AssetKey) -> Optional[EventLogRecord]:
+        with self._lock:
+            if key not in self._latest_materialization_records_by_key:
+                self._fetch_latest_materialization_records(key)
+            return self._latest_materialization_records_by_key[key]
+
+    def _fetch_latest_materialization_records(self, key: AssetKey) -> None:
+        # The status of an asset depends on the latest materializations of the assets upstream of
+        # it, so fetch them all with a single read of the asset records, which hold the latest
+        # materialization of each asset.
+        keys = [key]
+        if key in self.asset_graph.all_asset_keys:
+            keys.extend(
+                upstream_key
+                for upstream_key in self.asset_graph.upstream_key_iterator(key)
+                if not self.asset_graph.is_source(upstream_key)
+                and upstream_key not in self._latest_materialization_records_by_key
+            )
+
+        # records are only stored once they are all fetched, so that a resolver that is shared
+        # between threads never exposes a partially fetched batch
+        records_by_key: Dict[AssetKey, Optional[EventLogRecord]] = {
+            asset_key: None for asset_key in keys
+        }
+        for asset_record in self._instance.get_asset_records(keys):
+            asset_entry = asset_record.asset_entry
+            records_by_key[asset_entry.asset_key] = asset_entry.last_materialization_record
+        self._latest_materialization_records_by_key.update(records_by_key)
 
     @cached_method
     def _get_current_data_provenance(self, *, key: AssetKey) -> Optional[DataProvenance]:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Callable, Dict, Mapping, NamedTuple, Optional, cast
+from typing import TYPE_CHECKING, Callable, Mapping, NamedTuple, Optional, cast
 
 import pendulum
 
@@ -240,18 +240,18 @@ def _wrapped_fn(context: SensorEvaluationContext):
                 context.cursor
             ).minutes_late_by_key
 
-            minutes_late_by_key: Dict[AssetKey, Optional[float]] = {}
-            for asset_key in monitored_keys:
-                freshness_policy = asset_graph.freshness_policies_by_key.get(asset_key)
-                if freshness_policy is None:
-                    continue
-
-                # get the current minutes_late value for this asset
-                minutes_late_by_key[asset_key] = data_time_resolver.get_current_minutes_late(
-                    evaluation_time=evaluation_time,
-                    asset_key=asset_key,
-                )
+            freshness_policies_by_key = {
+                asset_key: asset_graph.freshness_policies_by_key[asset_key]
+                for asset_key in monitored_keys
+                if asset_graph.freshness_policies_by_key.get(asset_key) is not None
+            }
 
+            # get the current minutes_late value for all monitored assets at once
+            minutes_late_by_key = data_time_resolver.get_current_minutes_late_by_key(
+                asset_keys=freshness_policies_by_key.keys(),
+                evaluation_time=evaluation_time,
+            )
+            for asset_key, freshness_policy in freshness_policies_by_key.items():
                 with user_code_error_boundary(
                     FreshnessPolicySensorExecutionError,
                     lambda: f'Error occurred during the execution of sensor "{name}".',
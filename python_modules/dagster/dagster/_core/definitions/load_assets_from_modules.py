@@ -8,6 +8,7 @@
 import dagster._check as check
 from dagster._core.definitions.freshness_policy import FreshnessPolicy
 from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._utils.startup_profiler import get_startup_profiler
 
 from .assets import AssetsDefinition
 from .cacheable_assets import CacheableAssetsDefinition
@@ -281,7 +282,9 @@ def _find_modules_in_package(package_module: ModuleType) -> Iterable[ModuleType]
     package_path = package_module.__file__
     if package_path:
         for _, modname, is_pkg in pkgutil.walk_packages([os.path.dirname(package_path)]):
-            submodule = import_module(f"{package_module.__name__}.{modname}")
+            submodule_name = f"{package_module.__name__}.{modname}"
+            with get_startup_profiler().profile("import", submodule_name):
+                submodule = import_module(submodule_name)
             if is_pkg:
                 yield from _find_modules_in_package(submodule)
             else:
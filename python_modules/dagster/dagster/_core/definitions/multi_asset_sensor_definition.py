@@ -50,6 +50,9 @@
 
 MAX_NUM_UNCONSUMED_EVENTS = 25
 
+# maximum number of unconsumed events that are fetched with a single query
+UNCONSUMED_EVENTS_FETCH_BATCH_SIZE = 1000
+
 
 class MultiAssetSensorAssetCursorComponent(
     NamedTuple(
@@ -268,15 +271,19 @@ def _cache_initial_unconsumed_events(self) -> None:
         if self._fetched_initial_unconsumed_events:
             return
 
-        for asset_key in self._monitored_asset_keys:
+        unconsumed_event_ids = [
+            event_id
+            for asset_key in self._monitored_asset_keys
+            for event_id in self._get_cursor(
+                asset_key
+            ).trailing_unconsumed_partitioned_event_ids.values()
+        ]
+        # fetch the unconsumed events of every monitored asset together, in bounded batches
+        for i in range(0, len(unconsumed_event_ids), UNCONSUMED_EVENTS_FETCH_BATCH_SIZE):
             event_records = self.instance.get_event_records(
                 EventRecordsFilter(
                     event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                    storage_ids=list(
-                        self._get_cursor(
-                            asset_key
-                        ).trailing_unconsumed_partitioned_event_ids.values()
-                    ),
+                    storage_ids=unconsumed_event_ids[i : i + UNCONSUMED_EVENTS_FETCH_BATCH_SIZE],
                 )
             )
             self._initial_unconsumed_events_by_id.update(
@@ -347,6 +354,9 @@ def update_cursor_after_evaluation(self) -> None:
             self._cursor = new_cursor
             self._unpacked_cursor = MultiAssetSensorContextCursor(new_cursor, self)
             self._cursor_advance_state_mutation = MultiAssetSensorCursorAdvances()
+            # the unconsumed events to fetch depend on the cursor
+            self._initial_unconsumed_events_by_id = {}
+            self._fetched_initial_unconsumed_events = False
 
     @public
     def latest_materialization_records_by_key(
@@ -365,9 +375,6 @@ def latest_materialization_records_by_key(
             materialization event for the asset. If there is no materialization event for the asset,
             the value in the mapping will be None.
         """
-        from dagster._core.events import DagsterEventType
-        from dagster._core.storage.event_log.base import EventRecordsFilter
-
         # Do not evaluate unconsumed events, only events newer than the cursor
         # if there are no new events after the cursor, the cursor points to the most
         # recent event.
@@ -377,19 +384,16 @@ def latest_materialization_records_by_key(
         else:
             asset_keys = check.opt_sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
 
-        asset_event_records = {}
-        for a in asset_keys:
-            event_records = self.instance.get_event_records(
-                EventRecordsFilter(
-                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                    asset_key=a,
-                    after_cursor=self._get_cursor(a).latest_consumed_event_id,
-                ),
-                ascending=False,
-                limit=1,
-            )
-
-            asset_event_records[a] = next(iter(event_records), None)
+        asset_event_records: Dict[AssetKey, Optional["EventLogRecord"]] = {
+            asset_key: None for asset_key in asset_keys
+        }
+        for event_record in self.instance.get_latest_materialization_records_after_cursors(
+            {
+                asset_key: self._get_cursor(asset_key).latest_consumed_event_id
+                for asset_key in asset_keys
+            }
+        ):
+            asset_event_records[check.not_none(event_record.asset_key)] = event_record
 
         return asset_event_records
 
@@ -471,9 +475,6 @@ def my_sensor(context):
                 # returns {"2022-07-05": EventLogRecord(...)}
 
         """
-        from dagster._core.events import DagsterEventType
-        from dagster._core.storage.event_log.base import EventLogRecord, EventRecordsFilter
-
         asset_key = check.inst_param(asset_key, "asset_key", AssetKey)
 
         if asset_key not in self._assets_by_key:
@@ -493,6 +494,23 @@ def my_sensor(context):
             else list(partitions_def.get_partition_keys(dynamic_partitions_store=self.instance))
         )
 
+        partition_materializations = self.instance.get_latest_materialization_records_after_cursors(
+            {asset_key: self._get_cursor(asset_key).latest_consumed_event_id},
+            by_partition=True,
+            asset_partitions=partitions_to_fetch,
+        )
+        return self._get_latest_materialization_records_by_partition(
+            asset_key, partitions_to_fetch, partition_materializations
+        )
+
+    def _get_latest_materialization_records_by_partition(
+        self,
+        asset_key: AssetKey,
+        partitions_to_fetch: Sequence[str],
+        partition_materializations: Iterable["EventLogRecord"],
+    ) -> Mapping[str, "EventLogRecord"]:
+        from dagster._core.storage.event_log.base import EventLogRecord
+
         # Retain ordering of materializations
         materialization_by_partition: Dict[str, EventLogRecord] = OrderedDict()
 
@@ -512,15 +530,6 @@ def my_sensor(context):
                 # Add partition and materialization to the end of the OrderedDict
                 materialization_by_partition[partition] = unconsumed_event
 
-        partition_materializations = self.instance.get_event_records(
-            EventRecordsFilter(
-                event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                asset_key=asset_key,
-                asset_partitions=partitions_to_fetch,
-                after_cursor=self._get_cursor(asset_key).latest_consumed_event_id,
-            ),
-            ascending=True,
-        )
         for materialization in partition_materializations:
             partition = materialization.partition_key
 
@@ -564,9 +573,30 @@ def latest_materialization_records_by_partition_and_asset(
             str, Dict[AssetKey, "EventLogRecord"]
         ] = defaultdict(dict)
 
+        partitions_to_fetch = list(
+            partitions_defs[0].get_partition_keys(dynamic_partitions_store=self.instance)
+        )
+        # fetch the latest materializations of every monitored asset together
+        partition_materializations_by_asset_key: Dict[
+            AssetKey, List["EventLogRecord"]
+        ] = defaultdict(list)
+        for materialization in self.instance.get_latest_materialization_records_after_cursors(
+            {
+                asset_key: self._get_cursor(asset_key).latest_consumed_event_id
+                for asset_key in self._monitored_asset_keys
+            },
+            by_partition=True,
+            asset_partitions=partitions_to_fetch,
+        ):
+            partition_materializations_by_asset_key[
+                check.not_none(materialization.asset_key)
+            ].append(materialization)
+
         for asset_key in self._monitored_asset_keys:
-            materialization_by_partition = self.latest_materialization_records_by_partition(
-                asset_key
+            materialization_by_partition = self._get_latest_materialization_records_by_partition(
+                asset_key,
+                partitions_to_fetch,
+                partition_materializations_by_asset_key[asset_key],
             )
             for partition, materialization in materialization_by_partition.items():
                 asset_and_materialization_tuple_by_partition[partition][asset_key] = materialization
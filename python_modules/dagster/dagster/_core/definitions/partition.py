@@ -972,6 +972,22 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_cov]":
             return self
         return self.with_partition_keys(other.get_partition_keys())
 
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_cov]":
+        if self is other:
+            return self
+        return self.partitions_def.empty_subset().with_partition_keys(
+            partition_key for partition_key in self.get_partition_keys() if partition_key in other
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_cov]":
+        if self is other:
+            return self.partitions_def.empty_subset()
+        return self.partitions_def.empty_subset().with_partition_keys(
+            partition_key
+            for partition_key in self.get_partition_keys()
+            if partition_key not in other
+        )
+
     @abstractmethod
     def serialize(self) -> str:
         ...
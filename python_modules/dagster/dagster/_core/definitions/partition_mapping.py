@@ -844,6 +844,15 @@ def _get_dependency_partitions_subset(
         unmapped_b_dim_names = list(
             set(b_dimension_partitions_def_by_name.keys()) - set(mapped_b_dim_names)
         )
+        b_dim_names = mapped_b_dim_names + unmapped_b_dim_names
+        # every partition of an unmapped dimension is a dependency, so fetch them once rather than
+        # once per partition key
+        unmapped_b_dim_keys = [
+            b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+            for dim_name in unmapped_b_dim_names
+        ]
 
         for key in a_partition_keys:
             for b_key_values in itertools.product(
@@ -853,18 +862,10 @@ def _get_dependency_partitions_subset(
                         for dim_name in mapped_a_dim_names
                     ]
                 ),
-                *[
-                    b_dimension_partitions_def_by_name[dim_name].get_partition_keys()
-                    for dim_name in unmapped_b_dim_names
-                ],
+                *unmapped_b_dim_keys,
             ):
                 b_partition_keys.add(
-                    MultiPartitionKey(
-                        {
-                            (mapped_b_dim_names + unmapped_b_dim_names)[i]: key
-                            for i, key in enumerate(b_key_values)
-                        }
-                    )
+                    MultiPartitionKey({b_dim_names[i]: key for i, key in enumerate(b_key_values)})
                 )
 
         return b_partitions_def.empty_subset().with_partition_keys(b_partition_keys)
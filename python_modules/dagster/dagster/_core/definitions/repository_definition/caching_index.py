@@ -12,6 +12,7 @@
 
 import dagster._check as check
 from dagster._core.errors import DagsterInvariantViolationError
+from dagster._utils.startup_profiler import get_startup_profiler
 
 from .valid_definitions import T_RepositoryLevelDefinition
 
@@ -93,6 +94,15 @@ def get_definition_names(self) -> Sequence[str]:
         self._definition_names = list(self._definitions.keys()) + lazy_names
         return self._definition_names
 
+    def get_unconstructed_definition_names(self) -> Sequence[str]:
+        """Names of the lazily constructed definitions that have not been constructed yet."""
+        return [
+            definition_name
+            for definition_name in self.get_definition_names()
+            if definition_name not in self._definition_cache
+            and not isinstance(self._definitions.get(definition_name), self._definition_class)
+        ]
+
     def has_definition(self, definition_name: str) -> bool:
         check.str_param(definition_name, "definition_name")
 
@@ -134,7 +144,10 @@ def get_definition(self, definition_name: str) -> T_RepositoryLevelDefinition:
             self._definition_cache[definition_name] = self._validation_fn(definition_source)
             return definition_source
         else:
-            definition = cast(Callable, definition_source)()
+            with get_startup_profiler().profile(
+                "definition", f"{self._definition_kind} {definition_name}"
+            ):
+                definition = cast(Callable, definition_source)()
             self._validate_and_cache_definition(definition, definition_name)
             return definition
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
@@ -455,6 +456,36 @@ def has_job(self, job_name: str) -> bool:
     def get_top_level_resources(self) -> Mapping[str, ResourceDefinition]:
         return self._top_level_resources
 
+    def load_all_definitions(self, max_workers: int = 1) -> None:
+        """Constructs every lazily defined definition in the repository.
+
+        Args:
+            max_workers (int): Maximum number of lazily defined pipelines and jobs that are
+                constructed concurrently. Defaults to 1, constructing them one after another.
+        """
+        check.int_param(max_workers, "max_workers")
+        if max_workers > 1:
+            unconstructed = [
+                (index, definition_name)
+                for index in (self._pipelines, self._jobs)
+                for definition_name in index.get_unconstructed_definition_names()
+            ]
+            if len(unconstructed) > 1:
+                # each definition is cached in its index under its own name, so constructing
+                # different definitions from multiple threads is safe. Schedules and sensors are
+                # left to the sequential pass below, since validating them reads every job.
+                with ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="load_definitions"
+                ) as executor:
+                    futures = [
+                        executor.submit(index.get_definition, definition_name)
+                        for index, definition_name in unconstructed
+                    ]
+                    for future in futures:
+                        future.result()
+
+        super().load_all_definitions()
+
     def get_all_pipelines(self) -> Sequence[PipelineDefinition]:
         """Return all pipelines/jobs in the repository as a list.
 
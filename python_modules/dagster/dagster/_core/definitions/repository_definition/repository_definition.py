@@ -125,9 +125,12 @@ def name(self) -> str:
     def description(self) -> Optional[str]:
         return self._description
 
-    def load_all_definitions(self):
+    def load_all_definitions(self, max_workers: int = 1):
         # force load of all lazy constructed code artifacts
-        self._repository_data.load_all_definitions()
+        if max_workers > 1 and isinstance(self._repository_data, CachingRepositoryData):
+            self._repository_data.load_all_definitions(max_workers=max_workers)
+        else:
+            self._repository_data.load_all_definitions()
 
     @property
     def pipeline_names(self) -> Sequence[str]:
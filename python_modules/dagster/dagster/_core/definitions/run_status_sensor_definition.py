@@ -1,13 +1,18 @@
 import logging
+import threading
+import time
 import warnings
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Callable,
+    Dict,
     Iterator,
+    Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Union,
     cast,
     overload,
@@ -27,9 +32,9 @@
     RunStatusSensorExecutionError,
     user_code_error_boundary,
 )
-from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent
+from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent, DagsterEventType
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
 from dagster._serdes import (
     serialize_value,
     whitelist_for_serdes,
@@ -64,6 +69,7 @@
         JobSelector,
         RepositorySelector,
     )
+    from dagster._core.event_api import EventLogRecord
 
 RunStatusSensorEvaluationFunction: TypeAlias = Union[
     Callable[[], RawSensorEvaluationFunctionReturn],
@@ -105,6 +111,223 @@ def from_json(json_str: str) -> "RunStatusSensorCursor":
         return deserialize_value(json_str, RunStatusSensorCursor)
 
 
+# number of run status events that each sensor evaluation considers
+RUN_STATUS_SENSOR_EVENT_LIMIT = 5
+
+# number of run status events that are fetched at once and shared by the run status sensors that
+# are evaluated in the same process, along with the runs they belong to
+RUN_STATUS_EVENT_WINDOW_SIZE = 100
+RUN_STATUS_EVENT_WINDOW_TTL_SECONDS = 30
+# how long sensors that have seen every event in a window are served from it, before one of them
+# checks the event log for newer events
+RUN_STATUS_EVENT_WINDOW_HEAD_TTL_SECONDS = 5
+
+
+class _RunStatusEventWindow(NamedTuple):
+    fetched_at: float
+    # the window has every event whose storage id is in (after_record_id, last_record_id]
+    after_record_id: int
+    last_record_id: int
+    # when the window last had every event in the event log, if it did
+    head_fetched_at: Optional[float]
+    event_records: Sequence["EventLogRecord"]
+    run_records_by_id: Mapping[str, RunRecord]
+
+    @staticmethod
+    def create(
+        record_id: int,
+        event_records: Sequence["EventLogRecord"],
+        run_records_by_id: Mapping[str, RunRecord],
+        limit: int,
+    ) -> "_RunStatusEventWindow":
+        """Creates a window from the events that were fetched after the given record id."""
+        now = time.monotonic()
+        reached_head = len(event_records) < limit
+        return _RunStatusEventWindow(
+            fetched_at=now,
+            after_record_id=record_id,
+            last_record_id=event_records[-1].storage_id if event_records else record_id,
+            head_fetched_at=now if reached_head else None,
+            event_records=event_records,
+            run_records_by_id=run_records_by_id,
+        )
+
+    def is_expired(self) -> bool:
+        return time.monotonic() - self.fetched_at > RUN_STATUS_EVENT_WINDOW_TTL_SECONDS
+
+    def covers(self, record_id: int) -> bool:
+        return (
+            not self.is_expired() and self.after_record_id <= record_id <= self.last_record_id
+        )
+
+    def get_event_records_after(
+        self, record_id: int, limit: int
+    ) -> Optional[Sequence["EventLogRecord"]]:
+        """Returns the first events after the given record id, or None if the window can't tell
+        that they are the same events that querying the event log would return.
+        """
+        if not self.covers(record_id):
+            return None
+
+        event_records = [
+            event_record
+            for event_record in self.event_records
+            if event_record.storage_id > record_id
+        ][:limit]
+        if len(event_records) == limit:
+            return event_records
+
+        # with fewer events than the limit, newer events may have been written since the window
+        # last had every event, so it is only used for a short while after that
+        if (
+            self.head_fetched_at is not None
+            and time.monotonic() - self.head_fetched_at <= RUN_STATUS_EVENT_WINDOW_HEAD_TTL_SECONDS
+        ):
+            return event_records
+        return None
+
+    def extend(
+        self,
+        record_id: int,
+        event_records: Sequence["EventLogRecord"],
+        run_records_by_id: Mapping[str, RunRecord],
+        limit: int,
+    ) -> "_RunStatusEventWindow":
+        """Returns a window that also has the events that were fetched after the given record id,
+        which this window covers. The oldest events are dropped to keep the window bounded.
+        """
+        extended = self.create(record_id, event_records, run_records_by_id, limit)
+        kept_event_records = [
+            event_record
+            for event_record in self.event_records
+            if event_record.storage_id <= record_id
+        ]
+        all_event_records = [*kept_event_records, *event_records]
+        after_record_id = self.after_record_id
+        if len(all_event_records) > RUN_STATUS_EVENT_WINDOW_SIZE:
+            num_dropped = len(all_event_records) - RUN_STATUS_EVENT_WINDOW_SIZE
+            after_record_id = all_event_records[num_dropped - 1].storage_id
+            all_event_records = all_event_records[num_dropped:]
+
+        all_run_records_by_id = {**self.run_records_by_id, **run_records_by_id}
+        return extended._replace(
+            # the window expires with its oldest events
+            fetched_at=self.fetched_at,
+            after_record_id=after_record_id,
+            event_records=all_event_records,
+            run_records_by_id={
+                event_record.event_log_entry.run_id: all_run_records_by_id[
+                    event_record.event_log_entry.run_id
+                ]
+                for event_record in all_event_records
+                if event_record.event_log_entry.run_id in all_run_records_by_id
+            },
+        )
+
+
+_run_status_event_windows: Dict[Tuple[str, DagsterEventType], _RunStatusEventWindow] = {}
+_run_status_event_windows_lock = threading.Lock()
+
+
+def _is_behind_window(window: Optional[_RunStatusEventWindow], record_id: int) -> bool:
+    return not window or window.is_expired() or record_id < window.after_record_id
+
+
+def _get_run_status_event_window_key(
+    context: SensorEvaluationContext, event_type: DagsterEventType
+) -> Optional[Tuple[str, DagsterEventType]]:
+    # events can only be shared between evaluations that read the same instance, and storage ids
+    # are not comparable across runs in run-sharded event log storage
+    if not context.instance_ref or context.instance.event_log_storage.is_run_sharded:
+        return None
+    return (serialize_value(context.instance_ref), event_type)
+
+
+def _get_run_status_events(
+    context: SensorEvaluationContext,
+    event_type: DagsterEventType,
+    cursor: RunStatusSensorCursor,
+) -> Tuple[Sequence["EventLogRecord"], Mapping[str, RunRecord]]:
+    """Fetches the run status events after the cursor, along with the runs they belong to.
+
+    Run status sensors that are evaluated in the same process share the events and runs they
+    fetch:
+
+    - A sensor that is behind fetches a window of events, which other sensors that are behind it
+      are then served from.
+    - A sensor that has seen every event in the window checks the event log for a tick's worth of
+      newer events, and adds them to the window. Other sensors that have caught up are served from
+      the window for a short while after that, instead of each querying the event log.
+    - A window is only replaced by one that starts from a lower cursor, so that sensors that are
+      caught up don't move the window past sensors that are behind.
+    """
+    from dagster._core.event_api import RunShardedEventsCursor
+    from dagster._core.storage.event_log.base import EventRecordsFilter
+
+    window_key = _get_run_status_event_window_key(context, event_type)
+    window = None
+    if window_key:
+        with _run_status_event_windows_lock:
+            window = _run_status_event_windows.get(window_key)
+        if window:
+            event_records = window.get_event_records_after(
+                cursor.record_id, RUN_STATUS_SENSOR_EVENT_LIMIT
+            )
+            if event_records is not None:
+                return event_records, window.run_records_by_id
+
+    # sensors that are not behind the window only need a tick's worth of newer events
+    limit = (
+        RUN_STATUS_EVENT_WINDOW_SIZE
+        if window_key and _is_behind_window(window, cursor.record_id)
+        else RUN_STATUS_SENSOR_EVENT_LIMIT
+    )
+
+    # Fetch events after the cursor id
+    # * we move the cursor forward to the latest visited event's id to avoid revisits
+    # * when the daemon is down, bc we persist the cursor info, we can go back to where we
+    #   left and backfill alerts for the qualified events (up to 5 at a time) during the downtime
+    # Note: this is a cross-run query which requires extra handling in sqlite, see details in
+    # SqliteEventLogStorage.
+    event_records = list(
+        context.instance.get_event_records(
+            EventRecordsFilter(
+                after_cursor=RunShardedEventsCursor(
+                    id=cursor.record_id,
+                    run_updated_after=cast(datetime, pendulum.parse(cursor.update_timestamp)),
+                ),
+                event_type=event_type,
+            ),
+            ascending=True,
+            limit=limit,
+        )
+    )
+
+    run_ids = list({event_record.event_log_entry.run_id for event_record in event_records})
+    run_records_by_id = (
+        {
+            run_record.dagster_run.run_id: run_record
+            for run_record in context.instance.get_run_records(filters=RunsFilter(run_ids=run_ids))
+        }
+        if run_ids
+        else {}
+    )
+
+    if window_key:
+        with _run_status_event_windows_lock:
+            window = _run_status_event_windows.get(window_key)
+            if window and window.covers(cursor.record_id):
+                _run_status_event_windows[window_key] = window.extend(
+                    cursor.record_id, event_records, run_records_by_id, limit
+                )
+            elif _is_behind_window(window, cursor.record_id):
+                _run_status_event_windows[window_key] = _RunStatusEventWindow.create(
+                    cursor.record_id, event_records, run_records_by_id, limit
+                )
+
+    return event_records[:RUN_STATUS_SENSOR_EVENT_LIMIT], run_records_by_id
+
+
 class RunStatusSensorContext:
     """The ``context`` object available to a decorated function of ``run_status_sensor``.
 
@@ -508,23 +731,8 @@ def _wrapped_fn(
                 yield SkipReason(f"Initiating {name}. Set cursor to {new_cursor}")
                 return
 
-            record_id, update_timestamp = RunStatusSensorCursor.from_json(context.cursor)
-
-            # Fetch events after the cursor id
-            # * we move the cursor forward to the latest visited event's id to avoid revisits
-            # * when the daemon is down, bc we persist the cursor info, we can go back to where we
-            #   left and backfill alerts for the qualified events (up to 5 at a time) during the downtime
-            # Note: this is a cross-run query which requires extra handling in sqlite, see details in SqliteEventLogStorage.
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    after_cursor=RunShardedEventsCursor(
-                        id=record_id,
-                        run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
-                    ),
-                    event_type=event_type,
-                ),
-                ascending=True,
-                limit=5,
+            event_records, run_records_by_id = _get_run_status_events(
+                context, event_type, RunStatusSensorCursor.from_json(context.cursor)
             )
 
             for event_record in event_records:
@@ -532,12 +740,10 @@ def _wrapped_fn(
                 storage_id = event_record.storage_id
 
                 # get run info
-                run_records = context.instance.get_run_records(
-                    filters=RunsFilter(run_ids=[event_log_entry.run_id])
-                )
+                run_record = run_records_by_id.get(event_log_entry.run_id)
 
                 # skip if we couldn't find the right run
-                if len(run_records) != 1:
+                if run_record is None:
                     # bc we couldn't find the run, we use the event timestamp as the approximate
                     # run update timestamp
                     approximate_update_timestamp = utc_datetime_from_timestamp(
@@ -551,8 +757,8 @@ def _wrapped_fn(
                     )
                     continue
 
-                pipeline_run = run_records[0].dagster_run
-                update_timestamp = run_records[0].update_timestamp
+                pipeline_run = run_record.dagster_run
+                update_timestamp = run_record.update_timestamp
 
                 job_match = False
 
@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import operator
 import re
 from datetime import datetime
 from enum import Enum
@@ -1395,8 +1396,8 @@ def _add_partitions_to_time_windows(
                     num_added_partitions += 1
                     break
             else:
-                if result_windows and window.start == result_windows[0].start:
-                    result_windows[0] = TimeWindow(window.start, included_window.end)  # type: ignore
+                if result_windows and window.end == result_windows[0].start:
+                    result_windows[0] = TimeWindow(window.start, result_windows[0].end)
                 else:
                     result_windows.insert(0, window)
 
@@ -1424,6 +1425,96 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowParti
             included_time_windows=result_windows,
         )
 
+    def _combine_time_windows(
+        self, other: "TimeWindowPartitionsSubset", include: Callable[[bool, bool], bool]
+    ) -> "TimeWindowPartitionsSubset":
+        """Returns the subset of the spans of time between the boundaries of the time windows of
+        either subset that are included, according to whether they are in this subset and in the
+        other subset. Each span is covered by whole partitions, since the windows of both subsets
+        start and end on partition boundaries.
+        """
+        windows = self.included_time_windows
+        other_windows = other.included_time_windows
+        boundaries = sorted(
+            {boundary for window in [*windows, *other_windows] for boundary in window}
+        )
+
+        result_windows: List[TimeWindow] = []
+        i = j = 0
+        for start, end in zip(boundaries, boundaries[1:]):
+            while i < len(windows) and windows[i].end <= start:
+                i += 1
+            while j < len(other_windows) and other_windows[j].end <= start:
+                j += 1
+            in_self = i < len(windows) and windows[i].start <= start
+            in_other = j < len(other_windows) and other_windows[j].start <= start
+            if not include(in_self, in_other):
+                continue
+            if result_windows and result_windows[-1].end == start:
+                result_windows[-1] = TimeWindow(result_windows[-1].start, end)
+            else:
+                result_windows.append(TimeWindow(start, end))
+
+        return TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=sum(
+                len(self._partitions_def.get_partition_keys_in_time_window(window))
+                for window in result_windows
+            ),
+            included_time_windows=result_windows,
+        )
+
+    def _combine(
+        self,
+        other: PartitionsSubset,
+        combine_partition_keys: Callable[[AbstractSet[str], AbstractSet[str]], AbstractSet[str]],
+        include: Callable[[bool, bool], bool],
+    ) -> Optional["TimeWindowPartitionsSubset"]:
+        """Combines this subset with another subset of the same partitions definition, using their
+        partition keys if both are represented by partition keys, and otherwise their time
+        windows. Returns None if the other subset is not of the same partitions definition.
+        """
+        if not (
+            isinstance(other, TimeWindowPartitionsSubset)
+            and self._partitions_def == other._partitions_def  # noqa: SLF001
+        ):
+            return None
+
+        other_partition_keys = other._included_partition_keys  # noqa: SLF001
+        if self._included_partition_keys is not None and other_partition_keys is not None:
+            partition_keys = set(
+                combine_partition_keys(self._included_partition_keys, other_partition_keys)
+            )
+            return TimeWindowPartitionsSubset(
+                self._partitions_def,
+                num_partitions=len(partition_keys),
+                included_partition_keys=partition_keys,
+            )
+
+        return self._combine_time_windows(other, include)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        combined = self._combine(other, operator.or_, lambda in_self, in_other: in_self or in_other)
+        return combined if combined is not None else super().__or__(other)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        combined = self._combine(
+            other, operator.and_, lambda in_self, in_other: in_self and in_other
+        )
+        return combined if combined is not None else super().__and__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self._partitions_def.empty_subset()
+        combined = self._combine(
+            other, operator.sub, lambda in_self, in_other: in_self and not in_other
+        )
+        return combined if combined is not None else super().__sub__(other)
+
     @classmethod
     def from_serialized(
         cls, partitions_def: PartitionsDefinition, serialized: str
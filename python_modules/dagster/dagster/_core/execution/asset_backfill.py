@@ -30,13 +30,14 @@
 from dagster._core.definitions.run_request import RunRequest
 from dagster._core.definitions.selector import PipelineSelector
 from dagster._core.errors import DagsterBackfillFailedError
+from dagster._core.event_api import EventRecordsFilter
 from dagster._core.events import DagsterEventType
 from dagster._core.host_representation import (
     ExternalExecutionPlan,
     ExternalPipeline,
 )
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
-from dagster._core.storage.pipeline_run import DagsterRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG
 from dagster._core.workspace.context import (
     BaseWorkspaceRequestContext,
@@ -66,6 +67,9 @@ class AssetBackfillData(NamedTuple):
     materialized_subset: AssetGraphSubset
     requested_subset: AssetGraphSubset
     failed_and_downstream_subset: AssetGraphSubset
+    # the storage id of the latest run failure or cancellation event that has been folded into
+    # failed_and_downstream_subset, so that later iterations only look at newer events
+    latest_failed_run_storage_id: Optional[int] = None
 
     def is_complete(self) -> bool:
         """The asset backfill is complete when all runs to be requested have finished (success,
@@ -192,6 +196,7 @@ def from_serialized(cls, serialized: str, asset_graph: AssetGraph) -> "AssetBack
                 storage_dict["serialized_failed_subset"], asset_graph
             ),
             latest_storage_id=storage_dict["latest_storage_id"],
+            latest_failed_run_storage_id=storage_dict.get("latest_failed_run_storage_id"),
         )
 
     @classmethod
@@ -230,15 +235,17 @@ def from_asset_partitions(
         target_subset = AssetGraphSubset(
             asset_graph, non_partitioned_asset_keys=set(asset_selection) - partitioned_asset_keys
         )
-        for root_asset_key in root_partitioned_asset_keys:
-            target_subset |= asset_graph.bfs_filter_subsets(
-                dynamic_partitions_store,
-                lambda asset_key, _: asset_key in partitioned_asset_keys,
-                AssetGraphSubset(
-                    asset_graph,
-                    partitions_subsets_by_asset_key={root_asset_key: root_partitions_subset},
-                ),
-            )
+        target_subset |= asset_graph.bfs_filter_subsets(
+            dynamic_partitions_store,
+            lambda asset_key, _: asset_key in partitioned_asset_keys,
+            AssetGraphSubset(
+                asset_graph,
+                partitions_subsets_by_asset_key={
+                    root_asset_key: root_partitions_subset
+                    for root_asset_key in root_partitioned_asset_keys
+                },
+            ),
+        )
 
         return cls.empty(target_subset)
 
@@ -258,6 +265,7 @@ def serialize(self, dynamic_partitions_store: DynamicPartitionsStore) -> str:
             "serialized_failed_subset": self.failed_and_downstream_subset.to_storage_dict(
                 dynamic_partitions_store=dynamic_partitions_store
             ),
+            "latest_failed_run_storage_id": self.latest_failed_run_storage_id,
         }
         return json.dumps(storage_dict)
 
@@ -327,7 +335,10 @@ def execute_asset_backfill_iteration(
             pipeline_and_execution_plan_cache=pipeline_and_execution_plan_cache,
         )
 
-    instance.update_backfill(updated_backfill)
+    # nothing to record if no runs were requested and no partitions changed status since the
+    # previous iteration
+    if updated_backfill != backfill:
+        instance.update_backfill(updated_backfill)
 
 
 def submit_run_request(
@@ -449,6 +460,7 @@ def execute_asset_backfill_iteration_inner(
         )
         updated_materialized_subset = AssetGraphSubset(asset_graph)
         failed_and_downstream_subset = AssetGraphSubset(asset_graph)
+        latest_failed_run_storage_id = _get_latest_failed_run_storage_id(instance_queryer)
     else:
         (
             parent_materialized_asset_partitions,
@@ -488,17 +500,31 @@ def execute_asset_backfill_iteration_inner(
             asset_backfill_data.materialized_subset | recently_materialized_asset_partitions
         )
 
-        failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
-            asset_graph.bfs_filter_asset_partitions(
+        # only runs that failed since the previous iteration are folded in, because the partitions
+        # downstream of earlier failures are already in the stored subset
+        (
+            failed_asset_partitions,
+            latest_failed_run_storage_id,
+        ) = _get_failed_asset_partitions(
+            instance_queryer,
+            backfill_id,
+            asset_backfill_data.latest_failed_run_storage_id,
+        )
+        failed_and_downstream_subset = asset_backfill_data.failed_and_downstream_subset
+        if failed_asset_partitions:
+            failed_and_downstream_subset |= asset_graph.bfs_filter_subsets(
                 instance_queryer,
-                lambda asset_partitions, _: any(
-                    asset_partition in asset_backfill_data.target_subset
-                    for asset_partition in asset_partitions
+                lambda asset_key, _: True,
+                AssetGraphSubset.from_asset_partition_set(
+                    {
+                        asset_partition
+                        for asset_partition in failed_asset_partitions
+                        if asset_partition in asset_backfill_data.target_subset
+                    },
+                    asset_graph,
                 ),
-                _get_failed_asset_partitions(instance_queryer, backfill_id),
-            ),
-            asset_graph,
-        )
+                within_subset=asset_backfill_data.target_subset,
+            )
 
         yield None
 
@@ -534,6 +560,7 @@ def execute_asset_backfill_iteration_inner(
         materialized_subset=updated_materialized_subset,
         failed_and_downstream_subset=failed_and_downstream_subset,
         requested_subset=asset_backfill_data.requested_subset | asset_partitions_to_request,
+        latest_failed_run_storage_id=latest_failed_run_storage_id,
     )
     yield AssetBackfillIterationResult(run_requests, updated_asset_backfill_data)
 
@@ -578,20 +605,97 @@ def should_backfill_atomic_asset_partitions_unit(
     return True
 
 
+FAILED_RUN_EVENT_TYPES = [DagsterEventType.RUN_FAILURE, DagsterEventType.RUN_CANCELED]
+
+
+def _get_latest_failed_run_storage_id(instance_queryer: CachingInstanceQueryer) -> Optional[int]:
+    """Returns the storage id of the latest run failure or cancellation event, or None if there is
+    no such event or the event log storage does not have storage ids that increase across runs.
+    """
+    if not instance_queryer.instance.event_log_storage.supports_event_consumer_queries():
+        return None
+
+    storage_ids = [
+        storage_id
+        for storage_id in (
+            instance_queryer.get_latest_storage_id(event_type)
+            for event_type in FAILED_RUN_EVENT_TYPES
+        )
+        if storage_id is not None
+    ]
+    return max(storage_ids) if storage_ids else None
+
+
+def _get_failed_runs(
+    instance_queryer: CachingInstanceQueryer,
+    backfill_id: str,
+    latest_failed_run_storage_id: Optional[int],
+) -> Tuple[Sequence[DagsterRun], Optional[int]]:
+    """Returns the failed and canceled runs of the backfill, along with the storage id of
+    the latest run failure or cancellation event.
+
+    If latest_failed_run_storage_id is provided, only runs that failed or were canceled after that
+    event are returned. Otherwise, all failed and canceled runs of the backfill are returned.
+    """
+    if latest_failed_run_storage_id is None or (
+        not instance_queryer.instance.event_log_storage.supports_event_consumer_queries()
+    ):
+        # read the cursor before the runs, so that runs that fail in between are not skipped
+        next_latest_failed_run_storage_id = _get_latest_failed_run_storage_id(instance_queryer)
+        run_records = instance_queryer.instance.get_run_records(
+            filters=RunsFilter(
+                tags={BACKFILL_ID_TAG: backfill_id},
+                statuses=[DagsterRunStatus.CANCELED, DagsterRunStatus.FAILURE],
+            )
+        )
+        return (
+            [run_record.dagster_run for run_record in run_records],
+            next_latest_failed_run_storage_id,
+        )
+
+    event_records = [
+        event_record
+        for event_type in FAILED_RUN_EVENT_TYPES
+        for event_record in instance_queryer.instance.get_event_records(
+            EventRecordsFilter(event_type=event_type, after_cursor=latest_failed_run_storage_id)
+        )
+    ]
+    run_ids = {
+        event_record.run_id
+        for event_record in event_records
+        if instance_queryer.run_has_tag(
+            run_id=event_record.run_id, tag_key=BACKFILL_ID_TAG, tag_value=backfill_id
+        )
+    }
+    runs = (
+        instance_queryer.instance.get_runs(filters=RunsFilter(run_ids=list(run_ids)))
+        if run_ids
+        else []
+    )
+    return runs, max(
+        (event_record.storage_id for event_record in event_records),
+        default=latest_failed_run_storage_id,
+    )
+
+
 def _get_failed_asset_partitions(
-    instance_queryer: CachingInstanceQueryer, backfill_id: str
-) -> Sequence[AssetKeyPartitionKey]:
+    instance_queryer: CachingInstanceQueryer,
+    backfill_id: str,
+    latest_failed_run_storage_id: Optional[int],
+) -> Tuple[Sequence[AssetKeyPartitionKey], Optional[int]]:
     """Returns asset partitions that materializations were requested for as part of the backfill, but
-    will not be materialized.
+    will not be materialized, along with the storage id of the latest run failure or cancellation
+    event.
+
+    Only considers runs that failed or were canceled after latest_failed_run_storage_id, if
+    provided. Event storage ids increase monotonically, so unlike run update timestamps they do not
+    depend on the clocks of the processes that update runs.
 
     Includes canceled asset partitions. Implementation assumes that successful runs won't have any
     failed partitions.
     """
-    runs = instance_queryer.instance.get_runs(
-        filters=RunsFilter(
-            tags={BACKFILL_ID_TAG: backfill_id},
-            statuses=[DagsterRunStatus.CANCELED, DagsterRunStatus.FAILURE],
-        )
+    runs, latest_failed_run_storage_id = _get_failed_runs(
+        instance_queryer, backfill_id, latest_failed_run_storage_id
     )
 
     result: List[AssetKeyPartitionKey] = []
@@ -609,4 +713,4 @@ def _get_failed_asset_partitions(
             for asset_key in planned_asset_keys - completed_asset_keys
         )
 
-    return result
+    return result, latest_failed_run_storage_id
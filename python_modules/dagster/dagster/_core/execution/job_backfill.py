@@ -60,6 +60,10 @@ def execute_job_backfill_iteration(
 
     _check_repo_has_partition_set(workspace_process_context, backfill)
 
+    # runs that were created but not submitted, e.g. because the daemon was interrupted in
+    # between, are skipped when the chunk is computed, so they are submitted here instead
+    _submit_unsubmitted_backfill_runs(instance, logger, workspace_process_context, backfill)
+
     has_more = True
     while has_more:
         if backfill.status != BulkActionStatus.REQUESTED:
@@ -101,6 +105,31 @@ def execute_job_backfill_iteration(
             yield None
 
 
+def _submit_unsubmitted_backfill_runs(
+    instance: DagsterInstance,
+    logger: logging.Logger,
+    workspace_process_context: IWorkspaceProcessContext,
+    backfill_job: PartitionBackfill,
+) -> None:
+    unsubmitted_runs = instance.get_runs(
+        RunsFilter(
+            tags=DagsterRun.tags_for_backfill_id(backfill_job.backfill_id),
+            statuses=[DagsterRunStatus.NOT_STARTED],
+        )
+    )
+    if not unsubmitted_runs:
+        return
+
+    logger.info(
+        f"Submitting {len(unsubmitted_runs)} runs that were created but not submitted for"
+        f" backfill {backfill_job.backfill_id}"
+    )
+    workspace = workspace_process_context.create_request_context()
+    # get_runs returns the most recent runs first
+    for run in reversed(unsubmitted_runs):
+        instance.submit_run(run.run_id, workspace)
+
+
 def _check_repo_has_partition_set(
     workspace_process_context: IWorkspaceProcessContext, backfill_job: PartitionBackfill
 ) -> None:
@@ -1,4 +1,3 @@
-import asyncio
 import inspect
 from typing import (
     Any,
@@ -117,6 +116,9 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> OpOutputU
 
 
 def gen_from_async_gen(async_gen: AsyncIterator[T]) -> Iterator[T]:
+    # asyncio is slow to import and only needed for async compute functions
+    import asyncio
+
     while True:
         try:
             yield asyncio.run(async_gen.__anext__())  # type: ignore # subtle awaitable vs coroutine issue
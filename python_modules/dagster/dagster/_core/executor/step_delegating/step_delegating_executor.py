@@ -1,7 +1,9 @@
 import os
 import sys
 import time
-from typing import Any, Dict, List, Optional, Sequence, cast
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, cast
 
 import pendulum
 
@@ -14,9 +16,13 @@
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
-from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster._core.executor.step_delegating.step_handler.base import (
+    CheckStepHealthResult,
+    StepHandler,
+    StepHandlerContext,
+)
 from dagster._grpc.types import ExecuteStepArgs
-from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from ..base import Executor
 
@@ -24,12 +30,22 @@
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
 
+T = TypeVar("T")
+U = TypeVar("U")
+
 
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
     sometimes creates its own events - when it does, that event is automatically written to the
     event log. But we wait until we later tail it from the event log database before yielding it,
     to avoid yielding the same event multiple times to callsites.
+
+    By default, steps are launched and their health is checked one at a time. If
+    step_handler_parallelism is greater than 1, the step handler is called from a pool of that many
+    threads instead, so that a step handler whose calls block on an API does not delay the launch
+    of every other step. Launches still start in the order in which steps became ready, and
+    max_concurrent still limits the number of steps that are running at once. If
+    max_step_launches_per_second is set, step launches are spaced out to stay under that rate.
     """
 
     def __init__(
@@ -41,6 +57,8 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        step_handler_parallelism: Optional[int] = None,
+        max_step_launches_per_second: Optional[float] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -65,6 +83,22 @@ def __init__(
         )
         self._should_verify_step = should_verify_step
 
+        self._step_handler_parallelism = check.opt_int_param(
+            step_handler_parallelism, "step_handler_parallelism"
+        )
+        if self._step_handler_parallelism is not None:
+            check.invariant(
+                self._step_handler_parallelism > 0, "step_handler_parallelism must be > 0"
+            )
+        self._max_step_launches_per_second = check.opt_numeric_param(
+            max_step_launches_per_second, "max_step_launches_per_second"
+        )
+        if self._max_step_launches_per_second is not None:
+            check.invariant(
+                self._max_step_launches_per_second > 0, "max_step_launches_per_second must be > 0"
+            )
+        self._next_step_launch_time = 0.0
+
     @property
     def retries(self):
         return self._retries
@@ -95,6 +129,61 @@ def _get_step_handler_context(
             dagster_run=plan_context.dagster_run,
         )
 
+    def _map_step_handler_calls(
+        self,
+        thread_pool: Optional[ThreadPoolExecutor],
+        fn: Callable[[T], U],
+        args: Sequence[T],
+    ) -> List[U]:
+        """Calls fn with each arg, concurrently if there is a thread pool, returning the results in
+        order. Like the builtin map, the first exception in order is raised once the calls before it
+        have finished.
+        """
+        if thread_pool is None or len(args) <= 1:
+            return [fn(arg) for arg in args]
+        return list(thread_pool.map(fn, args))
+
+    def _reserve_step_launch_time(self) -> Optional[float]:
+        # reserved in the orchestration thread, so that steps are launched in the order in which
+        # they were reserved even when they are launched from a thread pool
+        if self._max_step_launches_per_second is None:
+            return None
+        launch_time = max(time.time(), self._next_step_launch_time)
+        self._next_step_launch_time = launch_time + 1.0 / self._max_step_launches_per_second
+        return launch_time
+
+    def _launch_step(self, launch_args: Tuple[StepHandlerContext, Optional[float]]) -> None:
+        step_handler_context, launch_time = launch_args
+        if launch_time is not None:
+            delay = launch_time - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        list(self._step_handler.launch_step(step_handler_context))
+
+    def _launch_steps(
+        self,
+        thread_pool: Optional[ThreadPoolExecutor],
+        plan_context: PlanOrchestrationContext,
+        steps: Sequence[ExecutionStep],
+        active_execution: ActiveExecution,
+    ) -> None:
+        launch_args = [
+            (
+                self._get_step_handler_context(plan_context, [step], active_execution),
+                self._reserve_step_launch_time(),
+            )
+            for step in steps
+        ]
+        self._map_step_handler_calls(thread_pool, self._launch_step, launch_args)
+
+    def _check_step_health(
+        self, step_handler_context: StepHandlerContext
+    ) -> Tuple[Optional[CheckStepHealthResult], Optional[SerializableErrorInfo]]:
+        try:
+            return self._step_handler.check_step_health(step_handler_context), None
+        except Exception:
+            return None, serializable_error_info_from_exc_info(sys.exc_info())
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -107,12 +196,25 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with ActiveExecution(
-            execution_plan,
-            retry_mode=self.retries,
-            max_concurrent=self._max_concurrent,
-            tag_concurrency_limits=self._tag_concurrency_limits,
-        ) as active_execution:
+        with ExitStack() as stack:
+            thread_pool = (
+                stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=self._step_handler_parallelism,
+                        thread_name_prefix="step_handler_worker",
+                    )
+                )
+                if self._step_handler_parallelism and self._step_handler_parallelism > 1
+                else None
+            )
+            active_execution = stack.enter_context(
+                ActiveExecution(
+                    execution_plan,
+                    retry_mode=self.retries,
+                    max_concurrent=self._max_concurrent,
+                    tag_concurrency_limits=self._tag_concurrency_limits,
+                )
+            )
             running_steps: Dict[str, ExecutionStep] = {}
 
             if plan_context.resume_from_failure:
@@ -173,13 +275,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     if should_retry_step:
                         # health check failed, launch the step
-                        list(
-                            self._step_handler.launch_step(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            )
-                        )
+                        self._launch_steps(thread_pool, plan_context, [step], active_execution)
 
                     running_steps[step.key] = step
 
@@ -256,40 +352,42 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     curr_time - last_check_step_health_time
                 ).total_seconds() >= self._check_step_health_interval_seconds:
                     last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
+                    steps_to_check = list(running_steps.values())
+                    health_checks = self._map_step_handler_calls(
+                        thread_pool,
+                        self._check_step_health,
+                        [
+                            self._get_step_handler_context(plan_context, [step], active_execution)
+                            for step in steps_to_check
+                        ],
+                    )
+                    for step, (health_check_result, serializable_error) in zip(
+                        steps_to_check, health_checks
+                    ):
                         step_context = plan_context.for_step(step)
 
-                        try:
-                            health_check_result = self._step_handler.check_step_health(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            )
-                            if not health_check_result.is_healthy:
-                                DagsterEvent.step_failure_event(
-                                    step_context=step_context,
-                                    step_failure_data=StepFailureData(
-                                        error=None,
-                                        user_failure_data=None,
-                                    ),
-                                    message=(
-                                        f"Step {step.key} failed health check:"
-                                        f" {health_check_result.unhealthy_reason}"
-                                    ),
-                                )
-                        except Exception:
-                            serializable_error = serializable_error_info_from_exc_info(
-                                sys.exc_info()
-                            )
+                        if serializable_error:
                             # Log a step failure event if there was an error during the health
                             # check
                             DagsterEvent.step_failure_event(
-                                step_context=plan_context.for_step(step),
+                                step_context=step_context,
                                 step_failure_data=StepFailureData(
                                     error=serializable_error,
                                     user_failure_data=None,
                                 ),
                             )
+                        elif health_check_result and not health_check_result.is_healthy:
+                            DagsterEvent.step_failure_event(
+                                step_context=step_context,
+                                step_failure_data=StepFailureData(
+                                    error=None,
+                                    user_failure_data=None,
+                                ),
+                                message=(
+                                    f"Step {step.key} failed health check:"
+                                    f" {health_check_result.unhealthy_reason}"
+                                ),
+                            )
 
                 if self._max_concurrent is not None:
                     max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -299,12 +397,9 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                 else:
                     max_steps_to_run = None  # disables limit
 
-                for step in active_execution.get_steps_to_execute(max_steps_to_run):
+                steps_to_launch = active_execution.get_steps_to_execute(max_steps_to_run)
+                for step in steps_to_launch:
                     running_steps[step.key] = step
-                    list(
-                        self._step_handler.launch_step(
-                            self._get_step_handler_context(plan_context, [step], active_execution)
-                        )
-                    )
+                self._launch_steps(thread_pool, plan_context, steps_to_launch, active_execution)
 
                 time.sleep(self._sleep_seconds)
@@ -82,6 +82,11 @@
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
+from .event_log_writer import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_QUEUE_SIZE,
+    BackgroundEventLogWriter,
+)
 from .ref import InstanceRef
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
@@ -178,12 +183,16 @@ def _format_field_diff(field_diff: Mapping[str, Tuple[Any, Any]]) -> str:
 
 
 class _EventListenerLogHandler(logging.Handler):
-    def __init__(self, instance: "DagsterInstance"):
+    def __init__(
+        self,
+        instance: "DagsterInstance",
+        writer: Optional[BackgroundEventLogWriter] = None,
+    ):
         self._instance = instance
+        self._writer = writer
         super(_EventListenerLogHandler, self).__init__()
 
     def emit(self, record: DagsterLogRecord) -> None:
-        from dagster._core.events import EngineEventData
         from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
 
         event = construct_event_record(
@@ -196,6 +205,23 @@ def emit(self, record: DagsterLogRecord) -> None:
             )
         )
 
+        if self._writer is None:
+            self._handle_event(event)
+        elif event.dagster_event:
+            # DagsterEvents drive orchestration, so they are written synchronously once every
+            # buffered log message before them has been written, and failures are raised
+            self._writer.flush()
+            self._handle_event(event)
+        else:
+            self._writer.submit(event)
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _handle_event(self, event: EventLogEntry) -> None:
+        from dagster._core.events import EngineEventData
+
         try:
             self._instance.handle_new_event(event)
         except Exception as e:
@@ -216,6 +242,15 @@ def emit(self, record: DagsterLogRecord) -> None:
                     ),
                 )
 
+    def handle_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        try:
+            self._instance.handle_new_event_batch(events)
+        except Exception:
+            # fall back to writing the events one by one, so that a single bad event doesn't
+            # prevent the rest of the batch from being written
+            for event in events:
+                self._handle_event(event)
+
 
 class InstanceType(Enum):
     PERSISTENT = "PERSISTENT"
@@ -402,6 +437,7 @@ def __init__(
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._event_log_writer: Optional[BackgroundEventLogWriter] = None
 
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
@@ -808,6 +844,11 @@ def python_log_level(self) -> Optional[str]:
         python_log_settings = self.get_settings("python_logs") or {}
         return python_log_settings.get("python_log_level")
 
+    @property
+    def background_log_writer_settings(self) -> Mapping[str, Any]:
+        python_log_settings = self.get_settings("python_logs") or {}
+        return python_log_settings.get("background_log_writer") or {}
+
     def upgrade(self, print_fn: Optional[PrintFn] = None) -> None:
         from dagster._core.storage.migration.utils import upgrading_instance
 
@@ -848,6 +889,9 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_log_writer:
+            # write any buffered log messages before the event log storage goes away
+            self._event_log_writer.shutdown()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
@@ -1792,6 +1836,23 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys, after_cursor)
 
+    @traced
+    def get_latest_materialization_records_after_cursors(
+        self,
+        after_cursor_by_asset_key: Mapping[AssetKey, Optional[int]],
+        by_partition: bool = False,
+        asset_partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence["EventLogRecord"]:
+        return self._event_storage.get_latest_materialization_records_after_cursors(
+            after_cursor_by_asset_key, by_partition, asset_partitions
+        )
+
+    @traced
+    def get_latest_storage_id_by_asset_key(
+        self, asset_keys: Sequence[AssetKey], event_types: Sequence["DagsterEventType"]
+    ) -> Mapping[AssetKey, int]:
+        return self._event_storage.get_latest_storage_id_by_asset_key(asset_keys, event_types)
+
     @public
     @traced
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
@@ -1865,8 +1926,21 @@ def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
             return dummy_logger.handlers
         return []
 
+    def _get_event_log_writer(self) -> Optional[BackgroundEventLogWriter]:
+        settings = self.background_log_writer_settings
+        if not settings.get("enabled", False):
+            return None
+
+        if self._event_log_writer is None:
+            self._event_log_writer = BackgroundEventLogWriter(
+                write_batch=_EventListenerLogHandler(self).handle_event_batch,
+                max_queue_size=settings.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE),
+                max_batch_size=settings.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE),
+            )
+        return self._event_log_writer
+
     def _get_event_log_handler(self) -> _EventListenerLogHandler:
-        event_log_handler = _EventListenerLogHandler(self)
+        event_log_handler = _EventListenerLogHandler(self, writer=self._get_event_log_writer())
         event_log_handler.setLevel(10)
         return event_log_handler
 
@@ -1889,6 +1963,16 @@ def handle_new_event(self, event: EventLogEntry) -> None:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        self._event_storage.store_event_batch(events)
+
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
@@ -148,6 +148,19 @@ def python_logs_config_schema() -> Field:
                 },
                 is_required=False,
             ),
+            "background_log_writer": Field(
+                {
+                    "enabled": Field(bool, is_required=False),
+                    "max_queue_size": Field(int, is_required=False),
+                    "max_batch_size": Field(int, is_required=False),
+                },
+                is_required=False,
+                description=(
+                    "Write log messages to the event log from a background thread, so that ops"
+                    " logging in tight loops don't wait on the event log storage for every message."
+                    " DagsterEvents are still written synchronously."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -0,0 +1,120 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+import dagster._check as check
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_MAX_BATCH_SIZE = 100
+
+_SHUTDOWN = object()
+
+
+class BackgroundEventLogWriter:
+    """Writes event log entries from a background thread, so that the thread that logged them does
+    not wait on the event log storage.
+
+    Entries are buffered in a bounded queue. When the queue is full, ``submit`` blocks until the
+    writer catches up, so that a thread logging in a tight loop cannot buffer an unbounded number
+    of entries. The writer thread drains the queue in batches of up to ``max_batch_size`` entries.
+
+    Args:
+        write_batch (Callable[[Sequence[EventLogEntry]], None]): Writes a batch of entries. Must
+            handle its own errors.
+        max_queue_size (int): Maximum number of entries that are buffered before ``submit`` blocks.
+        max_batch_size (int): Maximum number of entries written in a single batch.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[Sequence["EventLogEntry"]], None],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self._write_batch = check.callable_param(write_batch, "write_batch")
+        self._max_queue_size = check.int_param(max_queue_size, "max_queue_size")
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        check.param_invariant(self._max_queue_size >= 1, "max_queue_size", "must be at least 1")
+        check.param_invariant(self._max_batch_size >= 1, "max_batch_size", "must be at least 1")
+
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        atexit.register(self.shutdown)
+
+    def _ensure_started(self) -> "queue.Queue":
+        with self._lock:
+            # a forked process inherits the queue but not the thread draining it, so start over
+            if self._queue is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._max_queue_size)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="dagster-event-log-writer",
+                    daemon=True,
+                )
+                self._pid = os.getpid()
+                self._thread.start()
+            return self._queue
+
+    def _is_running(self) -> bool:
+        return self._queue is not None and self._pid == os.getpid()
+
+    def submit(self, event: "EventLogEntry") -> None:
+        """Buffers an entry to be written by the background thread, blocking while the buffer is
+        full.
+        """
+        self._ensure_started().put(event)
+
+    def flush(self) -> None:
+        """Blocks until every entry submitted so far has been written."""
+        event_queue = self._queue
+        if (
+            event_queue is None
+            or not self._is_running()
+            or threading.current_thread() is self._thread
+        ):
+            return
+        event_queue.join()
+
+    def shutdown(self) -> None:
+        """Writes every buffered entry and stops the background thread."""
+        with self._lock:
+            if not self._is_running():
+                return
+            event_queue, thread = check.not_none(self._queue), check.not_none(self._thread)
+            self._queue = None
+            self._thread = None
+            self._pid = None
+
+        event_queue.put(_SHUTDOWN)
+        thread.join()
+
+    def _run(self, event_queue: "queue.Queue") -> None:
+        while True:
+            batch: List[object] = [event_queue.get()]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [event for event in batch if event is not _SHUTDOWN]
+            try:
+                if events:
+                    self._write_batch(events)  # type: ignore  # (only entries are submitted)
+            except Exception as e:
+                sys.stderr.write(f"Exception while writing batch to event log: {str(e)}\n")
+            finally:
+                for _ in batch:
+                    event_queue.task_done()
+
+            if len(events) < len(batch):
+                return
@@ -2,10 +2,10 @@
 import os
 import threading
 import time
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import IO, Iterator, Optional, Sequence, Union
+from typing import IO, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 from typing_extensions import TypeAlias
 
@@ -32,6 +32,10 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# Chunked partial uploads never upload more than this many bytes at once, so that a step that has
+# produced a lot of output since the last upload doesn't need to hold all of it in memory.
+MAX_PARTIAL_CHUNK_SIZE = 64 * 1024 * 1024
+
 LogSubscription: TypeAlias = Union[CapturedLogSubscription, ComputeLogSubscription]
 
 
@@ -81,6 +85,19 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    def read_cloud_storage_range(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: Optional[int],
+    ) -> Optional[bytes]:
+        """Reads up to max_bytes of the complete logs for a given log key, starting at offset,
+        without downloading the rest of the logs. Returns None if the storage does not support
+        ranged reads, in which case the logs are downloaded in full before being read.
+        """
+        return None
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
@@ -99,6 +116,13 @@ def open_log_stream(
     def _on_capture_complete(self, log_key: Sequence[str]):
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR)
+        if isinstance(self, ChunkedPartialUploadsMixin):
+            self.clear_partial_chunk_sizes(log_key)
+
+    def _uses_chunked_partial_uploads(self) -> bool:
+        return (
+            isinstance(self, ChunkedPartialUploadsMixin) and self.supports_chunked_partial_uploads
+        )
 
     def is_capture_complete(self, log_key: Sequence[str]) -> bool:
         if self.local_manager.is_capture_complete(log_key):
@@ -115,11 +139,20 @@ def log_data_for_type(
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
         if self.cloud_storage_has_logs(log_key, io_type):
+            data = self.read_cloud_storage_range(log_key, io_type, offset, max_bytes)
+            if data is not None:
+                return data, offset + len(data)
             self.download_from_cloud_storage(log_key, io_type)
             local_path = self.local_manager.get_captured_local_path(
                 log_key, IO_TYPE_EXTENSION[io_type]
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+        if self._uses_chunked_partial_uploads():
+            partial_data = cast(ChunkedPartialUploadsMixin, self).read_partial_chunks(
+                log_key, io_type, offset, max_bytes
+            )
+            if partial_data is not None:
+                return partial_data
         if self.cloud_storage_has_logs(log_key, io_type, partial=True):
             self.download_from_cloud_storage(log_key, io_type, partial=True)
             local_path = self.local_manager.get_captured_local_path(
@@ -162,8 +195,13 @@ def on_progress(self, log_key):
         if self.is_capture_complete(log_key):
             return
 
-        self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
-        self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
+        if self._uses_chunked_partial_uploads():
+            chunked_manager = cast(ChunkedPartialUploadsMixin, self)
+            chunked_manager.upload_partial_chunks(log_key, ComputeIOType.STDOUT)
+            chunked_manager.upload_partial_chunks(log_key, ComputeIOType.STDERR)
+        else:
+            self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
+            self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
 
     def subscribe(
         self, log_key: Sequence[str], cursor: Optional[str] = None
@@ -248,14 +286,24 @@ def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FIL
             self.download_from_cloud_storage(log_key, io_type)
             data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
             return self._from_local_file_data(run_id, key, io_type, data)
-        elif self.cloud_storage_has_logs(log_key, io_type, partial=True):
-            self.download_from_cloud_storage(log_key, io_type, partial=True)
+        elif self._has_partial_logs(log_key, io_type):
             partial_path = self.local_manager.get_captured_local_path(
                 log_key, IO_TYPE_EXTENSION[io_type], partial=True
             )
-            captured_data, new_cursor = self.local_manager.read_path(
-                partial_path, offset=cursor or 0
+            partial_data = (
+                cast(ChunkedPartialUploadsMixin, self).read_partial_chunks(
+                    log_key, io_type, cursor or 0, None
+                )
+                if self._uses_chunked_partial_uploads()
+                else None
             )
+            if partial_data is not None:
+                captured_data, new_cursor = partial_data
+            else:
+                self.download_from_cloud_storage(log_key, io_type, partial=True)
+                captured_data, new_cursor = self.local_manager.read_path(
+                    partial_path, offset=cursor or 0
+                )
             return ComputeLogFileData(
                 path=partial_path,
                 data=captured_data.decode("utf-8") if captured_data else None,
@@ -266,6 +314,13 @@ def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FIL
         local_path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
         return ComputeLogFileData(path=local_path, data=None, cursor=0, size=0, download_url=None)
 
+    def _has_partial_logs(self, log_key: Sequence[str], io_type: ComputeIOType) -> bool:
+        if self._uses_chunked_partial_uploads():
+            chunked_manager = cast(ChunkedPartialUploadsMixin, self)
+            if chunked_manager.download_partial_manifest(log_key, io_type) is not None:
+                return True
+        return self.cloud_storage_has_logs(log_key, io_type, partial=True)
+
     def on_subscribe(self, subscription):
         pass
 
@@ -287,6 +342,135 @@ def _from_local_file_data(self, run_id, key, io_type, local_file_data):
         )
 
 
+class ChunkedPartialUploadsMixin(ABC):
+    """Mixin for a CloudStorageComputeLogManager whose storage can hold partial logs as a sequence
+    of append-only chunks, described by a manifest of their sizes.
+
+    Every upload interval, only the bytes written since the previous upload are uploaded as new
+    chunks, instead of re-uploading the whole local file, and reads of partial logs only download
+    the chunks that overlap the requested range. Managers that use this mixin must call its
+    ``__init__``, and can turn chunked uploads off with ``supports_chunked_partial_uploads``, in
+    which case partial logs are uploaded in full.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # sizes of the chunks of partial logs uploaded so far by this process, by log key and io
+        # type
+        self._partial_chunk_sizes: Dict[str, List[int]] = {}
+
+    @property
+    @abstractmethod
+    def local_manager(self) -> LocalComputeLogManager:
+        """Returns the LocalComputeLogManager that captures the logs before they are uploaded."""
+
+    @property
+    def supports_chunked_partial_uploads(self) -> bool:
+        """Whether partial logs are uploaded as chunks."""
+        return True
+
+    @abstractmethod
+    def upload_partial_chunk(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_index: int, data: bytes
+    ) -> None:
+        """Uploads a single chunk of partial logs for a given log key."""
+
+    @abstractmethod
+    def download_partial_chunk(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunk_index: int,
+        start: int,
+        end: int,
+    ) -> bytes:
+        """Downloads the bytes in the range [start, end) of a single chunk of partial logs."""
+
+    @abstractmethod
+    def upload_partial_manifest(
+        self, log_key: Sequence[str], io_type: ComputeIOType, manifest: bytes
+    ) -> None:
+        """Uploads the serialized manifest of the partial log chunks for a given log key."""
+
+    @abstractmethod
+    def download_partial_manifest(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Optional[bytes]:
+        """Downloads the serialized manifest of the partial log chunks for a given log key, or
+        returns None if there is none.
+        """
+
+    def clear_partial_chunk_sizes(self, log_key: Sequence[str]) -> None:
+        self._partial_chunk_sizes.pop(_partial_upload_key(log_key, ComputeIOType.STDOUT), None)
+        self._partial_chunk_sizes.pop(_partial_upload_key(log_key, ComputeIOType.STDERR), None)
+
+    def upload_partial_chunks(self, log_key: Sequence[str], io_type: ComputeIOType) -> None:
+        """Uploads the bytes written to the local log file since the last partial upload as new
+        chunks, followed by the updated manifest.
+        """
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        if not os.path.exists(path):
+            return
+
+        chunk_sizes = self._partial_chunk_sizes.setdefault(
+            _partial_upload_key(log_key, io_type), []
+        )
+        uploaded_bytes = sum(chunk_sizes)
+        if os.stat(path).st_size <= uploaded_bytes:
+            return
+
+        with open(path, "rb") as f:
+            f.seek(uploaded_bytes)
+            while True:
+                data = f.read(MAX_PARTIAL_CHUNK_SIZE)
+                if not data:
+                    break
+                self.upload_partial_chunk(log_key, io_type, len(chunk_sizes), data)
+                chunk_sizes.append(len(data))
+
+        # the manifest is written after the chunks it references, so that readers never see a
+        # chunk in the manifest that hasn't been uploaded yet
+        self.upload_partial_manifest(
+            log_key, io_type, json.dumps({"chunk_sizes": chunk_sizes}).encode("utf-8")
+        )
+
+    def read_partial_chunks(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: Optional[int],
+    ) -> Optional[Tuple[bytes, int]]:
+        """Reads up to max_bytes of chunked partial logs starting at offset, only downloading the
+        chunks that overlap the requested range. Returns None if there are no chunked partial logs.
+        """
+        manifest = self.download_partial_manifest(log_key, io_type)
+        if manifest is None:
+            return None
+
+        chunk_sizes: Sequence[int] = json.loads(manifest)["chunk_sizes"]
+        end = sum(chunk_sizes) if max_bytes is None else min(sum(chunk_sizes), offset + max_bytes)
+
+        data = []
+        chunk_start = 0
+        for chunk_index, chunk_size in enumerate(chunk_sizes):
+            chunk_end = chunk_start + chunk_size
+            if chunk_end > offset and chunk_start < end:
+                data.append(
+                    self.download_partial_chunk(
+                        log_key,
+                        io_type,
+                        chunk_index,
+                        max(offset, chunk_start) - chunk_start,
+                        min(end, chunk_end) - chunk_start,
+                    )
+                )
+            chunk_start = chunk_end
+
+        read = b"".join(data)
+        return read, offset + len(read)
+
+
 class PollingComputeLogSubscriptionManager:
     def __init__(self, manager):
         self._manager = manager
@@ -399,6 +583,10 @@ def dispose(self) -> None:
             self._shutdown_event.set()
 
 
+def _partial_upload_key(log_key: Sequence[str], io_type: ComputeIOType) -> str:
+    return json.dumps([*log_key, io_type.value])
+
+
 def _upload_partial_logs(
     compute_log_manager: CloudStorageComputeLogManager,
     log_key: Sequence[str],
@@ -1,14 +1,18 @@
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from contextlib import contextmanager
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Type,
     TypeVar,
     Union,
@@ -17,6 +21,7 @@
 
 import dagster._check as check
 from dagster._check import CheckError
+from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
@@ -45,6 +50,7 @@ class TableSlice(NamedTuple):
     database: Optional[str] = None
     columns: Optional[Sequence[str]] = None
     partition_dimensions: Optional[Sequence[TablePartitionDimension]] = None
+    filter: Optional[str] = None
 
 
 class DbTypeHandler(ABC, Generic[T]):
@@ -85,6 +91,15 @@ def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connec
     def connect(context: Union[OutputContext, InputContext], table_slice: TableSlice):
         ...
 
+    @staticmethod
+    @contextmanager
+    def transaction(context: OutputContext, table_slice: TableSlice, connection) -> Iterator[None]:
+        """Wraps deleting the existing data in a table slice and writing the new data, so that
+        clients whose database supports transactions can replace the slice atomically. By default,
+        no transaction is used.
+        """
+        yield
+
 
 class DbIOManager(IOManager):
     def __init__(
@@ -132,12 +147,15 @@ def handle_output(self, context: OutputContext, obj: object) -> None:
 
             with self._db_client.connect(context, table_slice) as conn:
                 self._db_client.ensure_schema_exists(context, table_slice, conn)
-                self._db_client.delete_table_slice(context, table_slice, conn)
+                with self._db_client.transaction(context, table_slice, conn):
+                    self._db_client.delete_table_slice(context, table_slice, conn)
 
-                handler_metadata = (
-                    self._handlers_by_type[obj_type].handle_output(context, table_slice, obj, conn)
-                    or {}
-                )
+                    handler_metadata = (
+                        self._handlers_by_type[obj_type].handle_output(
+                            context, table_slice, obj, conn
+                        )
+                        or {}
+                    )
         else:
             check.invariant(
                 context.dagster_type.is_nothing,
@@ -202,32 +220,14 @@ def _get_table_slice(
                     )
 
                 if isinstance(context.asset_partitions_def, MultiPartitionsDefinition):
-                    multi_partition_key_mapping = cast(
-                        MultiPartitionKey, context.asset_partition_key
-                    ).keys_by_dimension
-                    for part in context.asset_partitions_def.partitions_defs:
-                        partition_key = multi_partition_key_mapping[part.name]
-                        if isinstance(part.partitions_def, TimeWindowPartitionsDefinition):
-                            partitions = part.partitions_def.time_window_for_partition_key(
-                                partition_key
-                            )
-                        else:
-                            partitions = [partition_key]
-
-                        partition_expr_str = cast(Mapping[str, str], partition_expr).get(part.name)
-                        if partition_expr is None:
-                            raise ValueError(
-                                f"Asset '{context.asset_key}' has partition {part.name}, but the"
-                                f" 'partition_expr' metadata does not contain a {part.name} entry,"
-                                " so we don't know what column to filter it on. Specify which"
-                                " column of the database contains data for the"
-                                f" {part.name} partition."
-                            )
-                        partition_dimensions.append(
-                            TablePartitionDimension(
-                                partition_expr=cast(str, partition_expr_str), partitions=partitions
-                            )
+                    partition_dimensions.extend(
+                        _get_multi_partition_dimensions(
+                            context.asset_key,
+                            context.asset_partitions_def,
+                            context.asset_partition_keys,
+                            cast(Mapping[str, str], partition_expr),
                         )
+                    )
                 elif isinstance(context.asset_partitions_def, TimeWindowPartitionsDefinition):
                     partition_dimensions.append(
                         TablePartitionDimension(
@@ -264,6 +264,7 @@ def _get_table_slice(
             database=self._database,
             partition_dimensions=partition_dimensions,
             columns=(context.metadata or {}).get("columns"),
+            filter=(context.metadata or {}).get("filter"),
         )
 
     def _check_supported_type(self, obj_type):
@@ -287,3 +288,81 @@ def _check_supported_type(self, obj_type):
                 )
 
             raise CheckError(msg)
+
+
+def _get_multi_partition_dimensions(
+    asset_key: AssetKey,
+    partitions_def: MultiPartitionsDefinition,
+    partition_keys: Sequence[str],
+    partition_expr: Mapping[str, str],
+) -> Sequence[TablePartitionDimension]:
+    """Returns one partition dimension per dimension of the multi-partitions definition, so that a
+    run targeting many multi-partitions reads and replaces them with a single query.
+    """
+    keys_by_dimension: Dict[str, Set[str]] = defaultdict(set)
+    multi_partition_keys = set()
+    for partition_key in partition_keys:
+        multi_partition_key = cast(
+            MultiPartitionKey,
+            partition_key
+            if isinstance(partition_key, MultiPartitionKey)
+            else partitions_def.get_partition_key_from_str(partition_key),
+        )
+        multi_partition_keys.add(multi_partition_key)
+        for dimension_name, key in multi_partition_key.keys_by_dimension.items():
+            keys_by_dimension[dimension_name].add(key)
+
+    # A predicate per dimension selects the cartesian product of the keys of every dimension, which
+    # only matches the targeted partitions if they form that product.
+    num_combinations = 1
+    for keys in keys_by_dimension.values():
+        num_combinations *= len(keys)
+    if num_combinations != len(multi_partition_keys):
+        raise ValueError(
+            f"Asset '{asset_key}' is targeted for partitions {sorted(multi_partition_keys)}, which"
+            " do not cover every combination of their dimension keys, so they can't be selected"
+            " with a single query. Target a partition range in each dimension instead."
+        )
+
+    partition_dimensions = []
+    for dimension in partitions_def.partitions_defs:
+        partition_expr_str = partition_expr.get(dimension.name)
+        if partition_expr_str is None:
+            raise ValueError(
+                f"Asset '{asset_key}' has partition {dimension.name}, but the"
+                f" 'partition_expr' metadata does not contain a {dimension.name} entry,"
+                " so we don't know what column to filter it on. Specify which"
+                " column of the database contains data for the"
+                f" {dimension.name} partition."
+            )
+
+        keys = keys_by_dimension[dimension.name]
+        partitions: Union[TimeWindow, Sequence[str]]
+        if isinstance(dimension.partitions_def, TimeWindowPartitionsDefinition):
+            partitions = _time_window_for_partition_keys(asset_key, dimension.partitions_def, keys)
+        else:
+            partitions = sorted(keys)
+
+        partition_dimensions.append(
+            TablePartitionDimension(partition_expr=partition_expr_str, partitions=partitions)
+        )
+
+    return partition_dimensions
+
+
+def _time_window_for_partition_keys(
+    asset_key: AssetKey,
+    partitions_def: TimeWindowPartitionsDefinition,
+    partition_keys: AbstractSet[str],
+) -> TimeWindow:
+    time_windows = sorted(
+        (partitions_def.time_window_for_partition_key(key) for key in partition_keys),
+        key=lambda time_window: time_window.start,
+    )
+    for prev_window, next_window in zip(time_windows, time_windows[1:]):
+        if prev_window.end != next_window.start:
+            raise ValueError(
+                f"Asset '{asset_key}' is targeted for time partitions {sorted(partition_keys)},"
+                " which are not contiguous, so they can't be selected with a single time window."
+            )
+    return TimeWindow(time_windows[0].start, time_windows[-1].end)
@@ -3,6 +3,7 @@
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Mapping,
     NamedTuple,
     Optional,
@@ -213,6 +214,16 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order. Storages that can write several events at once more
+        cheaply than one at a time should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -372,6 +383,60 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_materialization_records_after_cursors(
+        self,
+        after_cursor_by_asset_key: Mapping[AssetKey, Optional[int]],
+        by_partition: bool = False,
+        asset_partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Fetches the latest materialization record for each of the given asset keys, considering
+        only materializations after the storage id cursor for that asset key. If by_partition is
+        set, fetches the latest materialization record for each materialized partition of each
+        asset key instead, optionally restricted to the given partitions.
+
+        Returns the records in ascending storage id order.
+        """
+        # base implementation, issuing one query per asset key
+        event_records = []
+        for asset_key, after_cursor in after_cursor_by_asset_key.items():
+            records_filter = EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                asset_partitions=asset_partitions,
+                after_cursor=after_cursor,
+            )
+            if not by_partition:
+                event_records.extend(self.get_event_records(records_filter, limit=1))
+                continue
+
+            latest_record_by_partition = {}
+            for event_record in self.get_event_records(records_filter, ascending=True):
+                if event_record.partition_key is not None:
+                    latest_record_by_partition[event_record.partition_key] = event_record
+            event_records.extend(latest_record_by_partition.values())
+
+        return sorted(event_records, key=lambda event_record: event_record.storage_id)
+
+    def get_latest_storage_id_by_asset_key(
+        self, asset_keys: Sequence[AssetKey], event_types: Sequence[DagsterEventType]
+    ) -> Mapping[AssetKey, int]:
+        """Fetches the storage id of the latest event of any of the given types for each of the
+        given asset keys. Asset keys without any such events are omitted.
+        """
+        # base implementation, issuing one query per asset key and event type
+        latest_storage_id_by_asset_key: Dict[AssetKey, int] = {}
+        for asset_key in asset_keys:
+            for event_type in event_types:
+                event_records = self.get_event_records(
+                    EventRecordsFilter(event_type=event_type, asset_key=asset_key), limit=1
+                )
+                if event_records:
+                    latest_storage_id_by_asset_key[asset_key] = max(
+                        latest_storage_id_by_asset_key.get(asset_key, 0),
+                        event_records[0].storage_id,
+                    )
+        return latest_storage_id_by_asset_key
+
     @abstractmethod
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: AssetKey
@@ -1671,6 +1671,140 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_latest_materialization_records_after_cursors(
+        self,
+        after_cursor_by_asset_key: Mapping[AssetKey, Optional[int]],
+        by_partition: bool = False,
+        asset_partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence[EventLogRecord]:
+        check.mapping_param(
+            after_cursor_by_asset_key, "after_cursor_by_asset_key", key_type=AssetKey
+        )
+        check.bool_param(by_partition, "by_partition")
+        check.opt_sequence_param(asset_partitions, "asset_partitions", of_type=str)
+
+        if not after_cursor_by_asset_key:
+            return []
+
+        # assets usually share the same cursor, so group them to keep the query small
+        asset_keys_by_cursor: Dict[Optional[int], List[AssetKey]] = defaultdict(list)
+        for asset_key, after_cursor in after_cursor_by_asset_key.items():
+            asset_keys_by_cursor[after_cursor].append(asset_key)
+
+        cursor_predicates = []
+        for after_cursor, asset_keys in asset_keys_by_cursor.items():
+            asset_key_predicate = SqlEventLogStorageTable.c.asset_key.in_(
+                [asset_key.to_string() for asset_key in asset_keys]
+            )
+            cursor_predicates.append(
+                asset_key_predicate
+                if after_cursor is None
+                else db.and_(asset_key_predicate, SqlEventLogStorageTable.c.id > after_cursor)
+            )
+
+        group_by_columns = [SqlEventLogStorageTable.c.asset_key]
+        if by_partition:
+            group_by_columns.append(SqlEventLogStorageTable.c.partition)
+
+        latest_event_ids_subquery = (
+            db.select([db.func.max(SqlEventLogStorageTable.c.id).label("id")])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                    db.or_(*cursor_predicates),
+                )
+            )
+            .group_by(*group_by_columns)
+        )
+        if by_partition:
+            latest_event_ids_subquery = latest_event_ids_subquery.where(
+                SqlEventLogStorageTable.c.partition != None  # noqa: E711
+            )
+        if asset_partitions:
+            latest_event_ids_subquery = latest_event_ids_subquery.where(
+                SqlEventLogStorageTable.c.partition.in_(asset_partitions)
+            )
+
+        asset_keys = list(after_cursor_by_asset_key.keys())
+        latest_event_ids_subquery = self._add_assets_wipe_filter_to_query(
+            latest_event_ids_subquery, self._get_assets_details(asset_keys), asset_keys
+        ).alias("latest_materialization_event_ids")
+
+        # only the latest events are read and deserialized, however many materializations match
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .select_from(
+                latest_event_ids_subquery.join(
+                    SqlEventLogStorageTable,
+                    SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        event_records = []
+        for row_id, json_str in results:
+            try:
+                event_record = deserialize_value(json_str, NamedTuple)
+            except seven.JSONDecodeError:
+                logging.warning("Could not parse event record id `%s`.", row_id)
+                continue
+            if not isinstance(event_record, EventLogEntry):
+                logging.warning(
+                    "Could not resolve event record as EventLogEntry for id `%s`.", row_id
+                )
+                continue
+            event_records.append(EventLogRecord(storage_id=row_id, event_log_entry=event_record))
+
+        return event_records
+
+    def get_latest_storage_id_by_asset_key(
+        self, asset_keys: Sequence[AssetKey], event_types: Sequence[DagsterEventType]
+    ) -> Mapping[AssetKey, int]:
+        check.sequence_param(asset_keys, "asset_keys", AssetKey)
+        check.sequence_param(event_types, "event_types", DagsterEventType)
+
+        if not asset_keys or not event_types:
+            return {}
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in event_types]
+                    ),
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+        )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details(asset_keys), asset_keys
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        latest_storage_id_by_asset_key: Dict[AssetKey, int] = {}
+        for asset_key_str, storage_id in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                latest_storage_id_by_asset_key[asset_key] = storage_id
+
+        return latest_storage_id_by_asset_key
+
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: AssetKey
     ) -> Mapping[str, Tuple[str, int]]:
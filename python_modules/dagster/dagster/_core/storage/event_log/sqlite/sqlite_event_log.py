@@ -264,6 +264,29 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write all plain log messages of a run to the run's shard in a
+        single transaction, instead of opening a connection and committing for every event.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if any(event.is_dagster_event for event in events):
+            # dagster events may need to be mirrored in the index shard, so store them one by one
+            super().store_event_batch(events)
+            return
+
+        events_by_run_id = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    for event in run_events:
+                        conn.execute(self.prepare_insert_event(event))
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -395,6 +395,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_event_batch(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -475,6 +478,23 @@ def get_materialization_count_by_partition(
             asset_keys, after_cursor
         )
 
+    def get_latest_materialization_records_after_cursors(
+        self,
+        after_cursor_by_asset_key: Mapping["AssetKey", Optional[int]],
+        by_partition: bool = False,
+        asset_partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence[EventLogRecord]:
+        return self._storage.event_log_storage.get_latest_materialization_records_after_cursors(
+            after_cursor_by_asset_key, by_partition, asset_partitions
+        )
+
+    def get_latest_storage_id_by_asset_key(
+        self, asset_keys: Sequence["AssetKey"], event_types: Sequence["DagsterEventType"]
+    ) -> Mapping["AssetKey", int]:
+        return self._storage.event_log_storage.get_latest_storage_id_by_asset_key(
+            asset_keys, event_types
+        )
+
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: "AssetKey"
     ) -> Mapping[str, Tuple[str, int]]:
@@ -1,4 +1,4 @@
-from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, cast
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, cast
 
 from dagster import (
     AssetKey,
@@ -517,14 +517,34 @@ def _get_fresh_asset_status_cache_value(
     partitions_def: Optional[PartitionsDefinition] = None,
 ) -> Optional[AssetStatusCacheValue]:
     cached_status_data = _fetch_stored_asset_status_cache_value(instance, asset_key)
+    return _get_refreshed_asset_status_cache_value(
+        instance, asset_key, cached_status_data, dynamic_partitions_store, partitions_def
+    )
 
-    updated_cache_value = None
-    if cached_status_data is None or cached_status_data.partitions_def_id != (
+
+def _get_partitions_def_id(
+    partitions_def: Optional[PartitionsDefinition],
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Optional[str]:
+    return (
         partitions_def.get_serializable_unique_identifier(
             dynamic_partitions_store=dynamic_partitions_store
         )
         if partitions_def
         else None
+    )
+
+
+def _get_refreshed_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    cached_status_data: Optional[AssetStatusCacheValue],
+    dynamic_partitions_store: DynamicPartitionsStore,
+    partitions_def: Optional[PartitionsDefinition] = None,
+) -> Optional[AssetStatusCacheValue]:
+    updated_cache_value = None
+    if cached_status_data is None or cached_status_data.partitions_def_id != (
+        _get_partitions_def_id(partitions_def, dynamic_partitions_store)
     ):
         planned_event_records = instance.get_event_records(
             event_records_filter=EventRecordsFilter(
@@ -585,3 +605,61 @@ def get_and_update_asset_status_cache_value(
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
+
+
+def get_and_update_asset_status_cache_values(
+    instance: DagsterInstance,
+    partitions_defs_by_key: Mapping[AssetKey, Optional[PartitionsDefinition]],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+) -> Mapping[AssetKey, Optional[AssetStatusCacheValue]]:
+    """Returns the up-to-date asset status cache value of each of the given assets, updating the
+    stored values that are out of date.
+
+    The stored values, and the latest materialization and materialization planned event of each
+    asset, are fetched with one query each. Only the assets with events that their stored value
+    has not evaluated yet, or with materializations that were in progress when it was evaluated,
+    are then updated one by one, so that the cost of a call grows with the number of assets that
+    have changed rather than with the number of assets.
+    """
+    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    asset_keys = list(partitions_defs_by_key.keys())
+
+    stored_value_by_key = {
+        record.asset_entry.asset_key: record.asset_entry.cached_status
+        for record in instance.get_asset_records(asset_keys)
+    }
+    latest_storage_id_by_key = instance.get_latest_storage_id_by_asset_key(
+        asset_keys,
+        [
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+        ],
+    )
+
+    cache_value_by_key: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    for asset_key, partitions_def in partitions_defs_by_key.items():
+        stored_value = stored_value_by_key.get(asset_key)
+        latest_storage_id = latest_storage_id_by_key.get(asset_key)
+        if stored_value is None and latest_storage_id is None:
+            # the asset has no events to evaluate
+            cache_value_by_key[asset_key] = None
+            continue
+
+        if (
+            stored_value is not None
+            and stored_value.latest_storage_id >= (latest_storage_id or 0)
+            and stored_value.earliest_in_progress_materialization_event_id is None
+            and stored_value.partitions_def_id
+            == _get_partitions_def_id(partitions_def, dynamic_partitions_store)
+        ):
+            cache_value_by_key[asset_key] = stored_value
+            continue
+
+        updated_cache_value = _get_refreshed_asset_status_cache_value(
+            instance, asset_key, stored_value, dynamic_partitions_store, partitions_def
+        )
+        if updated_cache_value:
+            instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+        cache_value_by_key[asset_key] = updated_cache_value
+
+    return cache_value_by_key
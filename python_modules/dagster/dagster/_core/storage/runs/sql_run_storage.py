@@ -128,9 +128,7 @@ def add_run(self, pipeline_run: DagsterRun) -> DagsterRun:
             pipeline_run.pipeline_snapshot_id
         ):
             raise DagsterSnapshotDoesNotExist(
-                "Snapshot {ss_id} does not exist in run storage".format(
-                    ss_id=pipeline_run.pipeline_snapshot_id
-                )
+                f"Snapshot {pipeline_run.pipeline_snapshot_id} does not exist in run storage"
             )
 
         has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
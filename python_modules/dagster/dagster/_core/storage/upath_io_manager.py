@@ -1,5 +1,7 @@
+import time
 from abc import abstractmethod
-from typing import Any, Dict, Mapping, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 from upath import UPath
 
@@ -23,7 +25,13 @@ class UPathIOManager(MemoizableIOManager):
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
+     - multiple upstream partitions can be loaded concurrently by setting `max_workers` to a value
+       greater than 1. In that case `load_from_path` must be thread-safe.
 
+    Args:
+        base_path (UPath): base directory where the objects are stored.
+        max_workers (int): maximum number of partitions loaded concurrently when an input depends
+            on multiple upstream partitions. Defaults to 1, which loads partitions sequentially.
     """
 
     extension: str = ""  # override in child class
@@ -31,10 +39,13 @@ class UPathIOManager(MemoizableIOManager):
     def __init__(
         self,
         base_path: UPath,
+        max_workers: int = 1,
     ):
         assert self.extension == "" or "." in self.extension
 
         self._base_path = base_path
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        check.param_invariant(self._max_workers >= 1, "max_workers", "must be at least 1")
 
     @abstractmethod
     def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
@@ -148,6 +159,35 @@ def _load_single_input(
         context.add_input_metadata({"path": MetadataValue.path(str(path))})
         return obj
 
+    def _load_partition_from_path(
+        self,
+        context: InputContext,
+        path: UPath,
+        backcompat_path: Optional[UPath],
+        allow_missing_partitions: bool,
+    ) -> Optional[Any]:
+        """Loads a single partition of a multi-partition input. Returns None if the partition is
+        missing and `allow_missing_partitions` is set.
+        """
+        context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+        obj = None
+        try:
+            obj = self.load_from_path(context=context, path=path)
+        except FileNotFoundError as e:
+            if backcompat_path is not None:
+                obj = self.load_from_path(context=context, path=backcompat_path)
+
+            if not allow_missing_partitions and obj is None:
+                raise e
+
+            if obj is None:
+                context.log.debug(
+                    f"Couldn't load partition {path} and skipped it "
+                    "because the input metadata includes allow_missing_partitions=True"
+                )
+
+        return obj
+
     def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
         # load multiple partitions
         allow_missing_partitions = (
@@ -156,32 +196,61 @@ def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
             else False
         )
 
-        objs: Dict[str, Any] = {}
         paths = self._get_paths_for_partitions(context)
         backcompat_paths = self._get_multipartition_backcompat_paths(context)
 
-        context.log.debug(f"Loading {len(paths)} partitions...")
+        def _load_timed(partition_key: str, path: UPath) -> Tuple[Optional[Any], float]:
+            start_time = time.perf_counter()
+            obj = self._load_partition_from_path(
+                context,
+                path,
+                backcompat_paths.get(partition_key),
+                allow_missing_partitions,
+            )
+            return obj, time.perf_counter() - start_time
 
-        for partition_key, path in paths.items():
-            context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
-            try:
-                obj = self.load_from_path(context=context, path=path)
-                objs[partition_key] = obj
-            except FileNotFoundError as e:
-                backcompat_path = backcompat_paths.get(partition_key)
-                if backcompat_path is not None:
-                    obj = self.load_from_path(context=context, path=backcompat_path)
-                    objs[partition_key] = obj
+        context.log.debug(f"Loading {len(paths)} partitions...")
 
-                if not allow_missing_partitions and objs.get(partition_key) is None:
-                    raise e
+        results: Dict[str, Tuple[Optional[Any], float]] = {}
+        if self._max_workers == 1 or len(paths) <= 1:
+            for partition_key, path in paths.items():
+                results[partition_key] = _load_timed(partition_key, path)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(paths)),
+                thread_name_prefix="upath_io_manager",
+            ) as executor:
+                futures = {
+                    partition_key: executor.submit(_load_timed, partition_key, path)
+                    for partition_key, path in paths.items()
+                }
+                try:
+                    # collect in partition order so that the returned dict is ordered the same
+                    # way as in the sequential case
+                    for partition_key, future in futures.items():
+                        results[partition_key] = future.result()
+                except Exception:
+                    for future in futures.values():
+                        future.cancel()
+                    raise
+
+        objs = {
+            partition_key: obj for partition_key, (obj, _) in results.items() if obj is not None
+        }
 
-                context.log.debug(
-                    f"Couldn't load partition {path} and skipped it "
-                    "because the input metadata includes allow_missing_partitions=True"
-                )
+        context.add_input_metadata(
+            {
+                "num_partitions_loaded": MetadataValue.int(len(objs)),
+                "partition_load_seconds": MetadataValue.json(
+                    {
+                        partition_key: round(seconds, 6)
+                        for partition_key, (obj, seconds) in results.items()
+                        if obj is not None
+                    }
+                ),
+            }
+        )
 
-        # TODO: context.add_output_metadata fails in the partitioned context. this should be fixed?
         return objs
 
     def load_input(self, context: InputContext) -> Union[Any, Dict[str, Any]]:
@@ -0,0 +1,122 @@
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+import grpc
+
+import dagster._check as check
+
+# server address and whether the channel uses ssl
+ChannelKey = Tuple[str, bool]
+
+DEFAULT_MAX_CHANNELS = 64
+
+
+class _PooledChannel:
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.active_count = 0
+        self.evicted = False
+
+
+class GrpcChannelPool:
+    """Keeps one long-lived gRPC channel per server, so that clients talking to the same server
+    share its connection instead of opening a new one for every call.
+
+    Channels are thread-safe, so any number of calls can use a pooled channel at once. A channel is
+    evicted from the pool when a call on it finds the server unavailable, so that the next call
+    connects again from scratch, and the least recently used channel is evicted once the pool
+    holds more than ``max_channels`` channels. Evicted channels are closed once the calls that are
+    still using them finish.
+
+    Channels are never shared across processes, since a gRPC channel cannot be used after a fork.
+    """
+
+    def __init__(self, max_channels: int = DEFAULT_MAX_CHANNELS):
+        self._max_channels = check.int_param(max_channels, "max_channels")
+        check.param_invariant(self._max_channels >= 1, "max_channels", "must be at least 1")
+
+        self._lock = threading.Lock()
+        self._channels: "OrderedDict[ChannelKey, _PooledChannel]" = OrderedDict()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def channel(
+        self, key: ChannelKey, create_channel: Callable[[], grpc.Channel]
+    ) -> Iterator[grpc.Channel]:
+        """Yields the pooled channel for the given key, creating it if needed."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # the parent process owns the channels it created, so forget them without closing
+                self._channels = OrderedDict()
+                self._pid = os.getpid()
+
+            pooled = self._channels.get(key)
+            if pooled is None:
+                pooled = _PooledChannel(create_channel())
+                self._channels[key] = pooled
+                to_close = self._evict_least_recently_used()
+            else:
+                self._channels.move_to_end(key)
+                to_close = []
+            pooled.active_count += 1
+
+        for channel in to_close:
+            channel.close()
+
+        try:
+            yield pooled.channel
+        finally:
+            with self._lock:
+                pooled.active_count -= 1
+                close = pooled.evicted and pooled.active_count == 0
+            if close:
+                pooled.channel.close()
+
+    def evict(self, key: ChannelKey, channel: grpc.Channel) -> None:
+        """Removes the channel from the pool, unless it was already replaced by a new channel."""
+        with self._lock:
+            pooled = self._channels.get(key)
+            if pooled is None or pooled.channel is not channel:
+                return
+            del self._channels[key]
+            pooled.evicted = True
+            close = pooled.active_count == 0
+        if close:
+            channel.close()
+
+    def _evict_least_recently_used(self) -> List[grpc.Channel]:
+        to_close = []
+        while len(self._channels) > self._max_channels:
+            _, pooled = self._channels.popitem(last=False)
+            pooled.evicted = True
+            if pooled.active_count == 0:
+                to_close.append(pooled.channel)
+        return to_close
+
+    def clear(self) -> None:
+        """Evicts every channel in the pool."""
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            channels = list(self._channels.values())
+            self._channels = OrderedDict()
+
+        for pooled in channels:
+            with self._lock:
+                pooled.evicted = True
+                close = pooled.active_count == 0
+            if close:
+                pooled.channel.close()
+
+
+_GRPC_CHANNEL_POOL = GrpcChannelPool()
+atexit.register(_GRPC_CHANNEL_POOL.clear)
+
+
+def get_grpc_channel_pool() -> GrpcChannelPool:
+    """The channel pool shared by every gRPC client in this process."""
+    return _GRPC_CHANNEL_POOL
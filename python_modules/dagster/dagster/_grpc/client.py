@@ -33,10 +33,16 @@
     PipelineSubsetSnapshotArgs,
     SensorExecutionArgs,
 )
-from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes
+from .channel_pool import get_grpc_channel_pool
+from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes, use_grpc_channel_pool
 
 CLIENT_HEARTBEAT_INTERVAL = 1
 
+# ping idle connections during long calls to notice dead servers, no more often than gRPC servers
+# allow by default
+CHANNEL_KEEPALIVE_TIME_MS = 5 * 60 * 1000
+CHANNEL_KEEPALIVE_TIMEOUT_MS = 20 * 1000
+
 DEFAULT_GRPC_TIMEOUT = default_grpc_timeout()
 
 
@@ -97,13 +103,14 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
+    def _create_channel(self) -> grpc.Channel:
         options = [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
+            ("grpc.keepalive_time_ms", CHANNEL_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_timeout_ms", CHANNEL_KEEPALIVE_TIMEOUT_MS),
         ]
-        with (
+        return (
             grpc.secure_channel(
                 self._server_address,
                 self._ssl_creds,
@@ -116,8 +123,25 @@ def _channel(self) -> Iterator[grpc.Channel]:
                 options=options,
                 compression=grpc.Compression.Gzip,
             )
-        ) as channel:
-            yield channel
+        )
+
+    @contextmanager
+    def _channel(self) -> Iterator[grpc.Channel]:
+        if not use_grpc_channel_pool():
+            with self._create_channel() as channel:
+                yield channel
+            return
+
+        channel_pool = get_grpc_channel_pool()
+        key = (self._server_address, self._use_ssl)
+        with channel_pool.channel(key, self._create_channel) as channel:
+            try:
+                yield channel
+            except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.UNAVAILABLE:  # type: ignore  # (bad stubs)
+                    # connect from scratch on the next call, in case the connection is broken
+                    channel_pool.evict(key, channel)
+                raise
 
     def _get_response(
         self,
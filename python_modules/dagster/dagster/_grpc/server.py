@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import math
 import multiprocessing
 import os
@@ -44,6 +45,7 @@
     safe_tempfile_path_unmanaged,
 )
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+from dagster._utils.startup_profiler import get_startup_profiler, is_startup_profiling_enabled
 
 from .__generated__ import api_pb2
 from .__generated__.api_pb2_grpc import DagsterApiServicer, add_DagsterApiServicer_to_server
@@ -81,7 +83,12 @@
     ShutdownServerResult,
     StartRunResult,
 )
-from .utils import get_loadable_targets, max_rx_bytes, max_send_bytes
+from .utils import (
+    get_loadable_targets,
+    max_definition_load_workers,
+    max_rx_bytes,
+    max_send_bytes,
+)
 
 EVENT_QUEUE_POLL_INTERVAL = 0.1
 
@@ -127,11 +134,12 @@ def __init__(
                 sys.executable,
                 entry_point=entry_point,
             )
-            repo_def = recon_repo.get_definition()
-            # force load of all lazy constructed code artifacts to prevent
-            # any thread-safety issues loading them later on when serving
-            # definitions from multiple threads
-            repo_def.load_all_definitions()
+            with get_startup_profiler().profile("repository", loadable_target.attribute):
+                repo_def = recon_repo.get_definition()
+                # force load of all lazy constructed code artifacts to prevent
+                # any thread-safety issues loading them later on when serving
+                # definitions from multiple threads
+                repo_def.load_all_definitions(max_workers=max_definition_load_workers())
 
             self._code_pointers_by_repo_name[repo_def.name] = pointer
             self._recon_repos_by_name[repo_def.name] = recon_repo
@@ -143,6 +151,9 @@ def __init__(
                 )
             )
 
+        if is_startup_profiling_enabled():
+            logging.getLogger("dagster").info(get_startup_profiler().format_report())
+
     @property
     def loadable_repository_symbols(self) -> Sequence[LoadableRepositorySymbol]:
         return self._loadable_repository_symbols
@@ -236,6 +247,9 @@ def __init__(
 
         self._serializable_load_error = None
 
+        self._serialized_external_repository_data: Dict[Tuple[str, bool], str] = {}
+        self._serialized_external_repository_data_lock = threading.Lock()
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -524,13 +538,21 @@ def _get_serialized_external_repository_data(self, request):
                 request.serialized_repository_python_origin,
                 ExternalRepositoryOrigin,
             )
-
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
-            )
+            repository_def = self._get_repo_for_origin(repository_origin)
+
+            # the loaded repositories don't change for the lifetime of the server, so the snapshot
+            # only needs to be built once for every client that requests it
+            cache_key = (repository_def.name, bool(request.defer_snapshots))
+            with self._serialized_external_repository_data_lock:
+                if cache_key not in self._serialized_external_repository_data:
+                    with get_startup_profiler().profile("snapshot", repository_def.name):
+                        self._serialized_external_repository_data[cache_key] = serialize_value(
+                            external_repository_data_from_def(
+                                repository_def,
+                                defer_snapshots=request.defer_snapshots,
+                            )
+                        )
+                return self._serialized_external_repository_data[cache_key]
         except Exception:
             return serialize_value(
                 ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
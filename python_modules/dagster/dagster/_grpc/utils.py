@@ -78,6 +78,20 @@ def max_send_bytes() -> int:
     return 50 * (10**6)
 
 
+def max_definition_load_workers() -> int:
+    env_set = os.getenv("DAGSTER_DEFINITION_LOAD_MAX_WORKERS")
+    if env_set:
+        return int(env_set)
+
+    # default to constructing lazily defined jobs one after another
+    return 1
+
+
+def use_grpc_channel_pool() -> bool:
+    # clients share one long-lived channel per server unless this is set
+    return not os.getenv("DAGSTER_GRPC_DISABLE_CHANNEL_POOL")
+
+
 def default_grpc_timeout() -> int:
     env_set = os.getenv("DAGSTER_GRPC_TIMEOUT_SECONDS")
     if env_set:
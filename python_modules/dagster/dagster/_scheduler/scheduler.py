@@ -1,4 +1,5 @@
 import datetime
+import heapq
 import logging
 import os
 import sys
@@ -7,7 +8,7 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, cast
+from typing import TYPE_CHECKING, Dict, Hashable, List, Mapping, Optional, Tuple, cast
 
 import pendulum
 
@@ -104,6 +105,65 @@ def __exit__(self, exception_type, exception_value, traceback):
             )
 
 
+class ScheduleNextTickTimes:
+    """Remembers when each running schedule is next due to tick, so that the scheduler can skip
+    schedules that have nothing to do without loading their ticks.
+
+    A schedule's next tick time is only recorded once every tick up to it has been evaluated, and
+    it is keyed by the schedule's cron schedule, timezone, and start time, so that restarting or
+    redefining a schedule makes it due again immediately. Entries are kept in a min-heap, so that
+    finding the schedules that have become due only looks at those schedules.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Tuple[int, Hashable]] = {}
+        self._counter = 0
+
+    @staticmethod
+    def _fingerprint(external_schedule: ExternalSchedule, schedule_state: InstigatorState):
+        cron_schedule = external_schedule.cron_schedule
+        instigator_data = cast(ScheduleInstigatorData, schedule_state.instigator_data)
+        return (
+            cron_schedule if isinstance(cron_schedule, str) else tuple(cron_schedule),
+            external_schedule.execution_timezone,
+            instigator_data.start_timestamp,
+        )
+
+    def set_next_tick_time(
+        self,
+        external_schedule: ExternalSchedule,
+        schedule_state: InstigatorState,
+        next_tick_timestamp: float,
+    ) -> None:
+        with self._lock:
+            self._counter += 1
+            self._entries[external_schedule.selector_id] = (
+                self._counter,
+                self._fingerprint(external_schedule, schedule_state),
+            )
+            heapq.heappush(
+                self._heap, (next_tick_timestamp, self._counter, external_schedule.selector_id)
+            )
+
+    def expire(self, timestamp: float) -> None:
+        """Forgets the next tick time of every schedule that is due to tick by the given time."""
+        with self._lock:
+            while self._heap and self._heap[0][0] <= timestamp:
+                _, counter, selector_id = heapq.heappop(self._heap)
+                # entries that were replaced by a later call to set_next_tick_time are stale
+                entry = self._entries.get(selector_id)
+                if entry and entry[0] == counter:
+                    del self._entries[selector_id]
+
+    def is_idle(self, external_schedule: ExternalSchedule, schedule_state: InstigatorState) -> bool:
+        """Whether the schedule is known to have no tick due before its recorded next tick time."""
+        with self._lock:
+            entry = self._entries.get(external_schedule.selector_id)
+        return bool(entry) and entry[1] == self._fingerprint(external_schedule, schedule_state)
+
+
 SECONDS_IN_MINUTE = 60
 VERBOSE_LOGS_INTERVAL = 60
 
@@ -124,6 +184,7 @@ def execute_scheduler_iteration_loop(
 ) -> "DaemonIterator":
     schedule_state_lock = threading.Lock()
     scheduler_run_futures: Dict[str, Future] = {}
+    next_tick_times = ScheduleNextTickTimes()
 
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("schedules")
@@ -156,6 +217,7 @@ def execute_scheduler_iteration_loop(
                 max_catchup_runs=max_catchup_runs,
                 max_tick_retries=max_tick_retries,
                 log_verbose_checks=verbose_logs_iteration,
+                next_tick_times=next_tick_times,
             )
             yield
             end_time = pendulum.now("UTC").timestamp()
@@ -183,9 +245,13 @@ def launch_scheduled_runs(
     max_tick_retries: int = 0,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     log_verbose_checks: bool = True,
+    next_tick_times: Optional[ScheduleNextTickTimes] = None,
 ) -> "DaemonIterator":
     instance = workspace_process_context.instance
 
+    if next_tick_times:
+        next_tick_times.expire(end_datetime_utc.timestamp())
+
     if not schedule_state_lock:
         schedule_state_lock = threading.Lock()
 
@@ -310,6 +376,9 @@ def launch_scheduled_runs(
                 )
                 instance.add_instigator_state(schedule_state)
 
+            if next_tick_times and next_tick_times.is_idle(external_schedule, schedule_state):
+                continue
+
             schedule_debug_crash_flags = (
                 debug_crash_flags.get(schedule_state.instigator_name) if debug_crash_flags else None
             )
@@ -340,6 +409,7 @@ def launch_scheduled_runs(
                     tick_retention_settings,
                     schedule_debug_crash_flags,
                     log_verbose_checks=log_verbose_checks,
+                    next_tick_times=next_tick_times,
                 )
                 scheduler_run_futures[external_schedule.selector_id] = future
                 yield
@@ -359,6 +429,7 @@ def launch_scheduled_runs(
                     tick_retention_settings,
                     schedule_debug_crash_flags,
                     log_verbose_checks=log_verbose_checks,
+                    next_tick_times=next_tick_times,
                 )
         except Exception:
             error_info = serializable_error_info_from_exc_info(sys.exc_info())
@@ -378,6 +449,7 @@ def launch_scheduled_runs_for_schedule(
     tick_retention_settings: Mapping[TickStatus, int],
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     log_verbose_checks: bool,
+    next_tick_times: Optional[ScheduleNextTickTimes] = None,
 ) -> None:
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -394,6 +466,7 @@ def launch_scheduled_runs_for_schedule(
             tick_retention_settings,
             schedule_debug_crash_flags,
             log_verbose_checks,
+            next_tick_times,
         )
     )
 
@@ -410,6 +483,7 @@ def launch_scheduled_runs_for_schedule_iterator(
     tick_retention_settings: Mapping[TickStatus, int],
     schedule_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     log_verbose_checks: bool,
+    next_tick_times: Optional[ScheduleNextTickTimes] = None,
 ) -> "DaemonIterator":
     schedule_state = check.inst_param(schedule_state, "schedule_state", InstigatorState)
     end_datetime_utc = check.inst_param(end_datetime_utc, "end_datetime_utc", datetime.datetime)
@@ -457,8 +531,10 @@ def launch_scheduled_runs_for_schedule_iterator(
             )
 
     tick_times: List[datetime.datetime] = []
+    next_tick_time: Optional[datetime.datetime] = None
     for next_time in external_schedule.execution_time_iterator(start_timestamp_utc):
         if next_time.timestamp() > end_datetime_utc.timestamp():
+            next_tick_time = next_time
             break
 
         tick_times.append(next_time)
@@ -466,6 +542,10 @@ def launch_scheduled_runs_for_schedule_iterator(
     if not tick_times:
         if log_verbose_checks:
             logger.info(f"No new tick times to evaluate for {schedule_name}")
+        if next_tick_times and next_tick_time:
+            next_tick_times.set_next_tick_time(
+                external_schedule, schedule_state, next_tick_time.timestamp()
+            )
         return
 
     if not external_schedule.partition_set_name and len(tick_times) > 1:
@@ -556,6 +636,13 @@ def launch_scheduled_runs_for_schedule_iterator(
                     yield error_data
                     return
 
+    # every tick up to now was evaluated without failing, so there is nothing to retry until the
+    # next tick time
+    if next_tick_times and next_tick_time:
+        next_tick_times.set_next_tick_time(
+            external_schedule, schedule_state, next_tick_time.timestamp()
+        )
+
 
 def _check_for_debug_crash(
     debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags], key: str
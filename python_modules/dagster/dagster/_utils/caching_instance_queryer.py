@@ -1,3 +1,4 @@
+import threading
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -35,7 +36,8 @@
 class CachingInstanceQueryer(DynamicPartitionsStore):
     """Provides utility functions for querying for asset-materialization related data from the
     instance which will attempt to limit redundant expensive calls. Intended for use within the
-    scope of a single "request" (e.g. GQL request, sensor tick).
+    scope of a single "request" (e.g. GQL request, sensor tick). The caches are filled under a
+    lock, so that the queryer can be shared by resolvers that run on different threads.
 
     Args:
         instance (DagsterInstance): The instance to query.
@@ -43,6 +45,8 @@ class CachingInstanceQueryer(DynamicPartitionsStore):
 
     def __init__(self, instance: DagsterInstance):
         self._instance = instance
+        # reentrant, since filling one cache may fill another
+        self._lock = threading.RLock()
 
         self._asset_record_cache: Dict[AssetKey, Optional[AssetRecord]] = {}
         self._latest_materialization_record_cache: Dict[
@@ -67,61 +71,68 @@ def prefetch_asset_partition_counts(
         self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int]
     ):
         """For performance, batches together queries for selected assets."""
-        self._asset_partition_count_cache[None] = dict(
-            self.instance.get_materialization_count_by_partition(
-                asset_keys=asset_keys,
-                after_cursor=None,
-            )
-        )
-        if after_cursor is not None:
-            self._asset_partition_count_cache[after_cursor] = dict(
+        with self._lock:
+            self._asset_partition_count_cache[None] = dict(
                 self.instance.get_materialization_count_by_partition(
                     asset_keys=asset_keys,
-                    after_cursor=after_cursor,
+                    after_cursor=None,
                 )
             )
+            if after_cursor is not None:
+                self._asset_partition_count_cache[after_cursor] = dict(
+                    self.instance.get_materialization_count_by_partition(
+                        asset_keys=asset_keys,
+                        after_cursor=after_cursor,
+                    )
+                )
 
     def prefetch_asset_records(self, asset_keys: Sequence[AssetKey]):
         """For performance, batches together queries for selected assets."""
-        # get all asset records for the selected assets
-        asset_records = self.instance.get_asset_records(asset_keys)
-        for asset_record in asset_records:
-            self._asset_record_cache[asset_record.asset_entry.asset_key] = asset_record
-
-        for asset_key in asset_keys:
-            # if an asset has no materializations, it may not have an asset record
-            asset_record = self._asset_record_cache.get(asset_key)
-            if asset_record is None:
-                self._asset_record_cache[asset_key] = None
-
-            # use the asset record to determine the latest materialization record
-            latest_materialization_record = (
-                asset_record.asset_entry.last_materialization_record if asset_record else None
-            )
-            self._latest_materialization_record_cache[
-                AssetKeyPartitionKey(asset_key=asset_key)
-            ] = latest_materialization_record
-
-            # if we have a latest materialization record, then we also know what partition this
-            # record was associated with (if any)
-            if latest_materialization_record is not None:
+        with self._lock:
+            # get all asset records for the selected assets
+            asset_records = self.instance.get_asset_records(asset_keys)
+            for asset_record in asset_records:
+                self._asset_record_cache[asset_record.asset_entry.asset_key] = asset_record
+
+            for asset_key in asset_keys:
+                # if an asset has no materializations, it may not have an asset record
+                asset_record = self._asset_record_cache.get(asset_key)
+                if asset_record is None:
+                    self._asset_record_cache[asset_key] = None
+
+                # use the asset record to determine the latest materialization record
+                latest_materialization_record = (
+                    asset_record.asset_entry.last_materialization_record if asset_record else None
+                )
                 self._latest_materialization_record_cache[
-                    AssetKeyPartitionKey(
-                        asset_key=asset_key,
-                        partition_key=latest_materialization_record.partition_key,
-                    )
+                    AssetKeyPartitionKey(asset_key=asset_key)
                 ] = latest_materialization_record
 
+                # if we have a latest materialization record, then we also know what partition this
+                # record was associated with (if any)
+                if latest_materialization_record is not None:
+                    self._latest_materialization_record_cache[
+                        AssetKeyPartitionKey(
+                            asset_key=asset_key,
+                            partition_key=latest_materialization_record.partition_key,
+                        )
+                    ] = latest_materialization_record
+
     ####################
     # MATERIALIZATION / ASSET RECORDS
     ####################
 
+    def has_asset_record(self, asset_key: AssetKey) -> bool:
+        """Returns True if the asset record for the given asset key has already been fetched."""
+        return asset_key in self._asset_record_cache
+
     def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
-        if asset_key not in self._asset_record_cache:
-            self._asset_record_cache[asset_key] = next(
-                iter(self.instance.get_asset_records([asset_key])), None
-            )
-        return self._asset_record_cache[asset_key]
+        with self._lock:
+            if asset_key not in self._asset_record_cache:
+                self._asset_record_cache[asset_key] = next(
+                    iter(self.instance.get_asset_records([asset_key])), None
+                )
+            return self._asset_record_cache[asset_key]
 
     @cached_method
     def _get_latest_materialization_record(
@@ -221,28 +232,29 @@ def get_latest_materialization_record(
         else:
             asset_partition = asset
 
-        # the count of this (asset key, partition key) pair is 0
-        if (
-            asset_partition.partition_key is not None
-            and after_cursor in self._asset_partition_count_cache
-            and asset_partition.asset_key in self._asset_partition_count_cache[after_cursor]
-            and self._asset_partition_count_cache[after_cursor][asset_partition.asset_key].get(
-                asset_partition.partition_key, 0
-            )
-            == 0
-        ):
-            return None
+        with self._lock:
+            # the count of this (asset key, partition key) pair is 0
+            if (
+                asset_partition.partition_key is not None
+                and after_cursor in self._asset_partition_count_cache
+                and asset_partition.asset_key in self._asset_partition_count_cache[after_cursor]
+                and self._asset_partition_count_cache[after_cursor][
+                    asset_partition.asset_key
+                ].get(asset_partition.partition_key, 0)
+                == 0
+            ):
+                return None
 
-        # ensure we know the latest overall materialization record for this asset partition
-        if asset_partition not in self._latest_materialization_record_cache:
-            self._latest_materialization_record_cache[
-                asset_partition
-            ] = self._get_latest_materialization_record(
-                asset_partition=asset_partition,
-            )
+            # ensure we know the latest overall materialization record for this asset partition
+            if asset_partition not in self._latest_materialization_record_cache:
+                self._latest_materialization_record_cache[
+                    asset_partition
+                ] = self._get_latest_materialization_record(
+                    asset_partition=asset_partition,
+                )
 
-        # the latest overall record
-        latest_record = self._latest_materialization_record_cache[asset_partition]
+            # the latest overall record
+            latest_record = self._latest_materialization_record_cache[asset_partition]
 
         # there are no records for this asset partition after after_cursor
         if latest_record is None or latest_record.storage_id <= (after_cursor or 0):
@@ -427,18 +439,19 @@ def get_materialized_partition_counts(
             after_cursor (Optional[int]): The cursor after which to look for materializations. If
                 not provided, will look at all materializations.
         """
-        if (
-            after_cursor not in self._asset_partition_count_cache
-            or asset_key not in self._asset_partition_count_cache[after_cursor]
-        ):
-            self._asset_partition_count_cache[after_cursor][
-                asset_key
-            ] = self.instance.get_materialization_count_by_partition(
-                asset_keys=[asset_key], after_cursor=after_cursor
-            )[
-                asset_key
-            ]
-        return self._asset_partition_count_cache[after_cursor][asset_key]
+        with self._lock:
+            if (
+                after_cursor not in self._asset_partition_count_cache
+                or asset_key not in self._asset_partition_count_cache[after_cursor]
+            ):
+                self._asset_partition_count_cache[after_cursor][
+                    asset_key
+                ] = self.instance.get_materialization_count_by_partition(
+                    asset_keys=[asset_key], after_cursor=after_cursor
+                )[
+                    asset_key
+                ]
+            return self._asset_partition_count_cache[after_cursor][asset_key]
 
     def get_materialized_partitions(
         self, asset_key: AssetKey, after_cursor: Optional[int] = None
@@ -460,11 +473,12 @@ def get_materialized_partitions(
 
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Returns a list of partitions for a partitions definition."""
-        if partitions_def_name not in self._dynamic_partitions_cache:
-            self._dynamic_partitions_cache[
-                partitions_def_name
-            ] = self.instance.get_dynamic_partitions(partitions_def_name)
-        return self._dynamic_partitions_cache[partitions_def_name]
+        with self._lock:
+            if partitions_def_name not in self._dynamic_partitions_cache:
+                self._dynamic_partitions_cache[
+                    partitions_def_name
+                ] = self.instance.get_dynamic_partitions(partitions_def_name)
+            return self._dynamic_partitions_cache[partitions_def_name]
 
     ####################
     # RECONCILIATION
@@ -489,6 +503,35 @@ def get_latest_storage_id(self, event_type: DagsterEventType) -> Optional[int]:
         else:
             return None
 
+    ####################
+    # PARTITION MAPPINGS
+    ####################
+
+    @cached_method
+    def get_parents_partitions(
+        self, *, asset_graph: AssetGraph, asset_partition: AssetKeyPartitionKey
+    ) -> AbstractSet[AssetKeyPartitionKey]:
+        """Returns every partition in every parent of the given asset partition that it depends on.
+
+        Mapping partitions between assets can be expensive, e.g. for time window partitions, and the
+        same asset partitions are often visited many times while evaluating a single tick, so the
+        result is cached for the lifetime of this queryer.
+        """
+        return asset_graph.get_parents_partitions(
+            self, asset_partition.asset_key, asset_partition.partition_key
+        )
+
+    @cached_method
+    def get_children_partitions(
+        self, *, asset_graph: AssetGraph, asset_partition: AssetKeyPartitionKey
+    ) -> AbstractSet[AssetKeyPartitionKey]:
+        """Returns every partition in every child of the given asset partition that depends on it.
+        The result is cached for the lifetime of this queryer.
+        """
+        return asset_graph.get_children_partitions(
+            self, asset_partition.asset_key, asset_partition.partition_key
+        )
+
     @cached_method
     def is_reconciled(
         self, *, asset_partition: AssetKeyPartitionKey, asset_graph: AssetGraph
@@ -506,10 +549,8 @@ def is_reconciled(
         if not self.materialization_exists(asset_partition):
             return False
 
-        for parent in asset_graph.get_parents_partitions(
-            self,
-            asset_partition.asset_key,
-            asset_partition.partition_key,
+        for parent in self.get_parents_partitions(
+            asset_graph=asset_graph, asset_partition=asset_partition
         ):
             if asset_graph.is_source(parent.asset_key):
                 continue
@@ -0,0 +1,74 @@
+import pickle
+import tempfile
+from typing import IO, Any, Optional
+
+import dagster._check as check
+from dagster._utils import PICKLE_PROTOCOL
+
+ZSTD_COMPRESSION = "zstd"
+SUPPORTED_COMPRESSIONS = (ZSTD_COMPRESSION,)
+
+# Frame magic number that every zstd stream starts with. Pickle streams with protocol >= 2 start
+# with b"\x80", so objects can be told apart without storing the compression out of band.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Pickled objects up to this size are buffered in memory, larger ones are spilled to disk.
+DEFAULT_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+
+def _import_zstandard():
+    from dagster._core.errors import DagsterInvariantViolationError
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise DagsterInvariantViolationError(
+            "zstd compression requires the zstandard package. Install it with `pip install"
+            " zstandard`."
+        ) from e
+    return zstandard
+
+
+def check_compression(compression: Optional[str]) -> Optional[str]:
+    check.opt_str_param(compression, "compression")
+    check.param_invariant(
+        compression is None or compression in SUPPORTED_COMPRESSIONS,
+        "compression",
+        f"Unsupported compression '{compression}', expected one of {SUPPORTED_COMPRESSIONS}",
+    )
+    if compression == ZSTD_COMPRESSION:
+        _import_zstandard()
+    return compression
+
+
+def spooled_temporary_file(
+    max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+) -> "tempfile.SpooledTemporaryFile[bytes]":
+    return tempfile.SpooledTemporaryFile(max_size=max_size, mode="w+b")
+
+
+def dump_pickled_object(obj: Any, file: IO[bytes], compression: Optional[str] = None) -> None:
+    """Pickles ``obj`` directly into ``file``, optionally compressing the stream, without first
+    materializing the pickled bytes in memory.
+    """
+    if compression == ZSTD_COMPRESSION:
+        zstandard = _import_zstandard()
+        with zstandard.ZstdCompressor().stream_writer(file, closefd=False) as writer:
+            pickle.dump(obj, writer, PICKLE_PROTOCOL)
+    else:
+        check.invariant(compression is None, f"Unsupported compression '{compression}'")
+        pickle.dump(obj, file, PICKLE_PROTOCOL)
+
+
+def load_pickled_object(file: IO[bytes]) -> Any:
+    """Unpickles an object written by ``dump_pickled_object`` from the start of a seekable file,
+    detecting whether the stream was compressed.
+    """
+    file.seek(0)
+    magic = file.read(len(_ZSTD_MAGIC))
+    file.seek(0)
+    if magic == _ZSTD_MAGIC:
+        zstandard = _import_zstandard()
+        with zstandard.ZstdDecompressor().stream_reader(file, closefd=False) as reader:
+            return pickle.load(reader)
+    return pickle.load(file)
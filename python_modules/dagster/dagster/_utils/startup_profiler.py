@@ -0,0 +1,88 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Sequence
+
+import dagster._check as check
+
+PROFILE_STARTUP_ENV_VAR = "DAGSTER_PROFILE_STARTUP"
+
+DEFAULT_REPORT_LIMIT = 25
+
+
+class StartupTiming(NamedTuple):
+    """How long a single step of loading user code took, e.g. importing a module ("import") or
+    constructing a lazily defined job ("definition").
+    """
+
+    kind: str
+    name: str
+    seconds: float
+
+
+def is_startup_profiling_enabled() -> bool:
+    return bool(os.getenv(PROFILE_STARTUP_ENV_VAR))
+
+
+class StartupProfiler:
+    """Records how long each module import and definition construction takes while user code is
+    loaded, so that slow code locations can tell which of their modules and definitions are
+    responsible.
+
+    Timings are only recorded when the ``DAGSTER_PROFILE_STARTUP`` environment variable is set.
+    Timings of nested steps are also included in the timings of the steps that contain them, e.g.
+    importing a package includes the time spent importing its submodules.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: List[StartupTiming] = []
+
+    @contextmanager
+    def profile(self, kind: str, name: str) -> Iterator[None]:
+        if not is_startup_profiling_enabled():
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = StartupTiming(kind, name, time.perf_counter() - start)
+            with self._lock:
+                self._timings.append(timing)
+
+    def get_timings(self) -> Sequence[StartupTiming]:
+        with self._lock:
+            return list(self._timings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timings = []
+
+    def format_report(self, limit: int = DEFAULT_REPORT_LIMIT) -> str:
+        """Summarizes the recorded timings, listing the slowest ``limit`` steps."""
+        check.int_param(limit, "limit")
+        timings = self.get_timings()
+
+        counts: Dict[str, int] = defaultdict(int)
+        for timing in timings:
+            counts[timing.kind] += 1
+
+        lines = [
+            "Startup profile: "
+            + ", ".join(f"{count} {kind} step(s)" for kind, count in sorted(counts.items()))
+        ]
+        for timing in sorted(timings, key=lambda timing: timing.seconds, reverse=True)[:limit]:
+            lines.append(f"  {timing.seconds:9.3f}s  {timing.kind:<12} {timing.name}")
+        return "\n".join(lines)
+
+
+_STARTUP_PROFILER = StartupProfiler()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """The profiler shared by everything that loads user code in this process."""
+    return _STARTUP_PROFILER
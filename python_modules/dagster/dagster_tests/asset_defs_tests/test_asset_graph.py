@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pendulum
 import pytest
@@ -30,6 +30,7 @@
 from dagster._core.host_representation.external_data import external_asset_graph_from_defs
 from dagster._core.test_utils import instance_for_test
 from dagster._seven.compat.pendulum import create_pendulum_time
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
 def to_external_asset_graph(assets) -> AssetGraph:
@@ -185,6 +186,63 @@ def child(parent):
         )
 
 
+def test_get_partitions_subsets():
+    @asset(partitions_def=HourlyPartitionsDefinition(start_date="2022-01-01-00:00"))
+    def parent():
+        ...
+
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
+    def child(parent):
+        ...
+
+    for asset_graph in [
+        AssetGraph.from_assets([parent, child]),
+        to_external_asset_graph([parent, child]),
+    ]:
+        with instance_for_test() as instance:
+            child_subset = asset_graph.get_child_partitions_subset(
+                instance,
+                parent.key,
+                parent.partitions_def.empty_subset().with_partition_keys(
+                    ["2022-01-03-05:00", "2022-01-04-23:00"]
+                ),
+                child.key,
+            )
+            assert set(child_subset.get_partition_keys()) == {"2022-01-03", "2022-01-04"}
+
+            parent_subset = asset_graph.get_parent_partitions_subset(
+                instance, child.key, child_subset, parent.key
+            )
+            assert set(parent_subset.get_partition_keys()) == {
+                f"2022-01-0{day}-{str(hour).zfill(2)}:00" for day in [3, 4] for hour in range(24)
+            }
+
+
+def test_caching_instance_queryer_caches_partition_mappings():
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
+    def parent():
+        ...
+
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
+    def child(parent):
+        ...
+
+    asset_graph = AssetGraph.from_assets([parent, child])
+    with instance_for_test() as instance:
+        instance_queryer = CachingInstanceQueryer(instance)
+        asset_partition = AssetKeyPartitionKey(child.key, "2022-01-03")
+
+        with patch.object(
+            asset_graph, "get_parents_partitions", wraps=asset_graph.get_parents_partitions
+        ) as get_parents_partitions:
+            for _ in range(3):
+                assert instance_queryer.get_parents_partitions(
+                    asset_graph=asset_graph, asset_partition=asset_partition
+                ) == {AssetKeyPartitionKey(parent.key, "2022-01-03")}
+
+            assert get_parents_partitions.call_count == 1
+
+
 def test_get_parent_partitions_non_default_partition_mapping():
     @asset(partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
     def parent():
@@ -507,3 +565,79 @@ def include_all(asset_key, partitions_subset):
         )
         == expected_asset_graph_subset
     )
+
+
+def test_bfs_filter_subsets_multiple_initial_assets_within_subset():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset0():
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset1():
+        ...
+
+    @asset(
+        partitions_def=daily_partitions_def,
+        ins={
+            "asset0": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def asset2(asset0, asset1):
+        ...
+
+    @asset
+    def asset3(asset2):
+        ...
+
+    asset_graph = AssetGraph.from_assets([asset0, asset1, asset2, asset3])
+
+    visited = []
+
+    def include_all(asset_key, partitions_subset):
+        visited.append((asset_key, partitions_subset))
+        return True
+
+    initial_subset = AssetGraphSubset(
+        asset_graph,
+        partitions_subsets_by_asset_key={
+            asset0.key: daily_partitions_def.subset_with_partition_keys(["2022-01-01"]),
+            asset1.key: daily_partitions_def.subset_with_partition_keys(["2022-01-05"]),
+        },
+    )
+    asset2_subset = daily_partitions_def.subset_with_partition_keys(["2022-01-02", "2022-01-05"])
+
+    # each asset is visited once, after its parents, with the partitions reached through all of them
+    assert asset_graph.bfs_filter_subsets(
+        dynamic_partitions_store=MagicMock(),
+        initial_subset=initial_subset,
+        condition_fn=include_all,
+    ) == initial_subset | AssetGraphSubset(
+        asset_graph,
+        partitions_subsets_by_asset_key={asset2.key: asset2_subset},
+        non_partitioned_asset_keys={asset3.key},
+    )
+    assert [asset_key for asset_key, _ in visited[2:]] == [asset2.key, asset3.key]
+    assert visited[2][1] == asset2_subset
+
+    # partitions outside of within_subset are neither included nor traversed
+    within_subset = AssetGraphSubset(
+        asset_graph,
+        partitions_subsets_by_asset_key={
+            asset0.key: daily_partitions_def.subset_with_partition_keys(["2022-01-01"]),
+            asset2.key: daily_partitions_def.subset_with_partition_keys(["2022-01-02"]),
+        },
+        non_partitioned_asset_keys={asset3.key},
+    )
+    assert (
+        asset_graph.bfs_filter_subsets(
+            dynamic_partitions_store=MagicMock(),
+            initial_subset=initial_subset,
+            condition_fn=lambda asset_key, partitions_subset: True,
+            within_subset=within_subset,
+        )
+        == within_subset
+    )
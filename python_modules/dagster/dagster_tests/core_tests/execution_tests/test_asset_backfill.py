@@ -1,3 +1,4 @@
+import tempfile
 from typing import AbstractSet, Mapping, NamedTuple, Optional, Sequence, Set, Union, cast
 from unittest.mock import MagicMock, patch
 
@@ -183,6 +184,52 @@ def test_materializations_outside_of_backfill():
     )
 
 
+def test_failed_runs_folded_incrementally():
+    assets_by_repo_name = {"repo": two_assets_in_sequence_two_partitions}
+    asset_graph = get_asset_graph(assets_by_repo_name)
+
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test(
+        overrides={
+            # non-run sharded storage, so that storage ids increase across runs
+            "event_log_storage": {
+                "module": "dagster._core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": temp_dir},
+            },
+        }
+    ) as instance:
+        backfill_data = make_backfill_data("all", asset_graph, instance)
+        fail_asset_partitions = set(
+            backfill_data.target_subset.filter_asset_keys(
+                asset_graph.root_asset_keys
+            ).iterate_asset_partitions()
+        )
+        backfill_data = run_backfill_to_completion(
+            asset_graph, assets_by_repo_name, backfill_data, fail_asset_partitions, instance
+        )
+        assert backfill_data.latest_failed_run_storage_id is not None
+        assert (
+            AssetBackfillData.from_serialized(
+                backfill_data.serialize(dynamic_partitions_store=instance), asset_graph
+            )
+            == backfill_data
+        )
+
+        # failed runs that were already folded into the backfill data are not looked at again
+        with patch(
+            "dagster._utils.caching_instance_queryer.CachingInstanceQueryer"
+            ".get_planned_materializations_for_run"
+        ) as get_planned_materializations_for_run:
+            result = execute_asset_backfill_iteration_consume_generator(
+                backfill_id="backfillid_x",
+                asset_backfill_data=backfill_data,
+                asset_graph=asset_graph,
+                instance=instance,
+            )
+        assert get_planned_materializations_for_run.call_count == 0
+        assert result.backfill_data == backfill_data
+
+
 def make_backfill_data(
     some_or_all: str, asset_graph: ExternalAssetGraph, instance: DagsterInstance
 ) -> AssetBackfillData:
@@ -272,7 +319,7 @@ def run_backfill_to_completion(
     backfill_data: AssetBackfillData,
     fail_asset_partitions: AbstractSet[AssetKeyPartitionKey],
     instance: DagsterInstance,
-) -> None:
+) -> AssetBackfillData:
     iteration_count = 0
     instance = instance or DagsterInstance.ephemeral()
     backfill_id = "backfillid_x"
@@ -362,6 +409,7 @@ def run_backfill_to_completion(
         len(requested_asset_partitions | fail_and_downstream_asset_partitions)
         == backfill_data.target_subset.num_partitions_and_non_partitioned_assets
     )
+    return backfill_data
 
 
 def external_asset_graph_from_assets_by_repo_name(
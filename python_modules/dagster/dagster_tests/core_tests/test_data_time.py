@@ -12,6 +12,7 @@
     AssetSelection,
     DagsterEventType,
     DagsterInstance,
+    FreshnessPolicy,
     Output,
     asset,
     multi_asset,
@@ -469,3 +470,70 @@ def test_non_volatile_data_time(timeline):
                 times_by_key=times_by_key,
                 evaluation_time=pendulum.now("UTC"),
             )
+
+
+def _layered_assets(width, depth):
+    rng = random.Random(0)
+    layers = []
+    for d in range(depth):
+        layer = []
+        for w in range(width):
+            parents = rng.sample(layers[-1], 2) if layers else []
+
+            @asset(
+                name=f"asset_{d}_{w}",
+                non_argument_deps={parent.key for parent in parents},
+                freshness_policy=FreshnessPolicy(maximum_lag_minutes=30),
+            )
+            def _asset():
+                return 1
+
+            layer.append(_asset)
+        layers.append(layer)
+    return layers
+
+
+def test_current_data_time_by_key():
+    layers = _layered_assets(width=5, depth=4)
+    all_assets = [assets_def for layer in layers for assets_def in layer]
+    asset_graph = AssetGraph.from_assets(all_assets)
+    asset_keys = [assets_def.key for assets_def in all_assets]
+
+    with DagsterInstance.ephemeral() as instance:
+        materialize_to_memory(all_assets, instance=instance)
+        # rematerialize some roots so that their children consumed older versions of them
+        materialize_to_memory(layers[0][:2], instance=instance)
+
+        evaluation_time = pendulum.now("UTC")
+
+        with mock.patch.object(
+            instance, "get_event_records", wraps=instance.get_event_records
+        ) as get_event_records:
+            data_time_resolver = CachingDataTimeResolver(
+                instance_queryer=CachingInstanceQueryer(instance), asset_graph=asset_graph
+            )
+            expected_data_times = {
+                asset_key: data_time_resolver.get_current_data_time(asset_key, evaluation_time)
+                for asset_key in asset_keys
+            }
+            expected_minutes_late = {
+                asset_key: data_time_resolver.get_current_minutes_late(asset_key, evaluation_time)
+                for asset_key in asset_keys
+            }
+            per_key_query_count = get_event_records.call_count
+            get_event_records.reset_mock()
+
+            data_time_resolver = CachingDataTimeResolver(
+                instance_queryer=CachingInstanceQueryer(instance), asset_graph=asset_graph
+            )
+            assert (
+                data_time_resolver.get_current_data_time_by_key(asset_keys, evaluation_time)
+                == expected_data_times
+            )
+            assert (
+                data_time_resolver.get_current_minutes_late_by_key(asset_keys, evaluation_time)
+                == expected_minutes_late
+            )
+            # latest materializations are fetched together, so only records that were not the
+            # latest materialization of their asset when they were consumed need to be queried
+            assert get_event_records.call_count < per_key_query_count
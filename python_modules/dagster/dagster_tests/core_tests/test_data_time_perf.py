@@ -0,0 +1,146 @@
+import os
+import random
+import time
+from typing import NamedTuple, Sequence
+from unittest import mock
+
+import pendulum
+import pytest
+from dagster import (
+    AssetKey,
+    AssetOut,
+    DagsterInstance,
+    FreshnessPolicy,
+    Nothing,
+    Output,
+    materialize_to_memory,
+    multi_asset,
+)
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+
+class LayeredAssets(NamedTuple):
+    """A graph of `depth` layers of `width` assets with freshness policies, where each asset
+    depends on two random assets of the layer above it.
+    """
+
+    width: int
+    depth: int
+
+    @property
+    def names(self) -> Sequence[Sequence[str]]:
+        return [[f"asset_{d}_{w}" for w in range(self.width)] for d in range(self.depth)]
+
+    def get_definition(self) -> AssetsDefinition:
+        rng = random.Random(0)
+        names = self.names
+        deps = {
+            name: {AssetKey(parent) for parent in rng.sample(names[d - 1], 2)} if d else set()
+            for d, layer in enumerate(names)
+            for name in layer
+        }
+        ordered_names = [name for layer in names for name in layer]
+
+        # a single subsettable multi asset materializes much faster than one op per asset
+        @multi_asset(
+            outs={
+                name: AssetOut(
+                    dagster_type=Nothing,
+                    is_required=False,
+                    freshness_policy=FreshnessPolicy(maximum_lag_minutes=30),
+                )
+                for name in ordered_names
+            },
+            internal_asset_deps=deps,
+            can_subset=True,
+        )
+        def _masset(context):
+            selected_outputs = context.selected_output_names
+            # ensure topological ordering of outputs
+            for name in ordered_names:
+                if name in selected_outputs:
+                    yield Output(None, name)
+
+        return _masset
+
+
+class DataTimePerfScenario(NamedTuple):
+    assets: LayeredAssets
+    max_execution_time_seconds: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.assets.width}_wide_{self.assets.depth}_deep"
+
+    def do_scenario(self) -> None:
+        masset = self.assets.get_definition()
+        asset_graph = AssetGraph.from_assets([masset])
+        asset_keys = [AssetKey(name) for layer in self.assets.names for name in layer]
+
+        with DagsterInstance.ephemeral() as instance:
+            materialize_to_memory([masset], instance=instance)
+            # rematerialize some roots so that their children consumed older versions of them
+            materialize_to_memory(
+                [masset.subset_for({AssetKey(name) for name in self.assets.names[0][:2]})],
+                instance=instance,
+            )
+
+            evaluation_time = pendulum.now("UTC")
+            with mock.patch.object(
+                instance, "get_event_records", wraps=instance.get_event_records
+            ) as get_event_records:
+                start = time.time()
+                data_time_resolver = CachingDataTimeResolver(
+                    instance_queryer=CachingInstanceQueryer(instance), asset_graph=asset_graph
+                )
+                expected_minutes_late = {
+                    asset_key: data_time_resolver.get_current_minutes_late(
+                        asset_key, evaluation_time
+                    )
+                    for asset_key in asset_keys
+                }
+                per_key_seconds = time.time() - start
+                per_key_query_count = get_event_records.call_count
+                get_event_records.reset_mock()
+
+                start = time.time()
+                data_time_resolver = CachingDataTimeResolver(
+                    instance_queryer=CachingInstanceQueryer(instance), asset_graph=asset_graph
+                )
+                minutes_late = data_time_resolver.get_current_minutes_late_by_key(
+                    asset_keys, evaluation_time
+                )
+                bulk_seconds = time.time() - start
+                bulk_query_count = get_event_records.call_count
+
+        print(  # noqa: T201
+            f"{self.name}: {per_key_seconds:.1f}s and {per_key_query_count} event record queries"
+            f" per key, {bulk_seconds:.1f}s and {bulk_query_count} in bulk"
+        )
+        assert minutes_late == expected_minutes_late
+        assert bulk_query_count < per_key_query_count
+        assert bulk_seconds < self.max_execution_time_seconds
+
+
+perf_scenarios = [
+    DataTimePerfScenario(
+        assets=LayeredAssets(width=20, depth=20),
+        max_execution_time_seconds=5,
+    ),
+    # materializing this graph takes a couple of minutes
+    DataTimePerfScenario(
+        assets=LayeredAssets(width=100, depth=100),
+        max_execution_time_seconds=30,
+    ),
+]
+
+
+@pytest.mark.parametrize("scenario", perf_scenarios, ids=[s.name for s in perf_scenarios])
+def test_data_time_perf(scenario: DataTimePerfScenario):
+    if os.getenv("BUILDKITE") is not None and scenario.assets.width * scenario.assets.depth > 1000:
+        pytest.skip("Skipping slow test on BK")
+
+    scenario.do_scenario()
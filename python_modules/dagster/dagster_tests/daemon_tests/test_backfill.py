@@ -3,6 +3,7 @@
 import string
 import sys
 import time
+from unittest import mock
 
 import pendulum
 import pytest
@@ -384,6 +385,47 @@ def test_canceled_backfill(
     assert instance.get_runs_count() == 1
 
 
+def test_backfill_submits_unsubmitted_runs(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+):
+    external_partition_set = external_repo.get_external_partition_set("the_job_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="interrupted",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+
+    # simulate a daemon that is interrupted after creating the run for "one" but before
+    # submitting it
+    with mock.patch.object(instance, "submit_run", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+    (unsubmitted_run,) = instance.get_runs()
+    assert unsubmitted_run.status == DagsterRunStatus.NOT_STARTED
+    assert unsubmitted_run.tags[PARTITION_NAME_TAG] == "one"
+
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+    backfill = instance.get_backfill("interrupted")
+    assert backfill
+    assert backfill.status == BulkActionStatus.COMPLETED
+    runs = instance.get_runs()
+    assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+    assert all(run.status == DagsterRunStatus.SUCCESS for run in runs)
+
+
 def test_failure_backfill(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
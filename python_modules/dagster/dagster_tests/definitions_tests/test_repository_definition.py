@@ -1,3 +1,5 @@
+import threading
+import time
 from collections import defaultdict
 from typing import Sequence
 
@@ -35,6 +37,7 @@
 from dagster._core.errors import DagsterInvalidSubsetError
 from dagster._legacy import AssetGroup
 from dagster._loggers import default_loggers
+from dagster._utils.startup_profiler import PROFILE_STARTUP_ENV_VAR, get_startup_profiler
 
 
 def create_single_node_job(name, called):
@@ -579,6 +582,69 @@ def jobs():
     assert jobs.get_job("other_job")
 
 
+def test_load_all_definitions_concurrently():
+    @graph
+    def my_graph():
+        pass
+
+    constructed_in_threads = set()
+    lock = threading.Lock()
+
+    def _construct(name):
+        def _fn():
+            with lock:
+                constructed_in_threads.add(threading.current_thread().name)
+            time.sleep(0.1)
+            return my_graph.to_job(name=name)
+
+        return _fn
+
+    job_names = [f"job_{i}" for i in range(8)]
+
+    @repository
+    def jobs():
+        return {"jobs": {name: _construct(name) for name in job_names}}
+
+    jobs.load_all_definitions(max_workers=4)
+
+    assert sorted(jobs.job_names) == job_names
+    assert all(name.startswith("load_definitions") for name in constructed_in_threads)
+
+    # the definitions are cached, so fetching them again doesn't construct them again
+    constructed_in_threads.clear()
+    assert [job.name for job in jobs.get_all_jobs()] == job_names
+    assert not constructed_in_threads
+
+
+def test_startup_profiler(monkeypatch):
+    @graph
+    def my_graph():
+        pass
+
+    @repository
+    def jobs():
+        return {"jobs": {"my_job": lambda: my_graph.to_job(name="my_job")}}
+
+    profiler = get_startup_profiler()
+    profiler.clear()
+    jobs.get_job("my_job")
+    assert not profiler.get_timings()
+
+    monkeypatch.setenv(PROFILE_STARTUP_ENV_VAR, "1")
+
+    @repository
+    def other_jobs():
+        return {"jobs": {"my_job": lambda: my_graph.to_job(name="my_job")}}
+
+    try:
+        other_jobs.get_job("my_job")
+        timings = profiler.get_timings()
+        assert [(timing.kind, timing.name) for timing in timings] == [("definition", "job my_job")]
+        assert "job my_job" in profiler.format_report()
+    finally:
+        profiler.clear()
+
+
 def test_lazy_graph():
     @graph
     def my_graph():
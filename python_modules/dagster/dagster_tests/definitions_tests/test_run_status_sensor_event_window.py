@@ -0,0 +1,179 @@
+import tempfile
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from dagster import DagsterRunStatus, run_failure_sensor
+from dagster._core.definitions.run_status_sensor_definition import (
+    RUN_STATUS_EVENT_WINDOW_SIZE,
+    RUN_STATUS_SENSOR_EVENT_LIMIT,
+    RunStatusSensorCursor,
+)
+from dagster._core.definitions.sensor_definition import SensorEvaluationContext
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.events.log import EventLogEntry
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._utils import utc_datetime_from_timestamp
+
+
+def _evaluate(sensor, instance, cursor):
+    context = SensorEvaluationContext(
+        instance_ref=instance.get_ref(),
+        last_completion_time=None,
+        last_run_key=None,
+        cursor=cursor,
+        repository_name=None,
+        instance=instance,
+    )
+    sensor.evaluate_tick(context)
+    return context.cursor
+
+
+def _report_run_failures(instance, count):
+    run_ids = []
+    for _ in range(count):
+        run = create_run_for_test(instance, status=DagsterRunStatus.FAILURE)
+        instance.handle_new_event(
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run.run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(DagsterEventType.PIPELINE_FAILURE.value, "foo"),
+            )
+        )
+        run_ids.append(run.run_id)
+    return run_ids
+
+
+@contextmanager
+def _consolidated_instance():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(
+            overrides={
+                # non-run sharded storage
+                "event_log_storage": {
+                    "module": "dagster._core.storage.event_log",
+                    "class": "ConsolidatedSqliteEventLogStorage",
+                    "config": {"base_dir": temp_dir},
+                },
+            }
+        ) as instance:
+            yield instance
+
+
+def _failure_sensors(seen_run_ids):
+    @run_failure_sensor(name="first", monitor_all_repositories=True)
+    def first_sensor(context):
+        seen_run_ids["first"].append(context.dagster_run.run_id)
+
+    @run_failure_sensor(name="second", monitor_all_repositories=True)
+    def second_sensor(context):
+        seen_run_ids["second"].append(context.dagster_run.run_id)
+
+    return first_sensor, second_sensor
+
+
+def _initial_cursor():
+    return RunStatusSensorCursor(
+        record_id=-1, update_timestamp=utc_datetime_from_timestamp(0).isoformat()
+    ).to_json()
+
+
+def test_run_status_sensors_share_event_window():
+    with _consolidated_instance() as instance:
+        run_ids = _report_run_failures(instance, 12)
+        seen_run_ids = {"first": [], "second": []}
+        first_sensor, second_sensor = _failure_sensors(seen_run_ids)
+        cursor = _initial_cursor()
+
+        with mock.patch.object(
+            instance, "get_event_records", wraps=instance.get_event_records
+        ) as get_event_records, mock.patch.object(
+            instance, "get_run_records", wraps=instance.get_run_records
+        ) as get_run_records:
+            first_cursor = _evaluate(first_sensor, instance, cursor)
+            assert get_event_records.call_count == 1
+            assert get_run_records.call_count == 1
+
+            # the second sensor is served from the events and runs fetched by the first one
+            second_cursor = _evaluate(second_sensor, instance, cursor)
+            assert second_cursor == first_cursor
+            assert seen_run_ids["second"] == seen_run_ids["first"] == run_ids[:5]
+
+            first_cursor = _evaluate(first_sensor, instance, first_cursor)
+            assert seen_run_ids["first"] == run_ids[:10]
+
+            # the window had every event when it was fetched, so a sensor that has caught up
+            # with it is served from it for a short while
+            first_cursor = _evaluate(first_sensor, instance, first_cursor)
+            assert seen_run_ids["first"] == run_ids
+            assert get_event_records.call_count == 1
+            assert get_run_records.call_count == 1
+
+
+def test_run_status_sensors_at_head_extend_event_window():
+    with _consolidated_instance() as instance, mock.patch(
+        "dagster._core.definitions.run_status_sensor_definition"
+        ".RUN_STATUS_EVENT_WINDOW_HEAD_TTL_SECONDS",
+        -1,
+    ):
+        run_ids = _report_run_failures(instance, 12)
+        seen_run_ids = {"first": [], "second": []}
+        first_sensor, second_sensor = _failure_sensors(seen_run_ids)
+        cursor = _initial_cursor()
+
+        with mock.patch.object(
+            instance, "get_event_records", wraps=instance.get_event_records
+        ) as get_event_records:
+            first_cursor = _evaluate(first_sensor, instance, cursor)
+            first_cursor = _evaluate(first_sensor, instance, first_cursor)
+            assert seen_run_ids["first"] == run_ids[:10]
+            assert get_event_records.call_count == 1
+            assert get_event_records.call_args[1]["limit"] == RUN_STATUS_EVENT_WINDOW_SIZE
+
+            run_ids.extend(_report_run_failures(instance, 3))
+
+            # with fewer events left in the window than a tick considers, the sensor at the head
+            # only queries the instance for a tick's worth of newer events
+            first_cursor = _evaluate(first_sensor, instance, first_cursor)
+            assert seen_run_ids["first"] == run_ids
+            assert get_event_records.call_count == 2
+            assert get_event_records.call_args[1]["limit"] == RUN_STATUS_SENSOR_EVENT_LIMIT
+
+            # the newer events are added to the window, so a sensor that is behind is still
+            # served from it
+            second_cursor = _evaluate(second_sensor, instance, cursor)
+            second_cursor = _evaluate(second_sensor, instance, second_cursor)
+            second_cursor = _evaluate(second_sensor, instance, second_cursor)
+            assert seen_run_ids["second"] == run_ids
+            assert second_cursor == first_cursor
+            assert get_event_records.call_count == 2
+
+
+def test_run_status_sensor_event_window_run_sharded():
+    with instance_for_test() as instance:
+        assert instance.event_log_storage.is_run_sharded
+
+        run = create_run_for_test(instance, status=DagsterRunStatus.FAILURE)
+        instance.report_run_failed(run)
+
+        seen_run_ids = []
+
+        @run_failure_sensor(monitor_all_repositories=True)
+        def failure_sensor(context):
+            seen_run_ids.append(context.dagster_run.run_id)
+
+        cursor = RunStatusSensorCursor(
+            record_id=-1, update_timestamp=utc_datetime_from_timestamp(0).isoformat()
+        ).to_json()
+
+        with mock.patch.object(
+            instance, "get_event_records", wraps=instance.get_event_records
+        ) as get_event_records:
+            # events are not shared across sensors when storage ids are not comparable across runs
+            _evaluate(failure_sensor, instance, cursor)
+            _evaluate(failure_sensor, instance, cursor)
+            assert get_event_records.call_count == 2
+            assert seen_run_ids == [run.run_id, run.run_id]
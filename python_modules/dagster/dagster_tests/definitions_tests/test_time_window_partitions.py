@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import cast
+from typing import Sequence, cast
 
 import pendulum.parser
 import pytest
@@ -531,6 +531,75 @@ def test_partition_subset_with_partition_keys(initial: str, added: str):
     assert len(updated_subset) == updated_subset_str.count("+")
 
 
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("+++--", "--+++"),
+        ("+-+-+", "-+-+-"),
+        ("--+++---+++--", "++---+++---++"),
+        ("+++++", "-+-+-"),
+        ("-----", "+--++"),
+    ],
+)
+@pytest.mark.parametrize("as_time_windows", [True, False])
+def test_partition_subset_set_operations(first: str, second: str, as_time_windows: bool):
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    full_set_keys = partitions_def.get_partition_keys(
+        current_time=datetime(year=2015, month=1, day=30)
+    )[: len(first)]
+
+    def _subset(subset_str: str) -> TimeWindowPartitionsSubset:
+        subset = cast(
+            TimeWindowPartitionsSubset,
+            partitions_def.empty_subset().with_partition_keys(
+                key for key, included in zip(full_set_keys, subset_str) if included == "+"
+            ),
+        )
+        if as_time_windows:
+            subset = TimeWindowPartitionsSubset(
+                partitions_def,
+                num_partitions=len(subset),
+                included_time_windows=subset.included_time_windows,
+            )
+        return subset
+
+    def _expected_keys(include) -> Sequence[str]:
+        return [
+            key
+            for key, a, b in zip(full_set_keys, first, second)
+            if include(a == "+", b == "+")
+        ]
+
+    first_subset = _subset(first)
+    second_subset = _subset(second)
+    for result, expected_keys in [
+        (first_subset | second_subset, _expected_keys(lambda a, b: a or b)),
+        (first_subset & second_subset, _expected_keys(lambda a, b: a and b)),
+        (first_subset - second_subset, _expected_keys(lambda a, b: a and not b)),
+    ]:
+        assert sorted(result.get_partition_keys()) == expected_keys
+        assert len(result) == len(expected_keys)
+
+
+def test_partition_subset_with_partition_keys_before_first_time_window():
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    subset = TimeWindowPartitionsSubset(
+        partitions_def,
+        num_partitions=2,
+        included_time_windows=[
+            TimeWindow(
+                pendulum.datetime(2015, 1, 2, tz="UTC"), pendulum.datetime(2015, 1, 4, tz="UTC")
+            )
+        ],
+    )
+
+    updated_subset = cast(TimeWindowPartitionsSubset, subset.with_partition_keys(["2015-01-01"]))
+    assert updated_subset.included_time_windows == [
+        TimeWindow(pendulum.datetime(2015, 1, 1, tz="UTC"), pendulum.datetime(2015, 1, 4, tz="UTC"))
+    ]
+    assert len(updated_subset) == 3
+
+
 def test_weekly_time_window_partitions_subset():
     weekly_partitions_def = WeeklyPartitionsDefinition(start_date="2022-01-01")
 
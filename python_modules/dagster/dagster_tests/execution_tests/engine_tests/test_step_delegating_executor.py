@@ -1,4 +1,5 @@
 import subprocess
+import threading
 import time
 
 import pytest
@@ -46,40 +47,68 @@ class TestStepHandler(StepHandler):
     check_step_health_count = 0
     terminate_step_count = 0
     verify_step_count = 0
+    # the executor may call the step handler from a thread pool, so state is updated under a lock
+    lock = threading.Lock()
+    launch_step_seconds = 0.0
+    launch_times = []
+    launches_in_flight = 0
+    max_launches_in_flight = 0
 
     @property
     def name(self):
         return "TestStepHandler"
 
     def launch_step(self, step_handler_context):
-        if step_handler_context.execute_step_args.should_verify_step:
-            TestStepHandler.verify_step_count += 1
-        if step_handler_context.execute_step_args.step_keys_to_execute[0] == "baz_op":
-            TestStepHandler.saw_baz_op = True
-            assert step_handler_context.step_tags["baz_op"] == {"foo": "bar"}
-
-        TestStepHandler.launch_step_count += 1
-        print("TestStepHandler Launching Step!")  # noqa: T201
-        TestStepHandler.processes.append(
-            subprocess.Popen(step_handler_context.execute_step_args.get_command_args())
-        )
+        with TestStepHandler.lock:
+            TestStepHandler.launch_times.append(time.time())
+            TestStepHandler.launches_in_flight += 1
+            TestStepHandler.max_launches_in_flight = max(
+                TestStepHandler.max_launches_in_flight, TestStepHandler.launches_in_flight
+            )
+
+        try:
+            # stands in for a step handler that blocks on an API call
+            time.sleep(TestStepHandler.launch_step_seconds)
+
+            with TestStepHandler.lock:
+                if step_handler_context.execute_step_args.should_verify_step:
+                    TestStepHandler.verify_step_count += 1
+                if step_handler_context.execute_step_args.step_keys_to_execute[0] == "baz_op":
+                    TestStepHandler.saw_baz_op = True
+                    assert step_handler_context.step_tags["baz_op"] == {"foo": "bar"}
+
+                TestStepHandler.launch_step_count += 1
+                print("TestStepHandler Launching Step!")  # noqa: T201
+                TestStepHandler.processes.append(
+                    subprocess.Popen(step_handler_context.execute_step_args.get_command_args())
+                )
+        finally:
+            with TestStepHandler.lock:
+                TestStepHandler.launches_in_flight -= 1
         return iter(())
 
     def check_step_health(self, step_handler_context) -> CheckStepHealthResult:
-        TestStepHandler.check_step_health_count += 1
+        with TestStepHandler.lock:
+            TestStepHandler.check_step_health_count += 1
         return CheckStepHealthResult.healthy()
 
     def terminate_step(self, step_handler_context):
-        TestStepHandler.terminate_step_count += 1
+        with TestStepHandler.lock:
+            TestStepHandler.terminate_step_count += 1
         raise NotImplementedError()
 
     @classmethod
     def reset(cls):
-        cls.processes = []
-        cls.launch_step_count = 0
-        cls.check_step_health_count = 0
-        cls.terminate_step_count = 0
-        cls.verify_step_count = 0
+        with cls.lock:
+            cls.processes = []
+            cls.launch_step_count = 0
+            cls.check_step_health_count = 0
+            cls.terminate_step_count = 0
+            cls.verify_step_count = 0
+            cls.launch_step_seconds = 0.0
+            cls.launch_times = []
+            cls.launches_in_flight = 0
+            cls.max_launches_in_flight = 0
 
     @classmethod
     def wait_for_processes(cls):
@@ -258,6 +287,90 @@ def test_max_concurrent():
             active_step = None
 
 
+def test_max_concurrent_with_step_handler_parallelism():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(three_op_job),
+            instance=instance,
+            run_config={
+                "execution": {"config": {"max_concurrent": 1, "step_handler_parallelism": 4}}
+            },
+        )
+        TestStepHandler.wait_for_processes()
+    assert result.success
+
+    active_step = None
+    for event in result.event_list:
+        if event.event_type_value == DagsterEventType.STEP_START.value:
+            assert active_step is None, "A second step started before the first finished!"
+            active_step = event.step_key
+        elif event.event_type_value == DagsterEventType.STEP_SUCCESS.value:
+            assert (
+                active_step == event.step_key
+            ), "A step finished that wasn't supposed to be active!"
+            active_step = None
+
+
+def _execute_dynamic_job_with_step_handler_parallelism(execution_config):
+    from .test_jobs import define_dynamic_job
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_dynamic_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": merge_dicts(
+                        {"step_handler_parallelism": 4, "check_step_health_interval_seconds": 0},
+                        execution_config,
+                    )
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert (
+        len(
+            [
+                e
+                for e in result.event_list
+                if e.event_type_value == DagsterEventType.STEP_START.value
+            ]
+        )
+        == 11
+    )
+
+
+def test_dynamic_execute_with_step_handler_parallelism():
+    TestStepHandler.reset()
+    TestStepHandler.launch_step_seconds = 0.2
+    _execute_dynamic_job_with_step_handler_parallelism({})
+
+    assert TestStepHandler.launch_step_count == 11
+    # the dynamic steps are launched at the same time, but by no more than step_handler_parallelism
+    # threads
+    assert 1 < TestStepHandler.max_launches_in_flight <= 4
+
+
+def test_dynamic_execute_with_max_step_launches_per_second():
+    max_step_launches_per_second = 10
+    TestStepHandler.reset()
+    _execute_dynamic_job_with_step_handler_parallelism(
+        {"max_step_launches_per_second": max_step_launches_per_second}
+    )
+
+    launch_times = sorted(TestStepHandler.launch_times)
+    assert len(launch_times) == 11
+    # launches are spaced out even though there are threads free to launch them at once. Allow for
+    # a thread waking up late from its sleep, which shortens the gap to the next launch.
+    min_spacing = 1.0 / max_step_launches_per_second
+    for previous_launch_time, launch_time in zip(launch_times, launch_times[1:]):
+        assert launch_time - previous_launch_time > min_spacing * 0.5
+    assert launch_times[-1] - launch_times[0] >= min_spacing * (len(launch_times) - 1) * 0.9
+
+
 def test_tag_concurrency_limits():
     TestStepHandler.reset()
     with instance_for_test() as instance:
@@ -583,6 +583,45 @@ def asset2(asset1):
         assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
 
+def test_stale_status_fetches_upstream_materializations_together() -> None:
+    @asset
+    def asset1():
+        ...
+
+    @asset
+    def asset2(asset1):
+        ...
+
+    @asset
+    def asset3(asset2):
+        ...
+
+    @asset
+    def asset4():
+        ...
+
+    all_assets = [asset1, asset2, asset3, asset4]
+    with instance_for_test() as instance:
+        materialize_assets(all_assets, instance)
+        materialize_asset(all_assets, asset1, instance)
+
+        status_resolver = get_stale_status_resolver(instance, all_assets)
+        with mock.patch.object(
+            instance, "get_asset_records", wraps=instance.get_asset_records
+        ) as get_asset_records, mock.patch.object(
+            instance, "get_event_records", wraps=instance.get_event_records
+        ) as get_event_records:
+            assert status_resolver.get_status(asset3.key) == StaleStatus.STALE
+            assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+            assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+            assert get_asset_records.call_count == 1
+            assert set(get_asset_records.call_args[0][0]) == {asset1.key, asset2.key, asset3.key}
+
+            assert status_resolver.get_status(asset4.key) == StaleStatus.FRESH
+            assert get_asset_records.call_count == 2
+            assert get_event_records.call_count == 0
+
+
 def test_stale_status_redundant_upstream_materialization() -> None:
     @asset(code_version="abc")
     def asset1():
@@ -0,0 +1,107 @@
+import threading
+from unittest import mock
+
+import dagster._seven as seven
+import grpc
+import pytest
+from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._core.test_utils import environ, instance_for_test
+from dagster._grpc import DagsterGrpcClient
+from dagster._grpc.channel_pool import GrpcChannelPool, get_grpc_channel_pool
+from dagster._grpc.server import GrpcServerProcess
+from dagster._utils import find_free_port
+
+
+def test_channel_pool_reuses_channels():
+    pool = GrpcChannelPool()
+    created = []
+
+    def _create_channel():
+        channel = grpc.insecure_channel("localhost:1234")
+        created.append(channel)
+        return channel
+
+    with pool.channel(("localhost:1234", False), _create_channel) as channel:
+        with pool.channel(("localhost:1234", False), _create_channel) as same_channel:
+            assert same_channel is channel
+    with pool.channel(("localhost:1234", True), _create_channel) as ssl_channel:
+        assert ssl_channel is not channel
+
+    assert len(created) == 2
+    pool.clear()
+
+
+def test_channel_pool_evicts_without_closing_active_channels():
+    pool = GrpcChannelPool(max_channels=1)
+    closed = []
+
+    class _Channel:
+        def __init__(self, name):
+            self.name = name
+
+        def close(self):
+            closed.append(self.name)
+
+    with pool.channel(("a", False), lambda: _Channel("a")) as channel_a:  # type: ignore
+        # evicting the least recently used channel waits until its calls finish
+        with pool.channel(("b", False), lambda: _Channel("b")):  # type: ignore
+            assert closed == []
+        assert closed == []
+    assert closed == ["a"]
+
+    # a channel that was already replaced in the pool is not evicted again
+    pool.evict(("a", False), channel_a)  # type: ignore
+    with pool.channel(("b", False), lambda: _Channel("new b")) as channel_b:  # type: ignore
+        assert channel_b.name == "b"
+        pool.evict(("b", False), channel_b)  # type: ignore
+        assert closed == ["a"]
+    assert closed == ["a", "b"]
+
+    pool.clear()
+
+
+def test_client_evicts_unavailable_channel():
+    port = find_free_port()
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        DagsterGrpcClient(port=port).ping("foobar")
+
+    # the next call connects from scratch
+    assert (f"localhost:{port}", False) not in get_grpc_channel_pool()._channels  # noqa: SLF001
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Unix-only test")
+def test_client_reuses_pooled_channel():
+    with instance_for_test() as instance:
+        with GrpcServerProcess(instance_ref=instance.get_ref(), wait_on_exit=True) as server:
+            client = server.create_client()
+            assert client.ping("foobar") == "foobar"
+
+            with mock.patch.object(
+                DagsterGrpcClient,
+                "_create_channel",
+                autospec=True,
+                side_effect=DagsterGrpcClient._create_channel,  # noqa: SLF001
+            ) as create_channel:
+                # pooled channels are shared by sequential and concurrent calls
+                errors = []
+
+                def _ping():
+                    try:
+                        for _ in range(20):
+                            assert client.ping("foobar") == "foobar"
+                    except Exception as e:
+                        errors.append(e)
+
+                _ping()
+                threads = [threading.Thread(target=_ping) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert not errors
+                assert create_channel.call_count == 0
+
+                with environ({"DAGSTER_GRPC_DISABLE_CHANNEL_POOL": "1"}):
+                    for _ in range(3):
+                        assert client.ping("foobar") == "foobar"
+                assert create_channel.call_count == 3
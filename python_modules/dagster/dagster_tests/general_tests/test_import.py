@@ -1,9 +1,14 @@
+import re
 import subprocess
 
 import pytest
 from dagster._seven import IS_WINDOWS
 from dagster._utils import file_relative_path
 
+# generous upper bound on the cumulative time spent importing dagster, to catch regressions that
+# pull large dependency trees into `import dagster` without failing on slow machines
+IMPORT_DAGSTER_BUDGET_SECONDS = 5
+
 
 @pytest.mark.skipif(IS_WINDOWS, reason="fails on windows, unix coverage sufficient")
 def test_import_perf():
@@ -25,6 +30,36 @@ def test_import_perf():
     # ensure expensive libraries which should not be needed for basic definitions are not imported
     assert "grpc" not in import_profile
     assert "sqlalchemy" not in import_profile
+    assert "alembic" not in import_profile
+    assert "upath" not in import_profile
+    assert "fsspec" not in import_profile
+    assert not re.search(r"\|\s+asyncio$", import_profile, re.MULTILINE)
+
+    # the line for the top-level package reports the cumulative import time in microseconds
+    match = re.search(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+dagster$", import_profile, re.M)
+    assert match
+    assert int(match.group(1)) / 1e6 < IMPORT_DAGSTER_BUDGET_SECONDS
 
     # one way to debug imports is to `pip install tuna` then run
     # python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt
+
+
+def test_lazy_exports():
+    import dagster
+    from dagster._core.storage.fs_io_manager import fs_io_manager
+    from dagster._core.storage.upath_io_manager import UPathIOManager
+
+    assert dagster.fs_io_manager is fs_io_manager
+    assert dagster.UPathIOManager is UPathIOManager
+    assert "fs_io_manager" in dir(dagster)
+
+
+def test_star_import_includes_lazy_exports():
+    from dagster._core.storage.fs_io_manager import fs_io_manager
+    from dagster._core.storage.upath_io_manager import UPathIOManager
+
+    namespace = {}
+    exec("from dagster import *", namespace)
+    assert namespace["fs_io_manager"] is fs_io_manager
+    assert namespace["UPathIOManager"] is UPathIOManager
+    assert "asset" in namespace
@@ -0,0 +1,33 @@
+import pickle
+
+import pytest
+from dagster._check import CheckError
+from dagster._utils.pickling import (
+    check_compression,
+    dump_pickled_object,
+    load_pickled_object,
+    spooled_temporary_file,
+)
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_pickled_object_roundtrip(compression):
+    obj = {"a": list(range(10000)), "b": ("x" * 100, 1.5)}
+    with spooled_temporary_file(max_size=1024) as file:
+        dump_pickled_object(obj, file, compression)
+        # larger than max_size, so the file was spilled to disk
+        assert file._rolled  # noqa: SLF001
+        assert load_pickled_object(file) == obj
+
+
+def test_load_plain_pickle():
+    with spooled_temporary_file() as file:
+        pickle.dump([1, 2, 3], file)
+        assert load_pickled_object(file) == [1, 2, 3]
+
+
+def test_check_compression():
+    assert check_compression(None) is None
+    assert check_compression("zstd") == "zstd"
+    with pytest.raises(CheckError):
+        check_compression("lz4")
@@ -0,0 +1,109 @@
+import threading
+
+from dagster import DagsterEventType, job, op
+from dagster._core.instance.event_log_writer import BackgroundEventLogWriter
+from dagster._core.test_utils import instance_for_test
+
+
+def test_background_writer_batches_in_order():
+    batches = []
+    writer = BackgroundEventLogWriter(write_batch=batches.append, max_batch_size=3)
+    try:
+        for i in range(10):
+            writer.submit(i)  # type: ignore
+        writer.flush()
+
+        assert [event for batch in batches for event in batch] == list(range(10))
+        assert all(1 <= len(batch) <= 3 for batch in batches)
+    finally:
+        writer.shutdown()
+
+
+def test_background_writer_backpressure():
+    written = []
+    unblock = threading.Event()
+
+    def _write_batch(events):
+        unblock.wait()
+        written.extend(events)
+
+    writer = BackgroundEventLogWriter(write_batch=_write_batch, max_queue_size=1, max_batch_size=1)
+    submitted = threading.Event()
+
+    def _submit():
+        for i in range(3):
+            writer.submit(i)  # type: ignore
+        submitted.set()
+
+    thread = threading.Thread(target=_submit)
+    thread.start()
+    try:
+        # the writer is stuck on the first event and the queue holds a single event, so the third
+        # submit blocks until the writer catches up
+        assert not submitted.wait(0.5)
+        unblock.set()
+        assert submitted.wait(5)
+        writer.flush()
+        assert written == [0, 1, 2]
+    finally:
+        unblock.set()
+        thread.join()
+        writer.shutdown()
+
+
+def test_background_writer_survives_failed_batch():
+    written = []
+
+    def _write_batch(events):
+        if events == ["bad"]:
+            raise Exception("failed")
+        written.extend(events)
+
+    writer = BackgroundEventLogWriter(write_batch=_write_batch, max_batch_size=1)
+    try:
+        writer.submit("bad")  # type: ignore
+        writer.flush()
+        writer.submit("good")  # type: ignore
+        writer.flush()
+        assert written == ["good"]
+    finally:
+        writer.shutdown()
+
+
+def test_background_log_writer_execution():
+    @op
+    def chatty_op(context):
+        for i in range(200):
+            context.log.info(f"message {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with instance_for_test(
+        overrides={
+            "python_logs": {
+                "background_log_writer": {"enabled": True, "max_queue_size": 10},
+            }
+        }
+    ) as instance:
+        result = chatty_job.execute_in_process(instance=instance)
+        assert result.success
+
+        records = instance.all_logs(result.run_id)
+        messages = [
+            record.user_message for record in records if record.user_message.startswith("message")
+        ]
+        assert messages == [f"message {i}" for i in range(200)]
+
+        # every log message is written before the step completes
+        step_success_index = next(
+            i
+            for i, record in enumerate(records)
+            if record.dagster_event_type == DagsterEventType.STEP_SUCCESS
+        )
+        assert all(
+            i < step_success_index
+            for i, record in enumerate(records)
+            if record.user_message.startswith("message")
+        )
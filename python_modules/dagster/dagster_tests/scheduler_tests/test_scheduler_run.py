@@ -58,7 +58,7 @@
 from dagster._daemon import get_default_daemon_logger
 from dagster._grpc.client import DagsterGrpcClient
 from dagster._grpc.server import open_server_process
-from dagster._scheduler.scheduler import launch_scheduled_runs
+from dagster._scheduler.scheduler import ScheduleNextTickTimes, launch_scheduled_runs
 from dagster._seven import wait_for_process
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 from dagster._utils import DebugCrashFlags, find_free_port
@@ -108,6 +108,7 @@ def evaluate_schedules(
     max_catchup_runs: int = DEFAULT_MAX_CATCHUP_RUNS,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
     timeout: int = 75,
+    next_tick_times: Optional[ScheduleNextTickTimes] = None,
 ):
     logger = get_default_daemon_logger("SchedulerDaemon")
     futures = {}
@@ -121,6 +122,7 @@ def evaluate_schedules(
             max_tick_retries=max_tick_retries,
             max_catchup_runs=max_catchup_runs,
             debug_crash_flags=debug_crash_flags,
+            next_tick_times=next_tick_times,
         )
     )
 
@@ -700,6 +702,76 @@ def test_simple_schedule(
         assert len(ticks) == 2
 
 
+@pytest.mark.parametrize("executor", get_schedule_executors())
+def test_skip_schedules_with_no_tick_due(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+    executor: ThreadPoolExecutor,
+):
+    next_tick_times = ScheduleNextTickTimes()
+    freeze_datetime = feb_27_2019_one_second_to_midnight()
+    with pendulum.test(freeze_datetime):
+        external_schedule = external_repo.get_external_schedule("simple_schedule")
+        schedule_origin = external_schedule.get_external_origin()
+        instance.start_schedule(external_schedule)
+
+        evaluate_schedules(
+            workspace_context, executor, pendulum.now("UTC"), next_tick_times=next_tick_times
+        )
+        assert instance.get_runs_count() == 0
+        schedule_state = instance.get_instigator_state(
+            schedule_origin.get_id(), external_schedule.selector_id
+        )
+        assert next_tick_times.is_idle(external_schedule, schedule_state)
+
+    freeze_datetime = freeze_datetime.add(seconds=2)
+    with pendulum.test(freeze_datetime):
+        evaluate_schedules(
+            workspace_context, executor, pendulum.now("UTC"), next_tick_times=next_tick_times
+        )
+        assert instance.get_runs_count() == 1
+        ticks = instance.get_ticks(schedule_origin.get_id(), external_schedule.selector_id)
+        assert len(ticks) == 1
+        assert ticks[0].status == TickStatus.SUCCESS
+        assert next_tick_times.is_idle(external_schedule, schedule_state)
+
+    freeze_datetime = freeze_datetime.add(hours=1)
+    with pendulum.test(freeze_datetime):
+        # without its latest tick, the scheduler would evaluate the schedule again to recreate the
+        # tick, but the schedule is skipped since it has no tick due until the next day
+        instance.purge_ticks(
+            schedule_origin.get_id(),
+            external_schedule.selector_id,
+            before=pendulum.now("UTC").timestamp(),
+        )
+        evaluate_schedules(
+            workspace_context, executor, pendulum.now("UTC"), next_tick_times=next_tick_times
+        )
+        assert instance.get_runs_count() == 1
+        assert not instance.get_ticks(schedule_origin.get_id(), external_schedule.selector_id)
+
+        # restarting the schedule makes it due again
+        instance.stop_schedule(
+            schedule_origin.get_id(), external_schedule.selector_id, external_schedule
+        )
+        instance.start_schedule(external_schedule)
+        schedule_state = instance.get_instigator_state(
+            schedule_origin.get_id(), external_schedule.selector_id
+        )
+        assert not next_tick_times.is_idle(external_schedule, schedule_state)
+
+    freeze_datetime = freeze_datetime.add(days=1)
+    with pendulum.test(freeze_datetime):
+        evaluate_schedules(
+            workspace_context, executor, pendulum.now("UTC"), next_tick_times=next_tick_times
+        )
+        assert instance.get_runs_count() == 2
+        ticks = instance.get_ticks(schedule_origin.get_id(), external_schedule.selector_id)
+        assert len(ticks) == 1
+        assert ticks[0].status == TickStatus.SUCCESS
+
+
 # Verify that the scheduler uses selector and not origin to dedupe schedules
 @pytest.mark.parametrize("executor", get_schedule_executors())
 def test_schedule_with_different_origin(
@@ -3,6 +3,10 @@
 import pytest
 from dagster import AssetKey, InputContext, OutputContext, asset, build_output_context
 from dagster._check import CheckError
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionKey,
+    MultiPartitionsDefinition,
+)
 from dagster._core.definitions.partition import StaticPartitionsDefinition
 from dagster._core.definitions.time_window_partitions import DailyPartitionsDefinition, TimeWindow
 from dagster._core.errors import DagsterInvalidDefinitionError
@@ -292,6 +296,99 @@ def test_asset_out_multiple_static_partitions():
     assert handler.handle_input_calls[0][1] == table_slice
 
 
+def _multi_partitions_def():
+    return MultiPartitionsDefinition(
+        {
+            "time": DailyPartitionsDefinition(start_date="2020-01-01"),
+            "color": StaticPartitionsDefinition(["red", "yellow", "blue"]),
+        }
+    )
+
+
+def test_asset_out_multi_partition_range():
+    handler = IntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient, get_select_statement=MagicMock(return_value=""), connect=connect_mock
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = _multi_partitions_def()
+    partition_keys = [
+        MultiPartitionKey({"time": time_key, "color": color_key})
+        for time_key in ["2020-01-02", "2020-01-03", "2020-01-04"]
+        for color_key in ["red", "blue"]
+    ]
+    metadata = {"partition_expr": {"time": "my_time_col", "color": "my_color_col"}}
+    output_context = MagicMock(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        asset_partition_keys=partition_keys,
+        metadata=metadata,
+        asset_partitions_def=partitions_def,
+    )
+    manager.handle_output(output_context, 5)
+    input_context = MagicMock(
+        asset_key=asset_key,
+        upstream_output=output_context,
+        resource_config=resource_config,
+        dagster_type=resolve_dagster_type(int),
+        asset_partition_keys=partition_keys,
+        metadata=None,
+        asset_partitions_def=partitions_def,
+    )
+    assert manager.load_input(input_context) == 7
+
+    table_slice = TableSlice(
+        database="database_abc",
+        schema="schema1",
+        table="table1",
+        partition_dimensions=[
+            TablePartitionDimension(partition_expr="my_color_col", partitions=["blue", "red"]),
+            TablePartitionDimension(
+                partition_expr="my_time_col",
+                partitions=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 5)),
+            ),
+        ],
+    )
+    assert handler.handle_output_calls[0][1:] == (table_slice, 5)
+    conn = connect_mock().__enter__()
+    db_client.transaction.assert_called_once_with(output_context, table_slice, conn)
+    db_client.delete_table_slice.assert_called_once_with(output_context, table_slice, conn)
+    assert handler.handle_input_calls[0][1] == table_slice
+
+
+@pytest.mark.parametrize(
+    "partition_keys",
+    [
+        # not every (time, color) combination
+        [
+            MultiPartitionKey({"time": "2020-01-02", "color": "red"}),
+            MultiPartitionKey({"time": "2020-01-03", "color": "blue"}),
+        ],
+        # time partitions with a gap
+        [
+            MultiPartitionKey({"time": "2020-01-02", "color": "red"}),
+            MultiPartitionKey({"time": "2020-01-04", "color": "red"}),
+        ],
+    ],
+)
+def test_asset_out_multi_partition_not_selectable(partition_keys):
+    handler = IntHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    output_context = MagicMock(
+        asset_key=AssetKey(["schema1", "table1"]),
+        resource_config=resource_config,
+        asset_partition_keys=partition_keys,
+        metadata={"partition_expr": {"time": "my_time_col", "color": "my_color_col"}},
+        asset_partitions_def=_multi_partitions_def(),
+    )
+    with pytest.raises(ValueError, match="single"):
+        manager.handle_output(output_context, 5)
+    assert len(handler.handle_output_calls) == 0
+
+
 def test_different_output_and_input_types():
     int_handler = IntHandler()
     str_handler = StringHandler()
@@ -24,6 +24,7 @@
 from dagster._core.storage.partition_status_cache import (
     AssetStatusCacheValue,
     get_and_update_asset_status_cache_value,
+    get_and_update_asset_status_cache_values,
 )
 from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._core.test_utils import create_run_for_test, instance_for_test
@@ -207,6 +208,74 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
         assert counts.get("DagsterInstance.get_materialization_count_by_partition") == 2
 
 
+def test_get_cached_partition_statuses_for_many_assets():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    @asset(partitions_def=partitions_def)
+    def asset2():
+        return 1
+
+    @asset(partitions_def=partitions_def)
+    def never_materialized():
+        return 1
+
+    asset_job = define_asset_job("asset_job", selection=["asset1"]).resolve(
+        [asset1, asset2, never_materialized], []
+    )
+    partitions_defs_by_key = {
+        AssetKey("asset1"): partitions_def,
+        AssetKey("asset2"): partitions_def,
+        AssetKey("never_materialized"): partitions_def,
+    }
+
+    def _materialized_keys(cache_value):
+        return set(
+            partitions_def.deserialize_subset(
+                cache_value.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        )
+
+    with instance_for_test() as created_instance:
+        asset_job.execute_in_process(instance=created_instance, partition_key="a")
+
+        cache_values = get_and_update_asset_status_cache_values(
+            created_instance, partitions_defs_by_key
+        )
+        assert _materialized_keys(cache_values[AssetKey("asset1")]) == {"a"}
+        assert cache_values[AssetKey("asset2")] is None
+        assert cache_values[AssetKey("never_materialized")] is None
+
+        # values without new events are read from storage without being evaluated again
+        traced_counter.set(Counter())
+        assert (
+            get_and_update_asset_status_cache_values(created_instance, partitions_defs_by_key)
+            == cache_values
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_asset_records") == 1
+        assert not counts.get("DagsterInstance.get_event_records")
+        assert not counts.get("DagsterInstance.update_asset_cached_status_data")
+
+        asset_job.execute_in_process(instance=created_instance, partition_key="b")
+        traced_counter.set(Counter())
+        cache_values = get_and_update_asset_status_cache_values(
+            created_instance, partitions_defs_by_key
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") == 1
+        assert _materialized_keys(cache_values[AssetKey("asset1")]) == {"a", "b"}
+        assert cache_values == {
+            asset_key: get_and_update_asset_status_cache_value(
+                created_instance, asset_key, partitions_def
+            )
+            for asset_key in partitions_defs_by_key
+        }
+
+
 def test_multipartition_get_cached_partition_status():
     partitions_def = MultiPartitionsDefinition(
         {
@@ -1,5 +1,7 @@
 import json
 import pickle
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
@@ -415,3 +417,100 @@ def my_asset() -> Any:
     ].event_specific_data
     assert isinstance(handled_output_data, HandledOutputData)
     assert handled_output_data.metadata["length"] == MetadataValue.int(get_length(json_data))
+
+
+def test_upath_io_manager_concurrent_multiple_partitions(
+    tmp_path: Path,
+    daily: DailyPartitionsDefinition,
+    hourly: HourlyPartitionsDefinition,
+    start: datetime,
+):
+    loading_threads = set()
+
+    class SlowIOManager(UPathIOManager):
+        def dump_to_path(self, context: OutputContext, obj: str, path: UPath):
+            pass
+
+        def load_from_path(self, context: InputContext, path: UPath) -> str:
+            loading_threads.add(threading.get_ident())
+            time.sleep(0.05)
+            return path.stem
+
+    manager = SlowIOManager(base_path=UPath(tmp_path), max_workers=8)
+
+    @asset(partitions_def=hourly)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(partitions_def=daily)
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        partition_key=start.strftime(daily.fmt),
+        resources={"io_manager": manager},
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    # results are returned in partition order, regardless of which load finished first
+    assert list(downstream_asset_data.keys()) == [
+        f"{start:%Y-%m-%d}-{hour:02d}:00" for hour in range(24)
+    ]
+    assert len(loading_threads) > 1
+
+    loaded_input_event = next(
+        event for event in result.all_node_events if event.event_type_value == "LOADED_INPUT"
+    )
+    metadata = loaded_input_event.event_specific_data.metadata  # type: ignore
+    assert metadata["num_partitions_loaded"] == MetadataValue.int(24)
+    partition_load_seconds = metadata["partition_load_seconds"].value
+    assert list(partition_load_seconds.keys()) == list(downstream_asset_data.keys())
+    assert all(seconds >= 0.05 for seconds in partition_load_seconds.values())
+
+
+def test_upath_io_manager_concurrent_missing_partition(tmp_path: Path):
+    class JSONIOManager(UPathIOManager):
+        extension: str = ".json"
+
+        def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
+            with path.open("w") as file:
+                json.dump(obj, file)
+
+        def load_from_path(self, context: InputContext, path: UPath) -> Any:
+            with path.open("r") as file:
+                return json.load(file)
+
+    manager = JSONIOManager(base_path=UPath(tmp_path), max_workers=4)
+    partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    for partition_key in ["A", "C"]:
+        materialize([upstream_asset], partition_key=partition_key, resources={"io_manager": manager})
+
+    @asset(ins={"upstream_asset": AssetIn(metadata={"allow_missing_partitions": True})})
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        resources={"io_manager": manager},
+    )
+    assert result.output_for_node("downstream_asset") == {"A": "A", "C": "C"}
+
+    @asset(name="downstream_asset")
+    def strict_downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    with pytest.raises(FileNotFoundError):
+        materialize(
+            [*upstream_asset.to_source_assets(), strict_downstream_asset],
+            resources={"io_manager": manager},
+        )
+
+
+def test_upath_io_manager_invalid_max_workers(tmp_path: Path):
+    with pytest.raises(CheckError):
+        DummyIOManager(base_path=UPath(tmp_path), max_workers=0)
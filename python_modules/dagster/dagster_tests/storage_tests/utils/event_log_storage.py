@@ -431,6 +431,31 @@ def test_event_log_storage_store_events_and_wipe(self, test_run_id, storage):
             storage.wipe()
             assert len(storage.get_logs_for_run(test_run_id)) == 0
 
+    def test_event_log_storage_store_event_batch(self, test_run_id, storage):
+        assert len(storage.get_logs_for_run(test_run_id)) == 0
+        storage.store_event_batch(
+            [
+                EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message=f"message {i}",
+                    run_id=test_run_id,
+                    timestamp=time.time(),
+                )
+                for i in range(5)
+            ]
+        )
+        storage.store_event_batch([create_test_event_log_record("engine event", test_run_id)])
+
+        assert [log.user_message for log in storage.get_logs_for_run(test_run_id)] == [
+            "message 0",
+            "message 1",
+            "message 2",
+            "message 3",
+            "message 4",
+            "engine event",
+        ]
+
     def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
         runs = ["foo", "bar", "baz"]
         if instance:
@@ -2000,6 +2025,173 @@ def _fetch_counts(storage, after_cursor=None):
                     )
                     assert _fetch_counts(storage, after_cursor=9999999999) == {c: {}, d: {}}
 
+    def test_get_latest_materialization_records_after_cursors(self, storage, instance):
+        a = AssetKey("no_materializations_asset")
+        b = AssetKey("no_partitions_asset")
+        c = AssetKey("two_partitions_asset")
+        d = AssetKey("one_partition_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(b)
+            yield AssetMaterialization(c, partition="a")
+            yield AssetObservation(a, partition="a")
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(d, partition="x")
+            yield AssetMaterialization(c, partition="a")
+            yield AssetMaterialization(c, partition="b")
+            yield AssetMaterialization(b)
+            yield Output(None)
+
+        def _fetch(after_cursor_by_asset_key, **kwargs):
+            return [
+                (event_record.asset_key, event_record.partition_key, event_record.storage_id)
+                for event_record in storage.get_latest_materialization_records_after_cursors(
+                    after_cursor_by_asset_key, **kwargs
+                )
+            ]
+
+        def _fetch_one_at_a_time(after_cursor_by_asset_key, asset_partitions=None):
+            # the expected result, one query per asset key
+            records = []
+            for asset_key, after_cursor in after_cursor_by_asset_key.items():
+                latest_record_by_partition = {}
+                for event_record in storage.get_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                        asset_key=asset_key,
+                        asset_partitions=asset_partitions,
+                        after_cursor=after_cursor,
+                    ),
+                    ascending=True,
+                ):
+                    latest_record_by_partition[event_record.partition_key] = event_record
+                records.extend(
+                    (asset_key, partition, event_record.storage_id)
+                    for partition, event_record in latest_record_by_partition.items()
+                )
+            return sorted(records, key=lambda record: record[2])
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                assert _fetch({a: None, b: None}) == []
+
+                events_one, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id_1
+                )
+                for event in events_one:
+                    storage.store_event(event)
+
+                cursor_run1 = storage.get_event_records(
+                    EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION),
+                    limit=1,
+                    ascending=False,
+                )[0].storage_id
+
+                events_two, _ = _synthesize_events(
+                    lambda: materialize_two(), instance=created_instance, run_id=run_id_2
+                )
+                for event in events_two:
+                    storage.store_event(event)
+
+                latest_records = _fetch({a: None, b: None, c: None, d: None})
+                assert [(asset_key, partition) for asset_key, partition, _ in latest_records] == [
+                    (d, "x"),
+                    (c, "b"),
+                    (b, None),
+                ]
+
+                for after_cursor_by_asset_key in [
+                    {a: None, b: None, c: None, d: None},
+                    {a: None, b: None, c: cursor_run1, d: None},
+                    {b: cursor_run1, c: None, d: 9999999999},
+                ]:
+                    assert _fetch(after_cursor_by_asset_key, by_partition=True) == [
+                        record
+                        for record in _fetch_one_at_a_time(after_cursor_by_asset_key)
+                        if record[1] is not None
+                    ]
+                    assert _fetch(
+                        after_cursor_by_asset_key, by_partition=True, asset_partitions=["a", "x"]
+                    ) == _fetch_one_at_a_time(
+                        after_cursor_by_asset_key, asset_partitions=["a", "x"]
+                    )
+
+                by_partition = _fetch({c: cursor_run1}, by_partition=True)
+                assert [(asset_key, partition) for asset_key, partition, _ in by_partition] == [
+                    (c, "a"),
+                    (c, "b"),
+                ]
+                assert _fetch({c: cursor_run1, d: 9999999999}) == [by_partition[-1]]
+
+                # wipe asset, make sure we respect that
+                if self.can_wipe():
+                    storage.wipe_asset(c)
+                    assert _fetch({c: None, d: None}, by_partition=True) == [
+                        (d, "x", latest_records[0][2])
+                    ]
+
+    def test_get_latest_storage_id_by_asset_key(self, storage, instance):
+        a = AssetKey("materialized_asset")
+        b = AssetKey("observed_asset")
+        c = AssetKey("no_events_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a)
+            yield AssetObservation(b)
+            yield AssetMaterialization(a, partition="x")
+            yield Output(None)
+
+        def _latest_storage_id(asset_key, event_type):
+            records = storage.get_event_records(
+                EventRecordsFilter(event_type=event_type, asset_key=asset_key), limit=1
+            )
+            return records[0].storage_id if records else None
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_id = make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id]):
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                materialization_id = _latest_storage_id(a, DagsterEventType.ASSET_MATERIALIZATION)
+                observation_id = _latest_storage_id(b, DagsterEventType.ASSET_OBSERVATION)
+
+                assert storage.get_latest_storage_id_by_asset_key(
+                    [a, b, c], [DagsterEventType.ASSET_MATERIALIZATION]
+                ) == {a: materialization_id}
+                assert storage.get_latest_storage_id_by_asset_key(
+                    [a, b, c],
+                    [DagsterEventType.ASSET_MATERIALIZATION, DagsterEventType.ASSET_OBSERVATION],
+                ) == {a: materialization_id, b: observation_id}
+                assert storage.get_latest_storage_id_by_asset_key([], []) == {}
+
+                # wipe asset, make sure we respect that
+                if self.can_wipe():
+                    storage.wipe_asset(a)
+                    assert (
+                        storage.get_latest_storage_id_by_asset_key(
+                            [a, b], [DagsterEventType.ASSET_MATERIALIZATION]
+                        )
+                        == {}
+                    )
+
     def test_get_latest_asset_partition_materialization_attempts_without_materializations(
         self, storage, instance
     ):
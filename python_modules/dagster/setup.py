@@ -121,6 +121,7 @@ def get_version() -> str:
             "snapshottest==0.6.0",
             "tox==3.25.0",
             "yamllint",
+            "zstandard",
         ],
         "black": [
             "black[jupyter]==22.12.0",
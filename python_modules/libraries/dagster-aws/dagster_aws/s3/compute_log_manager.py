@@ -12,6 +12,7 @@
 )
 from dagster._config.config_type import Noneable
 from dagster._core.storage.cloud_storage_compute_log_manager import (
+    ChunkedPartialUploadsMixin,
     CloudStorageComputeLogManager,
     PollingComputeLogSubscriptionManager,
 )
@@ -27,7 +28,9 @@
 POLLING_INTERVAL = 5
 
 
-class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
+class S3ComputeLogManager(
+    ChunkedPartialUploadsMixin, CloudStorageComputeLogManager, ConfigurableClass
+):
     """Logs compute function stdout and stderr to S3.
 
     Users should not instantiate this class directly. Instead, use a YAML block in ``dagster.yaml``
@@ -48,6 +51,7 @@ class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
             endpoint_url: "http://alternate-s3-host.io"
             skip_empty_files: true
             upload_interval: 30
+            chunked_partial_uploads: true
 
     Args:
         bucket (str): The name of the s3 bucket to which to log.
@@ -61,6 +65,9 @@ class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
         endpoint_url (Optional[str]): Override for the S3 endpoint url.
         skip_empty_files: (Optional[bool]): Skip upload of empty log files.
         upload_interval: (Optional[int]): Interval in seconds to upload partial log files to S3. By default, will only upload when the capture is complete.
+        chunked_partial_uploads: (Optional[bool]): Upload partial logs as append-only chunks
+            that only contain the output produced since the previous upload, instead of
+            re-uploading the whole log file every ``upload_interval``. Default False.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -78,7 +85,9 @@ def __init__(
         skip_empty_files=False,
         upload_interval=None,
         upload_extra_args=None,
+        chunked_partial_uploads=False,
     ):
+        super().__init__()
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
             "s3", use_ssl=use_ssl, verify=_verify, endpoint_url=endpoint_url
@@ -97,6 +106,9 @@ def __init__(
         self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
         check.opt_dict_param(upload_extra_args, "upload_extra_args")
         self._upload_extra_args = upload_extra_args
+        self._chunked_partial_uploads = check.bool_param(
+            chunked_partial_uploads, "chunked_partial_uploads"
+        )
 
     @property
     def inst_data(self):
@@ -117,6 +129,15 @@ def config_type(cls):
             "upload_extra_args": Field(
                 Permissive(), is_required=False, description="Extra args for S3 file upload"
             ),
+            "chunked_partial_uploads": Field(
+                bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Upload partial logs as append-only chunks containing only the output"
+                    " produced since the previous upload."
+                ),
+            ),
         }
 
     @classmethod
@@ -147,6 +168,12 @@ def _s3_key(self, log_key, io_type, partial=False):
         paths = [self._s3_prefix, "storage", *namespace, filename]
         return "/".join(paths)  # s3 path delimiter
 
+    def _s3_partial_chunk_key(self, log_key, io_type, chunk_index):
+        return f"{self._s3_key(log_key, io_type, partial=True)}.{chunk_index}"
+
+    def _s3_partial_manifest_key(self, log_key, io_type):
+        return f"{self._s3_key(log_key, io_type, partial=True)}.manifest"
+
     def delete_logs(
         self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
     ):
@@ -160,6 +187,13 @@ def delete_logs(
                 self._s3_key(log_key, ComputeIOType.STDOUT, partial=True),
                 self._s3_key(log_key, ComputeIOType.STDERR, partial=True),
             ]
+            # chunked partial logs and their manifests share the partial key as a prefix
+            for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+                partial_prefix = f"{self._s3_key(log_key, io_type, partial=True)}."
+                matching = self._s3_session.list_objects(
+                    Bucket=self._s3_bucket, Prefix=partial_prefix
+                )
+                s3_keys_to_remove.extend(obj["Key"] for obj in matching.get("Contents", []))
         elif prefix:
             # add the trailing '' to make sure that ['a'] does not match ['apple']
             s3_prefix = "/".join([self._s3_prefix, "storage", *prefix, ""])
@@ -190,7 +224,10 @@ def display_path_for_type(self, log_key: Sequence[str], io_type: ComputeIOType):
     def cloud_storage_has_logs(
         self, log_key: Sequence[str], io_type: ComputeIOType, partial: bool = False
     ) -> bool:
-        s3_key = self._s3_key(log_key, io_type, partial=partial)
+        if partial and self._chunked_partial_uploads:
+            s3_key = self._s3_partial_manifest_key(log_key, io_type)
+        else:
+            s3_key = self._s3_key(log_key, io_type, partial=partial)
         try:  # https://stackoverflow.com/a/38376288/14656695
             self._s3_session.head_object(Bucket=self._s3_bucket, Key=s3_key)
         except ClientError:
@@ -223,6 +260,81 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._s3_session.download_fileobj(self._s3_bucket, s3_key, fileobj)
 
+    @property
+    def supports_chunked_partial_uploads(self) -> bool:
+        return self._chunked_partial_uploads
+
+    def upload_partial_chunk(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_index: int, data: bytes
+    ):
+        self._s3_session.put_object(
+            Bucket=self._s3_bucket,
+            Key=self._s3_partial_chunk_key(log_key, io_type, chunk_index),
+            Body=data,
+            **(self._upload_extra_args or {}),
+        )
+
+    def download_partial_chunk(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunk_index: int,
+        start: int,
+        end: int,
+    ) -> bytes:
+        if end <= start:
+            return b""
+        response = self._s3_session.get_object(
+            Bucket=self._s3_bucket,
+            Key=self._s3_partial_chunk_key(log_key, io_type, chunk_index),
+            Range=f"bytes={start}-{end - 1}",
+        )
+        return response["Body"].read()
+
+    def upload_partial_manifest(
+        self, log_key: Sequence[str], io_type: ComputeIOType, manifest: bytes
+    ):
+        self._s3_session.put_object(
+            Bucket=self._s3_bucket,
+            Key=self._s3_partial_manifest_key(log_key, io_type),
+            Body=manifest,
+            **(self._upload_extra_args or {}),
+        )
+
+    def download_partial_manifest(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Optional[bytes]:
+        try:
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=self._s3_partial_manifest_key(log_key, io_type)
+            )
+        except self._s3_session.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
+
+    def read_cloud_storage_range(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: Optional[int],
+    ) -> Optional[bytes]:
+        if max_bytes is not None and max_bytes <= 0:
+            return b""
+        byte_range = (
+            f"bytes={offset}-" if max_bytes is None else f"bytes={offset}-{offset + max_bytes - 1}"
+        )
+        try:
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=self._s3_key(log_key, io_type), Range=byte_range
+            )
+        except ClientError as e:
+            # the offset is at or past the end of the logs
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
@@ -1,31 +1,70 @@
-import io
-import pickle
-from typing import Sequence, Union
+from typing import Optional, Sequence, Union
 
+from boto3.s3.transfer import TransferConfig
 from dagster import (
     Field,
     InputContext,
+    IntSource,
     MemoizableIOManager,
     MetadataValue,
+    Noneable,
     OutputContext,
     StringSource,
     _check as check,
     io_manager,
 )
-from dagster._utils import PICKLE_PROTOCOL
+from dagster._utils.pickling import (
+    check_compression,
+    dump_pickled_object,
+    load_pickled_object,
+    spooled_temporary_file,
+)
+
+MB = 1024 * 1024
+
+DEFAULT_MULTIPART_THRESHOLD = 8 * MB
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * MB
+DEFAULT_MAX_CONCURRENCY = 10
 
 
 class PickledObjectS3IOManager(MemoizableIOManager):
+    """IO manager that pickles objects to S3.
+
+    Objects are pickled into a spooled temporary file rather than an in-memory bytes object, and
+    are transferred with multipart uploads and concurrent ranged downloads once they exceed
+    ``multipart_threshold`` bytes.
+
+    Args:
+        s3_bucket (str): the S3 bucket to store objects in.
+        s3_session: a boto3 S3 client.
+        s3_prefix (Optional[str]): key prefix under which objects are stored.
+        multipart_threshold (int): size in bytes above which transfers are split into parts.
+        multipart_chunksize (int): size in bytes of each part of a multipart transfer.
+        max_concurrency (int): maximum number of parts transferred concurrently.
+        compression (Optional[str]): compress pickled objects with the given codec. Only
+            ``"zstd"`` is supported. Objects are decompressed on load regardless of this setting.
+    """
+
     def __init__(
         self,
         s3_bucket,
         s3_session,
         s3_prefix=None,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compression: Optional[str] = None,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.opt_str_param(s3_prefix, "s3_prefix")
         self.s3 = s3_session
         self.s3.list_objects(Bucket=self.bucket, Prefix=self.s3_prefix, MaxKeys=1)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=check.int_param(multipart_threshold, "multipart_threshold"),
+            multipart_chunksize=check.int_param(multipart_chunksize, "multipart_chunksize"),
+            max_concurrency=check.int_param(max_concurrency, "max_concurrency"),
+        )
+        self.compression = check_compression(compression)
 
     def _get_path(self, context: Union[InputContext, OutputContext]) -> str:
         path: Sequence[str]
@@ -71,7 +110,9 @@ def load_input(self, context):
 
         key = self._get_path(context)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+        with spooled_temporary_file() as file:
+            self.s3.download_fileobj(self.bucket, key, file, Config=self.transfer_config)
+            obj = load_pickled_object(file)
 
         return obj
 
@@ -94,16 +135,48 @@ def handle_output(self, context, obj):
             context.log.warning(f"Removing existing S3 key: {key}")
             self._rm_object(key)
 
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        pickled_obj_bytes = io.BytesIO(pickled_obj)
-        self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
-        context.add_output_metadata({"uri": MetadataValue.path(path)})
+        with spooled_temporary_file() as file:
+            dump_pickled_object(obj, file, self.compression)
+            size = file.tell()
+            file.seek(0)
+            self.s3.upload_fileobj(file, self.bucket, key, Config=self.transfer_config)
+
+        context.add_output_metadata(
+            {"uri": MetadataValue.path(path), "size_bytes": MetadataValue.int(size)}
+        )
 
 
 @io_manager(
     config_schema={
         "s3_bucket": Field(StringSource),
         "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+        "multipart_threshold": Field(
+            IntSource,
+            is_required=False,
+            default_value=DEFAULT_MULTIPART_THRESHOLD,
+            description="Size in bytes above which uploads and downloads are split into parts.",
+        ),
+        "multipart_chunksize": Field(
+            IntSource,
+            is_required=False,
+            default_value=DEFAULT_MULTIPART_CHUNKSIZE,
+            description="Size in bytes of each part of a multipart upload or download.",
+        ),
+        "max_concurrency": Field(
+            IntSource,
+            is_required=False,
+            default_value=DEFAULT_MAX_CONCURRENCY,
+            description="Maximum number of parts transferred concurrently.",
+        ),
+        "compression": Field(
+            Noneable(StringSource),
+            is_required=False,
+            default_value=None,
+            description=(
+                "Compress pickled objects before upload. Only 'zstd' is supported, which requires"
+                " the zstandard package."
+            ),
+        ),
     },
     required_resource_keys={"s3"},
 )
@@ -176,5 +249,13 @@ def my_job():
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        multipart_threshold=init_context.resource_config["multipart_threshold"],
+        multipart_chunksize=init_context.resource_config["multipart_chunksize"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+        compression=init_context.resource_config["compression"],
+    )
     return pickled_io_manager
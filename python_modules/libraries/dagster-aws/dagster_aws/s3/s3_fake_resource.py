@@ -4,6 +4,16 @@
 from botocore.exceptions import ClientError
 
 
+class NoSuchKey(ClientError):
+    pass
+
+
+class S3FakeExceptions:
+    """Mirrors the modeled exceptions that boto3 exposes on ``client.exceptions``."""
+
+    NoSuchKey = NoSuchKey
+
+
 def create_s3_fake_resource(buckets=None):
     """Create a mock S3 session for test."""
     return S3FakeSession(buckets=buckets)
@@ -20,6 +30,7 @@ def __init__(self, buckets=None):
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
         self.mock_extras = mock.MagicMock()
+        self.exceptions = S3FakeExceptions
 
     def head_bucket(self, Bucket, *args, **kwargs):
         self.mock_extras.head_bucket(*args, **kwargs)
@@ -55,7 +66,7 @@ def put_object(self, Bucket, Key, Body, *args, **kwargs):
 
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self.has_object(Bucket, Key):
-            raise ClientError({}, None)
+            raise NoSuchKey({}, None)
 
         self.mock_extras.get_object(*args, **kwargs)
         return {"Body": self._get_byte_stream(Bucket, Key)}
@@ -232,3 +232,122 @@ def read_manager(self, mock_s3_bucket):
             yield S3ComputeLogManager(
                 bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir
             )
+
+
+def test_ranged_read_of_complete_logs(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir
+        )
+        log_key = ["arbitrary", "log", "key"]
+        with manager.open_log_stream(log_key, ComputeIOType.STDOUT) as write_stream:
+            write_stream.write("0123456789")
+        manager.local_manager.delete_logs(log_key=log_key)
+
+        log_data = manager.get_log_data(log_key, cursor="2:0", max_bytes=5)
+        assert log_data.stdout == b"23456"
+        assert log_data.cursor == "7:0"
+
+        log_data = manager.get_log_data(log_key, cursor=log_data.cursor, max_bytes=5)
+        assert log_data.stdout == b"789"
+        assert log_data.cursor == "10:0"
+
+        log_data = manager.get_log_data(log_key, cursor=log_data.cursor, max_bytes=5)
+        assert log_data.stdout == b""
+        assert log_data.cursor == "10:0"
+
+        # the logs were read from S3 without downloading them
+        assert not manager.has_local_file(log_key, ComputeIOType.STDOUT)
+
+
+def test_chunked_partial_uploads(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as write_dir, tempfile.TemporaryDirectory() as read_dir:
+        write_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=write_dir,
+            chunked_partial_uploads=True,
+        )
+        read_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=read_dir,
+            chunked_partial_uploads=True,
+        )
+        log_key = ["arbitrary", "log", "key"]
+        path = write_manager.local_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]
+        )
+        os.makedirs(os.path.dirname(path))
+
+        def _s3_keys():
+            return {obj.key for obj in mock_s3_bucket.objects.all()}
+
+        with open(path, "wb") as f:
+            f.write(b"hello ")
+        write_manager.on_progress(log_key)
+        assert _s3_keys() == {
+            "my_prefix/storage/arbitrary/log/key.out.partial.0",
+            "my_prefix/storage/arbitrary/log/key.out.partial.manifest",
+        }
+
+        # nothing new was written, so nothing is uploaded
+        write_manager.on_progress(log_key)
+        assert len(_s3_keys()) == 2
+
+        with open(path, "ab") as f:
+            f.write(b"world")
+        write_manager.on_progress(log_key)
+        assert (
+            mock_s3_bucket.Object(key="my_prefix/storage/arbitrary/log/key.out.partial.1")
+            .get()["Body"]
+            .read()
+            == b"world"
+        )
+
+        assert read_manager.get_log_data(log_key).stdout == b"hello world"
+        log_data = read_manager.get_log_data(log_key, cursor="4:0", max_bytes=4)
+        assert log_data.stdout == b"o wo"
+        assert log_data.cursor == "8:0"
+        assert not read_manager.has_local_file(log_key, ComputeIOType.STDOUT)
+
+        write_manager.delete_logs(log_key=log_key)
+        assert _s3_keys() == set()
+
+
+class TestS3ChunkedComputeLogManager(TestCapturedLogManager):
+    __test__ = True
+
+    @pytest.fixture(name="captured_log_manager")
+    def captured_log_manager(self, mock_s3_bucket):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield S3ComputeLogManager(
+                bucket=mock_s3_bucket.name,
+                prefix="my_prefix",
+                local_dir=temp_dir,
+                chunked_partial_uploads=True,
+            )
+
+    # for streaming tests
+    @pytest.fixture(name="write_manager")
+    def write_manager(self, mock_s3_bucket):
+        # should be a different local directory as the read manager
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield S3ComputeLogManager(
+                bucket=mock_s3_bucket.name,
+                prefix="my_prefix",
+                local_dir=temp_dir,
+                upload_interval=1,
+                chunked_partial_uploads=True,
+            )
+
+    @pytest.fixture(name="read_manager")
+    def read_manager(self, mock_s3_bucket):
+        # should be a different local directory as the write manager
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield S3ComputeLogManager(
+                bucket=mock_s3_bucket.name,
+                prefix="my_prefix",
+                local_dir=temp_dir,
+                chunked_partial_uploads=True,
+            )
@@ -1,3 +1,6 @@
+import os
+
+import pytest
 from dagster import (
     GraphIn,
     GraphOut,
@@ -15,10 +18,12 @@
     resource,
     with_resources,
 )
+from dagster._check import CheckError
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.test_utils import instance_for_test
 from dagster._legacy import build_assets_job
-from dagster_aws.s3.io_manager import s3_pickle_io_manager
+from dagster_aws.s3 import create_s3_fake_resource
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager, s3_pickle_io_manager
 from dagster_aws.s3.utils import construct_s3_client
 
 
@@ -212,3 +217,102 @@ def asset2() -> None:
 
     for event in handled_output_events:
         assert len(event.event_specific_data.metadata) == 0
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_s3_pickle_io_manager_multipart(mock_s3_bucket, compression):
+    # large enough to be split into several 5MB parts, the minimum part size that S3 accepts
+    large_obj = [os.urandom(1024) for _ in range(12 * 1024)]
+
+    @asset
+    def large_asset():
+        return large_obj
+
+    @asset
+    def downstream_asset(large_asset):
+        assert large_asset == large_obj
+
+    result = materialize(
+        [large_asset, downstream_asset],
+        resources={
+            "io_manager": s3_pickle_io_manager.configured(
+                {
+                    "s3_bucket": mock_s3_bucket.name,
+                    "multipart_threshold": 5 * 1024 * 1024,
+                    "multipart_chunksize": 5 * 1024 * 1024,
+                    "max_concurrency": 4,
+                    "compression": compression,
+                }
+            ),
+            "s3": s3_test_resource,
+        },
+    )
+    assert result.success
+
+    s3_object = mock_s3_bucket.Object("dagster/large_asset")
+    # multipart uploads have an ETag of the form "<md5>-<number of parts>"
+    assert s3_object.e_tag.strip('"').endswith("-3")
+
+    materialization = result.asset_materializations_for_node("large_asset")[0]
+    assert materialization.metadata["size_bytes"].value == s3_object.content_length
+
+
+def test_s3_pickle_io_manager_reads_objects_regardless_of_compression(mock_s3_bucket):
+    s3_client = construct_s3_client(max_attempts=5)
+
+    @asset
+    def asset1():
+        return {"a": 1}
+
+    @asset
+    def asset2(asset1):
+        return asset1
+
+    compressed_io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, s3_client, s3_prefix="dagster", compression="zstd"
+    )
+    assert materialize([asset1], resources={"io_manager": compressed_io_manager}).success
+
+    uncompressed_io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, s3_client, s3_prefix="dagster"
+    )
+    result = materialize(
+        [asset1.to_source_asset(), asset2], resources={"io_manager": uncompressed_io_manager}
+    )
+    assert result.success
+    assert result.output_for_node("asset2") == {"a": 1}
+
+
+def test_s3_pickle_io_manager_with_fake_resource():
+    s3_session = create_s3_fake_resource()
+    s3_session.buckets["test-bucket"] = {}
+
+    @asset
+    def asset1():
+        return [1, 2, 3]
+
+    @asset
+    def asset2(asset1):
+        return asset1 + [4]
+
+    result = materialize(
+        [asset1, asset2],
+        resources={
+            "io_manager": PickledObjectS3IOManager(
+                "test-bucket", s3_session, s3_prefix="dagster", compression="zstd"
+            )
+        },
+    )
+    assert result.success
+    assert result.output_for_node("asset2") == [1, 2, 3, 4]
+    assert set(s3_session.buckets["test-bucket"].keys()) == {"dagster/asset1", "dagster/asset2"}
+
+
+def test_s3_pickle_io_manager_invalid_compression(mock_s3_bucket):
+    with pytest.raises(CheckError):
+        PickledObjectS3IOManager(
+            mock_s3_bucket.name,
+            construct_s3_client(max_attempts=5),
+            s3_prefix="dagster",
+            compression="lz4",
+        )
@@ -43,10 +43,12 @@ def get_version() -> str:
     extras_require={
         "redshift": ["psycopg2-binary"],
         "pyspark": ["dagster-pyspark"],
+        "zstd": ["zstandard"],
         "test": [
             "moto>=2.2.8",
             "requests-mock",
             "xmltodict==0.12.0",  # pinned until moto>=3.1.9 (https://github.com/spulec/moto/issues/5112)
+            "zstandard",
         ],
     },
     zip_safe=False,
@@ -3,7 +3,7 @@
 import dagster._check as check
 import docker
 import docker.errors
-from dagster import Field, IntSource, executor
+from dagster import Field, Float, IntSource, executor
 from dagster._annotations import experimental
 from dagster._core.definitions.executor_definition import multiple_process_executor_requirements
 from dagster._core.events import DagsterEvent, EngineEventData
@@ -43,6 +43,19 @@
                 ),
             ),
             "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+            "step_handler_parallelism": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "Number of threads that start containers for steps and check their health "
+                    "concurrently. By default, containers are started and checked one at a time."
+                ),
+            ),
+            "max_step_launches_per_second": Field(
+                Float,
+                is_required=False,
+                description="Limit on the rate at which containers are started for steps.",
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -82,6 +95,8 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
     retries = check.dict_elem(config, "retries", key_type=str)
     max_concurrent = check.opt_int_elem(config, "max_concurrent")
     tag_concurrency_limits = check.opt_list_elem(config, "tag_concurrency_limits")
+    step_handler_parallelism = check.opt_int_elem(config, "step_handler_parallelism")
+    max_step_launches_per_second = config.get("max_step_launches_per_second")
 
     validate_docker_config(network, networks, container_kwargs)
 
@@ -100,6 +115,8 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
         retries=check.not_none(RetryMode.from_config(retries)),
         max_concurrent=max_concurrent,
         tag_concurrency_limits=tag_concurrency_limits,
+        step_handler_parallelism=step_handler_parallelism,
+        max_step_launches_per_second=max_step_launches_per_second,
     )
 
 
@@ -11,6 +11,7 @@
     MultiPartitionKey,
     MultiPartitionsDefinition,
     Out,
+    SourceAsset,
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     asset,
@@ -126,6 +127,77 @@ def test_loading_columns(tmp_path):
         duckdb_conn.close()
 
 
+@asset(
+    key_prefix=["my_schema"],
+    ins={"b_df": AssetIn("b_df", metadata={"columns": ["a"], "filter": "b > 4"})},
+)
+def b_filtered(b_df: pd.DataFrame) -> pd.DataFrame:
+    assert b_df["a"].tolist() == [2, 3]
+    assert b_df.shape[1] == 1
+    return b_df
+
+
+def test_loading_filter(tmp_path):
+    resource_defs = {
+        "io_manager": duckdb_pandas_io_manager.configured(
+            {"database": os.path.join(tmp_path, "unit_test.duckdb")}
+        ),
+    }
+
+    res = materialize([b_df, b_filtered], resources=resource_defs)
+    assert res.success
+
+
+typed_table = SourceAsset(key=AssetKey(["my_schema", "typed_table"]))
+
+
+@asset(key_prefix=["my_schema"])
+def typed_table_dtypes(typed_table: pd.DataFrame) -> pd.DataFrame:
+    assert typed_table["date_col"].dtype == "datetime64[ns]"
+    assert typed_table["timestamp_col"].dtype == "datetime64[ns]"
+    assert typed_table["decimal_col"].dtype == "float64"
+    assert typed_table["date_col"].tolist() == [pd.Timestamp("2023-01-01")]
+    assert typed_table["timestamp_col"].tolist() == [pd.Timestamp("2023-01-01 01:00:00")]
+    assert typed_table["decimal_col"].tolist() == [1.25]
+    return typed_table
+
+
+def test_loading_column_dtypes(tmp_path):
+    database = os.path.join(tmp_path, "unit_test.duckdb")
+    duckdb_conn = duckdb.connect(database=database)
+    duckdb_conn.execute("create schema my_schema")
+    duckdb_conn.execute(
+        "create table my_schema.typed_table as select DATE '2023-01-01' as date_col, TIMESTAMP"
+        " '2023-01-01 01:00:00' as timestamp_col, 1.25::DECIMAL(10, 2) as decimal_col"
+    )
+    duckdb_conn.close()
+
+    resource_defs = {"io_manager": duckdb_pandas_io_manager.configured({"database": database})}
+
+    res = materialize([typed_table, typed_table_dtypes], resources=resource_defs)
+    assert res.success
+
+
+def test_connection_cache(tmp_path):
+    resource_defs = {
+        "io_manager": duckdb_pandas_io_manager.configured(
+            {"database": os.path.join(tmp_path, "unit_test.duckdb"), "connection_cache": True}
+        ),
+    }
+
+    # materialize asset twice to ensure that the shared connection can be reused across runs
+    for _ in range(2):
+        res = materialize([b_df, b_plus_one], resources=resource_defs)
+        assert res.success
+
+        duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+
+        out_df = duckdb_conn.execute("SELECT * FROM my_schema.b_plus_one").fetch_df()
+        assert out_df["a"].tolist() == [2, 3, 4]
+
+        duckdb_conn.close()
+
+
 @op
 def non_supported_type() -> int:
     return 1
@@ -356,6 +428,73 @@ def test_multi_partitioned_asset(tmp_path):
     duckdb_conn.close()
 
 
+def test_multi_partitioned_asset_all_partitions_input(tmp_path):
+    duckdb_io_manager = duckdb_pandas_io_manager.configured(
+        {"database": os.path.join(tmp_path, "unit_test.duckdb")}
+    )
+    resource_defs = {"io_manager": duckdb_io_manager}
+
+    for time_key, color_key in [("2022-01-01", "red"), ("2022-01-02", "blue")]:
+        materialize(
+            [multi_partitioned],
+            partition_key=MultiPartitionKey({"time": time_key, "color": color_key}),
+            resources=resource_defs,
+            run_config={"ops": {"my_schema__multi_partitioned": {"config": {"value": color_key}}}},
+        )
+
+    @asset(key_prefix=["my_schema"])
+    def downstream(multi_partitioned: pd.DataFrame) -> None:
+        assert sorted(multi_partitioned["a"].tolist()) == ["blue"] * 3 + ["red"] * 3
+
+    result = materialize(
+        [multi_partitioned.to_source_asset(), downstream], resources=resource_defs
+    )
+    assert result.success
+
+
+@asset(
+    partitions_def=StaticPartitionsDefinition(["red", "yellow", "blue"]),
+    key_prefix=["my_schema"],
+    metadata={"partition_expr": "color"},
+    config_schema={"fail": bool},
+)
+def replaced_partition(context) -> pd.DataFrame:
+    partition = context.asset_partition_key_for_output()
+    if context.op_config["fail"]:
+        # doesn't match the existing table's columns, so the insert fails
+        return pd.DataFrame({"color": [partition], "a": [1], "b": [2]})
+    return pd.DataFrame({"color": [partition], "a": [1]})
+
+
+def test_failed_write_keeps_existing_partition(tmp_path):
+    duckdb_io_manager = duckdb_pandas_io_manager.configured(
+        {"database": os.path.join(tmp_path, "unit_test.duckdb")}
+    )
+    resource_defs = {"io_manager": duckdb_io_manager}
+
+    materialize(
+        [replaced_partition],
+        partition_key="red",
+        resources=resource_defs,
+        run_config={"ops": {"my_schema__replaced_partition": {"config": {"fail": False}}}},
+    )
+
+    result = materialize(
+        [replaced_partition],
+        partition_key="red",
+        resources=resource_defs,
+        run_config={"ops": {"my_schema__replaced_partition": {"config": {"fail": True}}}},
+        raise_on_error=False,
+    )
+    assert not result.success
+
+    duckdb_conn = duckdb.connect(database=os.path.join(tmp_path, "unit_test.duckdb"))
+    out_df = duckdb_conn.execute("SELECT * FROM my_schema.replaced_partition").fetch_df()
+    # the delete of the partition was rolled back along with the failed insert
+    assert out_df["color"].tolist() == ["red"]
+    duckdb_conn.close()
+
+
 dynamic_fruits = DynamicPartitionsDefinition(name="dynamic_fruits")
 
 
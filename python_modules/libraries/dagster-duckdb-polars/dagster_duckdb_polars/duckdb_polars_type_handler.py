@@ -1,3 +1,5 @@
+from typing import cast
+
 import polars as pl
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
 from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
@@ -70,7 +72,8 @@ def load_input(
             DuckDbClient.get_select_statement(table_slice=table_slice)
         )
         duckdb_to_arrow = select_statement.arrow()
-        return pl.DataFrame(duckdb_to_arrow)
+        # polars can use the Arrow buffers directly as long as the chunks are not merged
+        return cast(pl.DataFrame, pl.from_arrow(duckdb_to_arrow, rechunk=False))
 
     @property
     def supported_types(self):
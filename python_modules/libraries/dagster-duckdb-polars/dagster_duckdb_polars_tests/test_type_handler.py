@@ -128,6 +128,27 @@ def test_loading_columns(tmp_path):
         duckdb_conn.close()
 
 
+@asset(
+    key_prefix=["my_schema"],
+    ins={"b_df": AssetIn("b_df", metadata={"columns": ["a"], "filter": "b > 4"})},
+)
+def b_filtered(b_df: pl.DataFrame) -> pl.DataFrame:
+    assert b_df["a"].to_list() == [2, 3]
+    assert b_df.shape[1] == 1
+    return b_df
+
+
+def test_loading_filter(tmp_path):
+    resource_defs = {
+        "io_manager": duckdb_polars_io_manager.configured(
+            {"database": os.path.join(tmp_path, "unit_test.duckdb")}
+        ),
+    }
+
+    res = materialize([b_df, b_filtered], resources=resource_defs)
+    assert res.success
+
+
 @op
 def non_supported_type() -> int:
     return 1
@@ -1,5 +1,8 @@
+import atexit
+import os
+import threading
 from contextlib import contextmanager
-from typing import Optional, Sequence, Type, cast
+from typing import Dict, Optional, Sequence, Tuple, Type, cast
 
 import duckdb
 from dagster import Field, IOManagerDefinition, OutputContext, StringSource, io_manager
@@ -15,6 +18,11 @@
 
 DUCKDB_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# connections shared by every DuckDB IO manager in this process that enables "connection_cache",
+# keyed by process id so that forked processes never reuse their parent's connection
+_connection_cache: Dict[Tuple[int, str], duckdb.DuckDBPyConnection] = {}
+_connection_cache_lock = threading.Lock()
+
 
 def build_duckdb_io_manager(
     type_handlers: Sequence[DbTypeHandler], default_load_type: Optional[Type] = None
@@ -76,6 +84,18 @@ def my_table_a(my_table: pd.DataFrame):
             # my_table will just contain the data from column "a"
             ...
 
+    To only load the rows of a table that match a condition, add the metadata "filter" to the In or AssetIn.
+    The filter is a SQL expression that is evaluated by DuckDB, so only the matching rows are read into memory.
+
+    .. code-block:: python
+
+        @asset(
+            ins={"my_table": AssetIn("my_table", metadata={"filter": "a > 10"})}
+        )
+        def my_table_large_a(my_table: pd.DataFrame):
+            # my_table will just contain the rows where column "a" is greater than 10
+            ...
+
     """
 
     @io_manager(
@@ -84,6 +104,17 @@ def my_table_a(my_table: pd.DataFrame):
             "schema": Field(
                 StringSource, description="Name of the schema to use.", is_required=False
             ),
+            "connection_cache": Field(
+                bool,
+                default_value=False,
+                description=(
+                    "Whether to share a single connection to the database between all steps that"
+                    " run in the same process, instead of connecting for every input and output."
+                    " The process holds the database's write lock for as long as it keeps the"
+                    " connection open, so this should not be enabled if other processes need to"
+                    " write to the database at the same time."
+                ),
+            ),
         }
     )
     def duckdb_io_manager(init_context):
@@ -122,27 +153,75 @@ def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connec
     @staticmethod
     def get_select_statement(table_slice: TableSlice) -> str:
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
+        query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"
 
+        where_clauses = []
         if table_slice.partition_dimensions and len(table_slice.partition_dimensions) > 0:
-            query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table} WHERE\n"
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+            where_clauses.append(_partition_where_clause(table_slice.partition_dimensions))
+        if table_slice.filter:
+            where_clauses.append(f"({table_slice.filter})")
+
+        if where_clauses:
+            return query + " WHERE\n" + " AND\n".join(where_clauses)
         else:
-            return f"""SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"""
+            return query
 
     @staticmethod
     @contextmanager
     def connect(context, _):
-        conn = backoff(
-            fn=duckdb.connect,
-            retry_on=(RuntimeError, duckdb.IOException),
-            kwargs={"database": context.resource_config["database"], "read_only": False},
-            max_retries=10,
-        )
+        database = context.resource_config["database"]
+        if context.resource_config.get("connection_cache"):
+            # each cursor is an independent connection to the shared database instance, so
+            # concurrent users don't interfere with each other's transactions
+            conn = _get_cached_connection(database).cursor()
+        else:
+            conn = _connect(database)
 
         yield conn
 
         conn.close()
 
+    @staticmethod
+    @contextmanager
+    def transaction(context: OutputContext, table_slice: TableSlice, connection):
+        # replace the table slice atomically, so that readers never see it partially written and a
+        # failed write leaves the previous data in place
+        connection.begin()
+        try:
+            yield
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
+
+
+def _connect(database: str) -> duckdb.DuckDBPyConnection:
+    return backoff(
+        fn=duckdb.connect,
+        retry_on=(RuntimeError, duckdb.IOException),
+        kwargs={"database": database, "read_only": False},
+        max_retries=10,
+    )
+
+
+def _get_cached_connection(database: str) -> duckdb.DuckDBPyConnection:
+    key = (os.getpid(), database)
+    with _connection_cache_lock:
+        conn = _connection_cache.get(key)
+        if conn is None:
+            conn = _connect(database)
+            _connection_cache[key] = conn
+        return conn
+
+
+@atexit.register
+def _close_cached_connections() -> None:
+    with _connection_cache_lock:
+        for (pid, _), conn in _connection_cache.items():
+            if pid == os.getpid():
+                conn.close()
+        _connection_cache.clear()
+
 
 def _get_cleanup_statement(table_slice: TableSlice) -> str:
     """Returns a SQL statement that deletes data in the given table to make way for the output data
@@ -79,6 +79,31 @@ def test_get_select_statement_multiple_static_partitions():
     )
 
 
+def test_get_select_statement_filter():
+    assert (
+        DuckDbClient.get_select_statement(
+            TableSlice(schema="schema1", table="table1", columns=["apple"], filter="apple > 1")
+        )
+        == "SELECT apple FROM schema1.table1 WHERE\n(apple > 1)"
+    )
+
+
+def test_get_select_statement_partitioned_filter():
+    assert (
+        DuckDbClient.get_select_statement(
+            TableSlice(
+                schema="schema1",
+                table="table1",
+                partition_dimensions=[
+                    TablePartitionDimension(partition_expr="my_fruit_col", partitions=["apple"])
+                ],
+                filter="a > 1 OR b < 2",
+            )
+        )
+        == "SELECT * FROM schema1.table1 WHERE\nmy_fruit_col in ('apple') AND\n(a > 1 OR b < 2)"
+    )
+
+
 def test_get_select_statement_multi_partitioned():
     assert (
         DuckDbClient.get_select_statement(
@@ -212,15 +212,21 @@ def delete_table_slice(context: OutputContext, table_slice: TableSlice, connecti
     @staticmethod
     def get_select_statement(table_slice: TableSlice) -> str:
         col_str = ", ".join(table_slice.columns) if table_slice.columns else "*"
+        query = (
+            f"SELECT {col_str} FROM"
+            f" `{table_slice.database}.{table_slice.schema}.{table_slice.table}`"
+        )
 
+        where_clauses = []
         if table_slice.partition_dimensions and len(table_slice.partition_dimensions) > 0:
-            query = (
-                f"SELECT {col_str} FROM"
-                f" `{table_slice.database}.{table_slice.schema}.{table_slice.table}` WHERE\n"
-            )
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+            where_clauses.append(_partition_where_clause(table_slice.partition_dimensions))
+        if table_slice.filter:
+            where_clauses.append(f"({table_slice.filter})")
+
+        if where_clauses:
+            return query + " WHERE\n" + " AND\n".join(where_clauses)
         else:
-            return f"""SELECT {col_str} FROM `{table_slice.database}.{table_slice.schema}.{table_slice.table}`"""
+            return query
 
     @staticmethod
     def ensure_schema_exists(context: OutputContext, table_slice: TableSlice, connection) -> None:
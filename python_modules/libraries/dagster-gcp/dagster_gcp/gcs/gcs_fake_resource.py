@@ -1,4 +1,4 @@
-from typing import AbstractSet, Dict, Optional, Union
+from typing import IO, AbstractSet, Dict, Optional, Union
 
 
 class FakeGCSBlob:
@@ -7,9 +7,17 @@ def __init__(self, name: str, bucket: "FakeGCSBucket"):
 
         self.name = name
         self.data = b""
+        self.generation = 0
         self.bucket = bucket
         self.mock_extras = mock.MagicMock()
 
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def reload(self, *args, **kwargs):
+        self.mock_extras.reload(*args, **kwargs)
+
     def exists(self, *args, **kwargs):
         self.mock_extras.exists(*args, **kwargs)
         return True
@@ -18,9 +26,12 @@ def delete(self, *args, **kwargs):
         self.mock_extras.delete(*args, **kwargs)
         del self.bucket.blobs[self.name]
 
-    def download_as_bytes(self, *args, **kwargs):
-        self.mock_extras.download_as_bytes(*args, **kwargs)
-        return self.data
+    def download_as_bytes(
+        self, *args, start: Optional[int] = None, end: Optional[int] = None, **kwargs
+    ):
+        self.mock_extras.download_as_bytes(*args, start=start, end=end, **kwargs)
+        # like the real client, `end` is inclusive
+        return self.data[start : (end + 1 if end is not None else None)]
 
     def upload_from_string(self, data: Union[bytes, str], *args, **kwargs):
         self.mock_extras.upload_from_string(*args, **kwargs)
@@ -28,6 +39,14 @@ def upload_from_string(self, data: Union[bytes, str], *args, **kwargs):
             self.data = data.encode()
         else:
             self.data = data
+        self.generation += 1
+
+    def upload_from_file(self, file_obj: IO[bytes], *args, rewind: bool = False, **kwargs):
+        self.mock_extras.upload_from_file(*args, rewind=rewind, **kwargs)
+        if rewind:
+            file_obj.seek(0)
+        self.data = file_obj.read()
+        self.generation += 1
 
 
 class FakeGCSBucket:
@@ -1,30 +1,76 @@
-import pickle
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Optional, Union
 
 from dagster import (
     Field,
     InputContext,
+    IntSource,
     IOManager,
+    Noneable,
     OutputContext,
     StringSource,
     _check as check,
     io_manager,
 )
-from dagster._utils import PICKLE_PROTOCOL
 from dagster._utils.backoff import backoff
+from dagster._utils.pickling import (
+    check_compression,
+    dump_pickled_object,
+    load_pickled_object,
+    spooled_temporary_file,
+)
 from google.api_core.exceptions import Forbidden, ServiceUnavailable, TooManyRequests
 from google.cloud import storage
 
 DEFAULT_LEASE_DURATION = 60  # One minute
 
+MB = 1024 * 1024
+
+# GCS requires resumable upload chunk sizes to be a multiple of 256KB
+DEFAULT_CHUNK_SIZE = 8 * MB
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 class PickledObjectGCSIOManager(IOManager):
-    def __init__(self, bucket, client=None, prefix="dagster"):
+    """IO manager that pickles objects to GCS.
+
+    Objects are pickled into a spooled temporary file rather than an in-memory bytes object and
+    uploaded with a chunked resumable upload. Objects larger than ``chunk_size`` are downloaded
+    with concurrent ranged requests.
+
+    Args:
+        bucket (str): the GCS bucket to store objects in.
+        client (Optional[google.cloud.storage.Client]): the GCS client to use.
+        prefix (str): key prefix under which objects are stored.
+        chunk_size (int): size in bytes of each upload chunk and download range. Must be a
+            multiple of 256KB.
+        max_concurrency (int): maximum number of ranges downloaded concurrently.
+        compression (Optional[str]): compress pickled objects with the given codec. Only
+            ``"zstd"`` is supported. Objects are decompressed on load regardless of this setting.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        client=None,
+        prefix="dagster",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compression: Optional[str] = None,
+    ):
         self.bucket = check.str_param(bucket, "bucket")
         self.client = client or storage.Client()
         self.bucket_obj = self.client.bucket(bucket)
         check.invariant(self.bucket_obj.exists())
         self.prefix = check.str_param(prefix, "prefix")
+        self.chunk_size = check.int_param(chunk_size, "chunk_size")
+        check.param_invariant(
+            self.chunk_size > 0 and self.chunk_size % (256 * 1024) == 0,
+            "chunk_size",
+            "must be a positive multiple of 256KB",
+        )
+        self.max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        self.compression = check_compression(compression)
 
     def _get_path(self, context: Union[InputContext, OutputContext]) -> str:
         if context.has_asset_key:
@@ -55,6 +101,33 @@ def _uri_for_key(self, key):
         check.str_param(key, "key")
         return "gs://" + self.bucket + "/" + f"{key}"
 
+    def _download_to_file(self, key: str, file: IO[bytes]) -> None:
+        blob = self.bucket_obj.blob(key)
+        blob.reload()
+        size = blob.size
+        generation = blob.generation
+
+        if size <= self.chunk_size:
+            file.write(blob.download_as_bytes())
+            return
+
+        # end offsets are inclusive. Pinning the generation makes the download fail rather than
+        # mix ranges of two objects if the blob is overwritten mid-download.
+        ranges = [
+            (start, min(start + self.chunk_size, size) - 1)
+            for start in range(0, size, self.chunk_size)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="gcs_io_manager"
+        ) as executor:
+            for chunk in executor.map(
+                lambda byte_range: blob.download_as_bytes(
+                    start=byte_range[0], end=byte_range[1], if_generation_match=generation
+                ),
+                ranges,
+            ):
+                file.write(chunk)
+
     def load_input(self, context):
         if context.dagster_type.typing_type == type(None):
             return None
@@ -62,8 +135,9 @@ def load_input(self, context):
         key = self._get_path(context)
         context.log.debug(f"Loading GCS object from: {self._uri_for_key(key)}")
 
-        bytes_obj = self.bucket_obj.blob(key).download_as_bytes()
-        obj = pickle.loads(bytes_obj)
+        with spooled_temporary_file() as file:
+            self._download_to_file(key, file)
+            obj = load_pickled_object(file)
 
         return obj
 
@@ -85,19 +159,47 @@ def handle_output(self, context, obj):
             context.log.warning(f"Removing existing GCS key: {key}")
             self._rm_object(key)
 
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
+        with spooled_temporary_file() as file:
+            dump_pickled_object(obj, file, self.compression)
+            file.seek(0)
 
-        backoff(
-            self.bucket_obj.blob(key).upload_from_string,
-            args=[pickled_obj],
-            retry_on=(TooManyRequests, Forbidden, ServiceUnavailable),
-        )
+            # setting a chunk size makes the client stream the file with a resumable upload
+            backoff(
+                self.bucket_obj.blob(key, chunk_size=self.chunk_size).upload_from_file,
+                args=[file],
+                kwargs={"rewind": True},
+                retry_on=(TooManyRequests, Forbidden, ServiceUnavailable),
+            )
 
 
 @io_manager(
     config_schema={
         "gcs_bucket": Field(StringSource),
         "gcs_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+        "chunk_size": Field(
+            IntSource,
+            is_required=False,
+            default_value=DEFAULT_CHUNK_SIZE,
+            description=(
+                "Size in bytes of each upload chunk and download range. Must be a multiple of"
+                " 256KB."
+            ),
+        ),
+        "max_concurrency": Field(
+            IntSource,
+            is_required=False,
+            default_value=DEFAULT_MAX_CONCURRENCY,
+            description="Maximum number of ranges downloaded concurrently.",
+        ),
+        "compression": Field(
+            Noneable(StringSource),
+            is_required=False,
+            default_value=None,
+            description=(
+                "Compress pickled objects before upload. Only 'zstd' is supported, which requires"
+                " the zstandard package."
+            ),
+        ),
     },
     required_resource_keys={"gcs"},
 )
@@ -171,5 +273,8 @@ def my_job():
         init_context.resource_config["gcs_bucket"],
         client,
         init_context.resource_config["gcs_prefix"],
+        chunk_size=init_context.resource_config["chunk_size"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+        compression=init_context.resource_config["compression"],
     )
     return pickled_io_manager
@@ -1,3 +1,6 @@
+import os
+
+import pytest
 from dagster import (
     AssetsDefinition,
     DagsterInstance,
@@ -20,6 +23,7 @@
     resource,
     with_resources,
 )
+from dagster._check import CheckError
 from dagster._core.definitions.pipeline_base import InMemoryPipeline
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import execute_plan
@@ -243,3 +247,70 @@ def asset2() -> None:
 
     for event in handled_output_events:
         assert len(event.event_specific_data.metadata) == 0
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_gcs_pickle_io_manager_chunked_transfer(gcs_bucket, compression):
+    large_obj = [os.urandom(1024) for _ in range(1024)]
+
+    @asset
+    def large_asset():
+        return large_obj
+
+    @asset
+    def downstream_asset(large_asset):
+        assert large_asset == large_obj
+
+    fake_gcs_client = FakeGCSClient()
+    result = materialize(
+        [large_asset, downstream_asset],
+        resources={
+            "io_manager": gcs_pickle_io_manager.configured(
+                {
+                    "gcs_bucket": gcs_bucket,
+                    "chunk_size": 256 * 1024,
+                    "max_concurrency": 4,
+                    "compression": compression,
+                }
+            ),
+            "gcs": ResourceDefinition.hardcoded_resource(fake_gcs_client),
+        },
+    )
+    assert result.success
+
+    bucket = fake_gcs_client.bucket(gcs_bucket)
+    bucket.mock_extras.blob.assert_any_call(chunk_size=256 * 1024)
+    blob = bucket.blob("dagster/large_asset")
+    # ~1MB object read in 256KB ranges
+    num_ranges = -(-blob.size // (256 * 1024))
+    assert num_ranges > 1
+    assert blob.mock_extras.download_as_bytes.call_count == num_ranges
+
+
+def test_gcs_pickle_io_manager_reads_objects_regardless_of_compression(gcs_bucket):
+    fake_gcs_client = FakeGCSClient()
+
+    @asset
+    def asset1():
+        return {"a": 1}
+
+    @asset
+    def asset2(asset1):
+        return asset1
+
+    compressed_io_manager = PickledObjectGCSIOManager(
+        gcs_bucket, fake_gcs_client, compression="zstd"
+    )
+    assert materialize([asset1], resources={"io_manager": compressed_io_manager}).success
+
+    uncompressed_io_manager = PickledObjectGCSIOManager(gcs_bucket, fake_gcs_client)
+    result = materialize(
+        [asset1.to_source_asset(), asset2], resources={"io_manager": uncompressed_io_manager}
+    )
+    assert result.success
+    assert result.output_for_node("asset2") == {"a": 1}
+
+
+def test_gcs_pickle_io_manager_invalid_chunk_size(gcs_bucket):
+    with pytest.raises(CheckError):
+        PickledObjectGCSIOManager(gcs_bucket, FakeGCSClient(), chunk_size=1000)
@@ -43,6 +43,6 @@ def get_version() -> str:
         "oauth2client",
     ],
     # we need `pyarrow` for testing read/write parquet files.
-    extras_require={"pyarrow": ["pyarrow"]},
+    extras_require={"pyarrow": ["pyarrow"], "zstd": ["zstandard"]},
     zip_safe=False,
 )
@@ -1,8 +1,9 @@
 import logging
 import sys
+import threading
 import time
 from enum import Enum
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Dict, Optional, Tuple, TypeVar
 
 import kubernetes.client
 import kubernetes.client.rest
@@ -13,6 +14,8 @@
 from dagster._core.storage.pipeline_run import DagsterRunStatus
 from kubernetes.client.models import V1JobStatus
 
+from .job_status_watcher import K8sJobStatusWatcher
+
 T = TypeVar("T")
 
 DEFAULT_WAIT_TIMEOUT = 86400.0  # 1 day
@@ -136,12 +139,16 @@ class KubernetesWaitingReasons:
 
 
 class DagsterKubernetesClient:
-    def __init__(self, batch_api, core_api, logger, sleeper, timer):
+    def __init__(self, batch_api, core_api, logger, sleeper, timer, watch_fn=None):
         self.batch_api = batch_api
         self.core_api = core_api
         self.logger = logger
         self.sleeper = sleeper
         self.timer = timer
+        self.watch_fn = watch_fn
+
+        self._job_status_watchers: Dict[Tuple[str, str], K8sJobStatusWatcher] = {}
+        self._job_status_watchers_lock = threading.Lock()
 
     @staticmethod
     def production_client(batch_api_override=None):
@@ -363,6 +370,55 @@ def _get_job_status():
 
         return k8s_api_retry(_get_job_status, max_retries=3, timeout=wait_time_between_attempts)
 
+    def _get_job_status_watcher(self, namespace: str, label_selector: str) -> K8sJobStatusWatcher:
+        key = (namespace, label_selector)
+        with self._job_status_watchers_lock:
+            watcher = self._job_status_watchers.get(key)
+            if not watcher or watcher.is_stopped:
+                watcher = K8sJobStatusWatcher(
+                    batch_api=self.batch_api,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    logger=self.logger,
+                    watch_fn=self.watch_fn,
+                    timer=self.timer,
+                ).start()
+                self._job_status_watchers[key] = watcher
+            return watcher
+
+    def get_watched_job_status(
+        self,
+        job_name: str,
+        namespace: str,
+        label_selector: str,
+        wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+    ) -> V1JobStatus:
+        """Returns the status of a job from a watch that is shared by every job in the namespace
+        that matches the label selector, instead of reading the job from the API server.
+
+        The job is read from the API server while the watch is not in sync, or if the watch has not
+        seen the job yet.
+        """
+        check.str_param(job_name, "job_name")
+        check.str_param(namespace, "namespace")
+        check.str_param(label_selector, "label_selector")
+
+        status = self._get_job_status_watcher(namespace, label_selector).get_job_status(job_name)
+        if status is not None:
+            return status
+
+        return self.get_job_status(
+            job_name=job_name,
+            namespace=namespace,
+            wait_time_between_attempts=wait_time_between_attempts,
+        )
+
+    def stop_watching_jobs(self) -> None:
+        with self._job_status_watchers_lock:
+            for watcher in self._job_status_watchers.values():
+                watcher.stop()
+            self._job_status_watchers = {}
+
     def delete_job(
         self,
         job_name,
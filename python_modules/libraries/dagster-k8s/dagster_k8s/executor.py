@@ -3,6 +3,7 @@
 import kubernetes.config
 from dagster import (
     Field,
+    Float,
     IntSource,
     StringSource,
     _check as check,
@@ -31,6 +32,7 @@
 from .job import (
     DagsterK8sJobConfig,
     construct_dagster_k8s_job,
+    get_job_label_selector,
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
@@ -49,6 +51,19 @@
             ),
         ),
         "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+        "step_handler_parallelism": Field(
+            IntSource,
+            is_required=False,
+            description=(
+                "Number of threads that launch Kubernetes jobs for steps and check their health "
+                "concurrently. By default, jobs are launched and checked one at a time."
+            ),
+        ),
+        "max_step_launches_per_second": Field(
+            Float,
+            is_required=False,
+            description="Limit on the rate at which Kubernetes jobs are launched for steps.",
+        ),
     },
 )
 
@@ -83,11 +98,16 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             env_vars: ...
             job_image: ... # leave out if using userDeployments
             max_concurrent: ...
+            step_handler_parallelism: ...
 
     `max_concurrent` limits the number of pods that will execute concurrently for one run. By default
     there is no limit- it will maximally parallel as allowed by the DAG. Note that this is not a
     global limit.
 
+    `step_handler_parallelism` sets the number of Kubernetes jobs that are launched, or whose
+    health is checked, concurrently. Raising it speeds up runs that fan out to many steps at once,
+    while `max_step_launches_per_second` keeps the launches from overwhelming the Kubernetes API.
+
     Configuration set on the Kubernetes Jobs and Pods created by the `K8sRunLauncher` will also be
     set on Kubernetes Jobs and Pods created by the `k8s_job_executor`.
 
@@ -131,6 +151,8 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
         max_concurrent=check.opt_int_elem(exc_cfg, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(exc_cfg, "tag_concurrency_limits"),
         should_verify_step=True,
+        step_handler_parallelism=check.opt_int_elem(exc_cfg, "step_handler_parallelism"),
+        max_step_launches_per_second=exc_cfg.get("max_step_launches_per_second"),  # type: ignore
     )
 
 
@@ -273,9 +295,13 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
 
         container_context = self._get_container_context(step_handler_context)
 
-        status = self._api_client.get_job_status(
+        status = self._api_client.get_watched_job_status(
             namespace=container_context.namespace,
             job_name=job_name,
+            label_selector=get_job_label_selector(
+                "step_worker",
+                {"dagster/run-id": step_handler_context.execute_step_args.pipeline_run_id},
+            ),
         )
         if status.failed:
             return CheckStepHealthResult.unhealthy(
@@ -211,6 +211,18 @@ def get_job_name_from_run_id(run_id, resume_attempt_number=None):
     )
 
 
+def get_job_label_selector(component: str, labels: Optional[Mapping[str, str]] = None) -> str:
+    """Returns a label selector that matches the jobs of a component that
+    construct_dagster_k8s_job created with the given labels.
+    """
+    selector = {
+        "app.kubernetes.io/part-of": "dagster",
+        "app.kubernetes.io/component": component,
+        **{k: sanitize_k8s_label(v) for k, v in (labels or {}).items()},
+    }
+    return ",".join(f"{k}={v}" for k, v in selector.items())
+
+
 @whitelist_for_serdes
 class DagsterK8sJobConfig(
     namedtuple(
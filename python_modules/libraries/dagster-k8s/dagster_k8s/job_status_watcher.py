@@ -0,0 +1,168 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import kubernetes.client
+import kubernetes.watch
+from dagster import _check as check
+from kubernetes.client.models import V1JobStatus
+
+DEFAULT_WATCH_TIMEOUT_SECONDS = 60
+DEFAULT_WATCH_RETRY_INTERVAL = 10.0  # 10 seconds
+DEFAULT_WATCH_IDLE_TIMEOUT = 600.0  # 10 minutes
+
+# The resource version that a watch resumed from is too old for the API server to serve
+GONE_STATUS_CODE = 410
+
+
+class K8sJobStatusWatcher:
+    """Keeps the statuses of the Kubernetes jobs that match a label selector in memory.
+
+    The watcher lists the matching jobs once, and then watches them from the resource version of
+    that list, so that reading the status of any number of jobs does not call the API server. If
+    the watch fails, or resumes from a resource version that is too old, the jobs are listed again.
+
+    Statuses are only returned while the watcher is in sync with the API server. Callers are
+    expected to read a job from the API server when get_job_status returns None, which is also the
+    case for jobs that were created after the watcher last heard from the API server.
+
+    The watcher stops itself once its statuses have not been read for idle_timeout seconds.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        namespace: str,
+        label_selector: str,
+        logger: Callable[[str], None],
+        watch_fn: Optional[Callable[[], kubernetes.watch.Watch]] = None,
+        timer: Callable[[], float] = time.time,
+        idle_timeout: float = DEFAULT_WATCH_IDLE_TIMEOUT,
+        watch_timeout_seconds: int = DEFAULT_WATCH_TIMEOUT_SECONDS,
+        retry_interval: float = DEFAULT_WATCH_RETRY_INTERVAL,
+    ):
+        self._batch_api = batch_api
+        self._namespace = check.str_param(namespace, "namespace")
+        self._label_selector = check.str_param(label_selector, "label_selector")
+        self._logger = logger
+        self._watch_fn = watch_fn or kubernetes.watch.Watch
+        self._timer = timer
+        self._idle_timeout = check.numeric_param(idle_timeout, "idle_timeout")
+        self._watch_timeout_seconds = check.int_param(
+            watch_timeout_seconds, "watch_timeout_seconds"
+        )
+        self._retry_interval = check.numeric_param(retry_interval, "retry_interval")
+
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, V1JobStatus] = {}
+        self._resource_version: Optional[str] = None
+        self._synced = False
+        self._last_read_time = self._timer()
+
+        self._shutdown_event = threading.Event()
+        self._watch: Optional[kubernetes.watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "K8sJobStatusWatcher":
+        self._thread = threading.Thread(
+            target=self._run, name="k8s-job-status-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._shutdown_event.set()
+        watch = self._watch
+        if watch:
+            watch.stop()
+
+    @property
+    def is_stopped(self) -> bool:
+        return self._shutdown_event.is_set()
+
+    @property
+    def is_synced(self) -> bool:
+        with self._lock:
+            return self._synced
+
+    def get_job_status(self, job_name: str) -> Optional[V1JobStatus]:
+        """Returns the last known status of the job, or None if it is not known."""
+        with self._lock:
+            self._last_read_time = self._timer()
+            if not self._synced:
+                return None
+            return self._statuses.get(job_name)
+
+    def _is_idle(self) -> bool:
+        with self._lock:
+            return self._timer() - self._last_read_time > self._idle_timeout
+
+    def _run(self) -> None:
+        while not self._shutdown_event.is_set():
+            if self._is_idle():
+                self._logger(
+                    f"Stopping idle watch of Kubernetes jobs matching {self._label_selector}"
+                )
+                self._shutdown_event.set()
+                break
+
+            try:
+                if not self.is_synced:
+                    self._list_jobs()
+                self._watch_jobs()
+            except kubernetes.client.rest.ApiException as e:
+                with self._lock:
+                    self._synced = False
+                if e.status != GONE_STATUS_CODE:
+                    self._logger(f"Error watching Kubernetes jobs, retrying: {e}")
+                    self._shutdown_event.wait(self._retry_interval)
+            except Exception as e:
+                with self._lock:
+                    self._synced = False
+                self._logger(f"Error watching Kubernetes jobs, retrying: {e}")
+                self._shutdown_event.wait(self._retry_interval)
+
+    def _list_jobs(self) -> None:
+        jobs = self._batch_api.list_namespaced_job(
+            namespace=self._namespace, label_selector=self._label_selector
+        )
+        with self._lock:
+            self._statuses = {job.metadata.name: job.status for job in jobs.items}
+            self._resource_version = jobs.metadata.resource_version
+            self._synced = True
+
+    def _watch_jobs(self) -> None:
+        watch = self._watch_fn()
+        self._watch = watch
+        try:
+            # the stream ends after watch_timeout_seconds, so that the idle timeout is checked
+            for event in watch.stream(
+                self._batch_api.list_namespaced_job,
+                namespace=self._namespace,
+                label_selector=self._label_selector,
+                resource_version=self._resource_version,
+                timeout_seconds=self._watch_timeout_seconds,
+                allow_watch_bookmarks=True,
+            ):
+                if self._shutdown_event.is_set():
+                    return
+                self._handle_event(event)
+        finally:
+            watch.stop()
+            self._watch = None
+
+    def _handle_event(self, event) -> None:
+        event_type = event["type"]
+        if event_type == "ERROR":
+            raw_object = event.get("raw_object") or {}
+            raise kubernetes.client.rest.ApiException(
+                status=raw_object.get("code"), reason=raw_object.get("message")
+            )
+
+        job = event["object"]
+        with self._lock:
+            if event_type in ("ADDED", "MODIFIED"):
+                self._statuses[job.metadata.name] = job.status
+            elif event_type == "DELETED":
+                self._statuses.pop(job.metadata.name, None)
+            self._resource_version = job.metadata.resource_version
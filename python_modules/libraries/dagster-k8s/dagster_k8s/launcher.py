@@ -17,7 +17,12 @@
 
 from .client import DagsterKubernetesClient
 from .container_context import K8sContainerContext
-from .job import DagsterK8sJobConfig, construct_dagster_k8s_job, get_job_name_from_run_id
+from .job import (
+    DagsterK8sJobConfig,
+    construct_dagster_k8s_job,
+    get_job_label_selector,
+    get_job_name_from_run_id,
+)
 
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
@@ -373,9 +378,12 @@ def check_run_worker_health(self, run: DagsterRun):
 
         job_name = get_job_name_from_run_id(run.run_id, resume_attempt_number=resume_attempt_number)
         try:
-            status = self._api_client.get_job_status(
+            # the run monitoring daemon checks every in-progress run, so the statuses of run
+            # worker jobs are read from a shared watch rather than from the API server
+            status = self._api_client.get_watched_job_status(
                 namespace=container_context.namespace,
                 job_name=job_name,
+                label_selector=get_job_label_selector("run_worker"),
             )
         except Exception:
             return CheckRunHealthResult(
@@ -401,3 +409,6 @@ def check_run_worker_health(self, run: DagsterRun):
         if status.succeeded:
             return CheckRunHealthResult(WorkerStatus.SUCCESS)
         return CheckRunHealthResult(WorkerStatus.RUNNING)
+
+    def dispose(self):
+        self._api_client.stop_watching_jobs()
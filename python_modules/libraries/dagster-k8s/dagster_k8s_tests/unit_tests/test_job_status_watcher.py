@@ -0,0 +1,176 @@
+import itertools
+import queue
+import time
+from unittest import mock
+
+import kubernetes
+from dagster_k8s.client import DagsterKubernetesClient
+from dagster_k8s.job import get_job_label_selector
+from dagster_k8s.job_status_watcher import K8sJobStatusWatcher
+from kubernetes.client.models import V1Job, V1JobList, V1JobStatus, V1ListMeta, V1ObjectMeta
+
+NAMESPACE = "a_namespace"
+LABEL_SELECTOR = "app.kubernetes.io/component=run_worker"
+
+
+def _job(name, resource_version, **status):
+    return V1Job(
+        metadata=V1ObjectMeta(name=name, resource_version=resource_version),
+        status=V1JobStatus(**status),
+    )
+
+
+def _job_list(resource_version, jobs):
+    return V1JobList(metadata=V1ListMeta(resource_version=resource_version), items=jobs)
+
+
+class FakeWatch:
+    """Stands in for kubernetes.watch.Watch, streaming the events that the test sends it."""
+
+    _END_STREAM = object()
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.stream_kwargs = []
+        self._stopped = False
+
+    def __call__(self):
+        return self
+
+    def stream(self, _func, **kwargs):
+        self._stopped = False
+        self.stream_kwargs.append(kwargs)
+        while not self._stopped:
+            try:
+                event = self.events.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            if event is self._END_STREAM:
+                return
+            yield event
+
+    def send(self, event_type, job):
+        self.events.put({"type": event_type, "object": job})
+
+    def send_error(self, code):
+        self.events.put({"type": "ERROR", "raw_object": {"code": code, "message": "error"}})
+
+    def end_stream(self):
+        self.events.put(self._END_STREAM)
+
+    def stop(self):
+        self._stopped = True
+
+
+def _wait_for(condition, timeout=10):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, "Timed out waiting for condition"
+        time.sleep(0.01)
+
+
+def _create_watcher(batch_api, watch, **kwargs):
+    return K8sJobStatusWatcher(
+        batch_api=batch_api,
+        namespace=NAMESPACE,
+        label_selector=LABEL_SELECTOR,
+        logger=mock.MagicMock(),
+        watch_fn=watch,
+        retry_interval=0,
+        **kwargs,
+    ).start()
+
+
+def test_watcher_tracks_job_statuses():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.return_value = _job_list("1", [_job("a_job", "1", active=1)])
+    watch = FakeWatch()
+
+    watcher = _create_watcher(batch_api, watch)
+    try:
+        _wait_for(lambda: watcher.is_synced)
+        assert watcher.get_job_status("a_job").active == 1
+        assert watcher.get_job_status("other_job") is None
+
+        batch_api.list_namespaced_job.assert_called_once_with(
+            namespace=NAMESPACE, label_selector=LABEL_SELECTOR
+        )
+
+        watch.send("MODIFIED", _job("a_job", "2", succeeded=1))
+        watch.send("ADDED", _job("other_job", "3", failed=1))
+        _wait_for(lambda: watcher.get_job_status("other_job") is not None)
+        assert watcher.get_job_status("a_job").succeeded == 1
+        assert watcher.get_job_status("other_job").failed == 1
+
+        watch.send("DELETED", _job("a_job", "4"))
+        _wait_for(lambda: watcher.get_job_status("a_job") is None)
+
+        # the watch resumes from the last resource version that it saw
+        watch.send("BOOKMARK", V1Job(metadata=V1ObjectMeta(resource_version="5")))
+        watch.end_stream()
+        _wait_for(lambda: len(watch.stream_kwargs) == 2)
+        assert watch.stream_kwargs[0]["resource_version"] == "1"
+        assert watch.stream_kwargs[1]["resource_version"] == "5"
+        assert batch_api.list_namespaced_job.call_count == 1
+    finally:
+        watcher.stop()
+
+
+def test_watcher_relists_when_resource_version_is_gone():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.side_effect = [
+        _job_list("1", [_job("a_job", "1", active=1)]),
+        _job_list("10", [_job("a_job", "10", succeeded=1)]),
+    ]
+    watch = FakeWatch()
+
+    watcher = _create_watcher(batch_api, watch)
+    try:
+        _wait_for(lambda: watcher.is_synced)
+        watch.send_error(410)
+        _wait_for(lambda: batch_api.list_namespaced_job.call_count == 2)
+        _wait_for(lambda: watcher.is_synced)
+        assert watcher.get_job_status("a_job").succeeded == 1
+        _wait_for(lambda: len(watch.stream_kwargs) == 2)
+        assert watch.stream_kwargs[1]["resource_version"] == "10"
+    finally:
+        watcher.stop()
+
+
+def test_watcher_stops_when_idle():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.return_value = _job_list("1", [])
+    watch = FakeWatch()
+
+    watcher = _create_watcher(batch_api, watch, timer=itertools.count().__next__, idle_timeout=0)
+    _wait_for(lambda: watcher.is_stopped)
+
+
+def test_get_watched_job_status_falls_back_to_api():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.side_effect = kubernetes.client.rest.ApiException(status=403)
+    batch_api.read_namespaced_job_status.return_value = _job("a_job", "1", failed=1)
+
+    client = DagsterKubernetesClient(
+        batch_api=batch_api,
+        core_api=mock.MagicMock(),
+        logger=mock.MagicMock(),
+        sleeper=mock.MagicMock(),
+        timer=time.time,
+        watch_fn=FakeWatch(),
+    )
+    try:
+        label_selector = get_job_label_selector("run_worker")
+        status = client.get_watched_job_status("a_job", NAMESPACE, label_selector)
+        assert status.failed == 1
+        batch_api.read_namespaced_job_status.assert_called_once_with("a_job", namespace=NAMESPACE)
+    finally:
+        client.stop_watching_jobs()
+
+
+def test_get_job_label_selector():
+    assert (
+        get_job_label_selector("step_worker", {"dagster/run-id": "abc"})
+        == "app.kubernetes.io/part-of=dagster,app.kubernetes.io/component=step_worker,"
+        "dagster/run-id=abc"
+    )
@@ -0,0 +1,9 @@
+from dagster._core.libraries import DagsterLibraryRegistry
+
+from .io_manager import (
+    PyArrowParquetIOManager as PyArrowParquetIOManager,
+    pyarrow_parquet_io_manager as pyarrow_parquet_io_manager,
+)
+from .version import __version__
+
+DagsterLibraryRegistry.register("dagster-pyarrow", __version__)
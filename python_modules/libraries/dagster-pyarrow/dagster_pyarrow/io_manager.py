@@ -0,0 +1,166 @@
+from typing import Dict, Optional, Sequence, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dagster import (
+    Field,
+    InitResourceContext,
+    InputContext,
+    MetadataValue,
+    OutputContext,
+    StringSource,
+    _check as check,
+    io_manager,
+)
+from dagster._core.storage.upath_io_manager import UPathIOManager
+from upath import UPath
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def _get_local_path(path: UPath) -> Optional[str]:
+    """Returns the path as a local filesystem path, or None if it is on another filesystem."""
+    # depending on the version of universal-pathlib, local paths are either plain pathlib paths or
+    # UPaths that are backed by the fsspec local filesystem
+    if not isinstance(path, UPath):
+        return str(path)
+    protocols = path.fs.protocol
+    if isinstance(protocols, str):
+        protocols = (protocols,)
+    if {"file", "local"}.intersection(protocols):
+        return path.path
+    return None
+
+
+class PyArrowParquetIOManager(UPathIOManager):
+    """IOManager that stores PyArrow Tables as Parquet files. Is compatible with local and remote
+    filesystems via `universal-pathlib` and `fsspec`.
+
+    Local files are read with memory mapping, so loading an input doesn't copy the file contents
+    into the Python heap. Inputs that span multiple partitions are loaded concurrently. If the
+    input is annotated as a ``pyarrow.Table``, the partitions are concatenated into a single table;
+    otherwise a dictionary mapping partition keys to tables is returned.
+
+    The ``columns`` input metadata value can be set to a list of column names to only read those
+    columns.
+
+    Args:
+        base_path (UPath): base directory where the Parquet files will be stored.
+        max_workers (int): maximum number of partitions of a multi-partition input that are
+            loaded concurrently. Defaults to 8.
+        memory_map (bool): whether to memory map local files when reading. Defaults to True.
+    """
+
+    extension: str = ".parquet"
+
+    def __init__(
+        self,
+        base_path: UPath,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        memory_map: bool = True,
+    ):
+        self._memory_map = check.bool_param(memory_map, "memory_map")
+        super().__init__(base_path=base_path, max_workers=max_workers)
+
+    def _get_columns(self, context: InputContext) -> Optional[Sequence[str]]:
+        columns = context.metadata.get("columns") if context.metadata is not None else None
+        return check.opt_sequence_param(columns, "columns", of_type=str) or None
+
+    def dump_to_path(self, context: OutputContext, obj: pa.Table, path: UPath):
+        check.inst_param(obj, "obj", pa.Table)
+        local_path = _get_local_path(path)
+        if local_path is not None:
+            pq.write_table(obj, local_path)
+        else:
+            with path.open("wb") as file:
+                pq.write_table(obj, file)
+
+    def load_from_path(self, context: InputContext, path: UPath) -> pa.Table:
+        columns = self._get_columns(context)
+        local_path = _get_local_path(path)
+        if local_path is not None:
+            return pq.read_table(local_path, columns=columns, memory_map=self._memory_map)
+        else:
+            with path.open("rb") as file:
+                return pq.read_table(file, columns=columns)
+
+    def get_metadata(self, context: OutputContext, obj: pa.Table) -> Dict[str, MetadataValue]:
+        return {
+            "row_count": MetadataValue.int(obj.num_rows),
+            "num_bytes": MetadataValue.int(obj.nbytes),
+        }
+
+    def load_input(self, context: InputContext) -> Union[pa.Table, Dict[str, pa.Table], None]:
+        if (
+            context.has_asset_key
+            and context.has_asset_partitions
+            and len(context.asset_partition_keys) > 1
+            and context.dagster_type.typing_type == pa.Table
+        ):
+            tables = list(self._load_multiple_inputs(context).values())
+            if not tables:
+                return pa.table({})
+            return pa.concat_tables(tables)
+
+        return super().load_input(context)
+
+
+@io_manager(
+    config_schema={
+        "base_path": Field(StringSource, is_required=False),
+        "max_workers": Field(
+            int,
+            default_value=DEFAULT_MAX_WORKERS,
+            description=(
+                "Maximum number of partitions of a multi-partition input that are loaded"
+                " concurrently."
+            ),
+        ),
+        "memory_map": Field(
+            bool,
+            default_value=True,
+            description="Whether to memory map local Parquet files when reading them.",
+        ),
+    },
+    description="IO manager that stores PyArrow Tables as Parquet files.",
+)
+def pyarrow_parquet_io_manager(init_context: InitResourceContext) -> PyArrowParquetIOManager:
+    """IO manager that stores PyArrow Tables as Parquet files.
+
+    The base path is determined by the IO manager's "base_path" configuration value if specified,
+    otherwise by the instance's storage directory.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import pyarrow as pa
+        from dagster import AssetIn, DailyPartitionsDefinition, Definitions, asset
+        from dagster_pyarrow import pyarrow_parquet_io_manager
+
+        daily = DailyPartitionsDefinition(start_date="2023-01-01")
+
+        @asset(partitions_def=daily)
+        def events() -> pa.Table:
+            ...
+
+        @asset(ins={"events": AssetIn(metadata={"columns": ["user_id", "ts"]})})
+        def all_events(events: pa.Table) -> pa.Table:
+            # all partitions of `events`, concatenated, with only two columns read
+            ...
+
+        defs = Definitions(
+            assets=[events, all_events],
+            resources={"io_manager": pyarrow_parquet_io_manager},
+        )
+    """
+    base_path = UPath(
+        init_context.resource_config.get(
+            "base_path", init_context.instance.storage_directory()  # type: ignore
+        )
+    )
+    return PyArrowParquetIOManager(
+        base_path=base_path,
+        max_workers=init_context.resource_config["max_workers"],
+        memory_map=init_context.resource_config["memory_map"],
+    )
@@ -0,0 +1,185 @@
+from pathlib import Path
+from typing import Dict
+
+import pyarrow as pa
+import pytest
+from dagster import (
+    AssetIn,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster_pyarrow import PyArrowParquetIOManager, pyarrow_parquet_io_manager
+from dagster_pyarrow.io_manager import _get_local_path
+from upath import UPath
+
+partitions_def = StaticPartitionsDefinition(["2022-01-01", "2022-01-02", "2022-01-03"])
+
+
+@asset(partitions_def=partitions_def)
+def upstream(context) -> pa.Table:
+    return pa.table(
+        {
+            "date": [context.partition_key] * 2,
+            "a": [1, 2],
+            "b": ["x", "y"],
+        }
+    )
+
+
+def _materialize_upstream(tmp_path: Path):
+    io_manager_def = pyarrow_parquet_io_manager.configured({"base_path": str(tmp_path)})
+    for partition_key in partitions_def.get_partition_keys():
+        result = materialize(
+            [upstream],
+            partition_key=partition_key,
+            resources={"io_manager": io_manager_def},
+        )
+        assert result.success
+    return io_manager_def
+
+
+def test_pyarrow_parquet_io_manager_roundtrip(tmp_path: Path):
+    @asset
+    def table() -> pa.Table:
+        return pa.table({"a": [1, 2, 3]})
+
+    @asset
+    def downstream(table: pa.Table) -> pa.Table:
+        assert table.num_rows == 3
+        return table
+
+    result = materialize(
+        [table, downstream],
+        resources={
+            "io_manager": pyarrow_parquet_io_manager.configured({"base_path": str(tmp_path)})
+        },
+    )
+    assert result.success
+    assert (tmp_path / "table.parquet").exists()
+
+    materialization = result.asset_materializations_for_node("table")[0]
+    assert materialization.metadata["row_count"].value == 3
+
+
+def test_pyarrow_parquet_io_manager_partition_range_as_table(tmp_path: Path):
+    io_manager_def = _materialize_upstream(tmp_path)
+
+    @asset
+    def downstream(upstream: pa.Table) -> None:
+        assert upstream.num_rows == 6
+        assert sorted(upstream.column("date").to_pylist()) == [
+            "2022-01-01",
+            "2022-01-01",
+            "2022-01-02",
+            "2022-01-02",
+            "2022-01-03",
+            "2022-01-03",
+        ]
+
+    result = materialize(
+        [upstream.to_source_asset(), downstream], resources={"io_manager": io_manager_def}
+    )
+    assert result.success
+
+
+def test_pyarrow_parquet_io_manager_partition_range_as_dict(tmp_path: Path):
+    io_manager_def = _materialize_upstream(tmp_path)
+
+    @asset
+    def downstream(upstream: Dict[str, pa.Table]) -> None:
+        assert set(upstream.keys()) == set(partitions_def.get_partition_keys())
+        assert all(table.num_rows == 2 for table in upstream.values())
+
+    result = materialize(
+        [upstream.to_source_asset(), downstream], resources={"io_manager": io_manager_def}
+    )
+    assert result.success
+
+
+def test_pyarrow_parquet_io_manager_column_projection(tmp_path: Path):
+    io_manager_def = _materialize_upstream(tmp_path)
+
+    @asset(ins={"upstream": AssetIn(metadata={"columns": ["a"]})})
+    def downstream(upstream: pa.Table) -> None:
+        assert upstream.column_names == ["a"]
+        assert upstream.num_rows == 6
+
+    result = materialize(
+        [upstream.to_source_asset(), downstream], resources={"io_manager": io_manager_def}
+    )
+    assert result.success
+
+
+def test_pyarrow_parquet_io_manager_allow_missing_partitions(tmp_path: Path):
+    io_manager_def = pyarrow_parquet_io_manager.configured(
+        {"base_path": str(tmp_path), "max_workers": 2}
+    )
+    result = materialize(
+        [upstream], partition_key="2022-01-02", resources={"io_manager": io_manager_def}
+    )
+    assert result.success
+
+    @asset(ins={"upstream": AssetIn(metadata={"allow_missing_partitions": True})})
+    def downstream(upstream: pa.Table) -> None:
+        assert upstream.column("date").to_pylist() == ["2022-01-02", "2022-01-02"]
+
+    result = materialize(
+        [upstream.to_source_asset(), downstream], resources={"io_manager": io_manager_def}
+    )
+    assert result.success
+
+    @asset(name="downstream")
+    def strict_downstream(upstream: pa.Table) -> None:
+        pass
+
+    with pytest.raises(FileNotFoundError):
+        materialize(
+            [upstream.to_source_asset(), strict_downstream],
+            resources={"io_manager": io_manager_def},
+        )
+
+
+def test_pyarrow_parquet_io_manager_static_partitions_without_memory_map(tmp_path: Path):
+    static = StaticPartitionsDefinition(["a", "b"])
+
+    @asset(partitions_def=static)
+    def static_upstream(context) -> pa.Table:
+        return pa.table({"key": [context.partition_key]})
+
+    io_manager = PyArrowParquetIOManager(base_path=UPath(tmp_path), memory_map=False)
+    for partition_key in static.get_partition_keys():
+        assert materialize(
+            [static_upstream], partition_key=partition_key, resources={"io_manager": io_manager}
+        ).success
+
+    assert (tmp_path / "static_upstream" / "a.parquet").exists()
+
+    @asset
+    def downstream(static_upstream: pa.Table) -> None:
+        assert sorted(static_upstream.column("key").to_pylist()) == ["a", "b"]
+
+    assert materialize(
+        [static_upstream.to_source_asset(), downstream], resources={"io_manager": io_manager}
+    ).success
+
+
+def test_get_local_path(tmp_path: Path):
+    assert _get_local_path(UPath(tmp_path)) == str(tmp_path)
+    # local paths can also be UPaths that are backed by the fsspec local filesystem
+    assert _get_local_path(UPath(f"file://{tmp_path}")) == str(tmp_path)
+    assert _get_local_path(UPath("memory://bucket/table.parquet")) is None
+
+
+def test_pyarrow_parquet_io_manager_file_protocol(tmp_path: Path):
+    @asset
+    def table() -> pa.Table:
+        return pa.table({"a": [1, 2, 3]})
+
+    @asset
+    def downstream(table: pa.Table) -> None:
+        assert table.num_rows == 3
+
+    io_manager = PyArrowParquetIOManager(base_path=UPath(f"file://{tmp_path}"))
+    assert materialize([table, downstream], resources={"io_manager": io_manager}).success
+    assert (tmp_path / "table.parquet").exists()
@@ -28,6 +28,20 @@ def test_get_select_statement_columns():
     )
 
 
+def test_get_select_statement_filter():
+    assert (
+        SnowflakeDbClient.get_select_statement(
+            TableSlice(
+                database="database_abc",
+                schema="schema1",
+                table="table1",
+                filter="apple > 1",
+            )
+        )
+        == "SELECT * FROM database_abc.schema1.table1 WHERE\n(apple > 1)"
+    )
+
+
 def test_get_select_statement_time_partitioned():
     assert (
         SnowflakeDbClient.get_select_statement(
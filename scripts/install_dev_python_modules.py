@@ -71,6 +71,7 @@ def main(
         "-e python_modules/libraries/dagster-papertrail",
         "-e python_modules/libraries/dagster-postgres",
         "-e python_modules/libraries/dagster-prometheus",
+        "-e python_modules/libraries/dagster-pyarrow",
         "-e python_modules/libraries/dagster-pyspark",
         "-e python_modules/libraries/dagster-shell",
         "-e python_modules/libraries/dagster-slack",